@@ -5,6 +5,6 @@ from .models import Bank
 
 @admin.register(Bank)
 class BankAdmin(admin.ModelAdmin):
-    list_display = ('id', 'name', 'bank_type')
+    list_display = ('id', 'name', 'bank_type', 'clients_count', 'credits_count', 'total_max_payment')
     list_filter = ('bank_type',)
     search_fields = ('name',)
@@ -7,11 +7,24 @@ class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
     pass
 
 
+class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
+    pass
+
+
 class BankFilter(django_filters.FilterSet):
+    ids = NumberInFilter(field_name='id', lookup_expr='in')
     name = django_filters.CharFilter(field_name='name', lookup_expr='icontains')
     address = django_filters.CharFilter(field_name='address', lookup_expr='icontains')
     bank_type = CharInFilter(field_name='bank_type', lookup_expr='in')
+    updated_since = django_filters.IsoDateTimeFilter(field_name='updated_at', lookup_expr='gte')
+    # <field>_min / <field>_max
+    clients_count = django_filters.RangeFilter()
+    credits_count = django_filters.RangeFilter()
+    total_max_payment = django_filters.RangeFilter()
 
     class Meta:
         model = Bank
-        fields = ('name', 'address', 'bank_type')
+        fields = (
+            'ids', 'name', 'address', 'bank_type', 'updated_since',
+            'clients_count', 'credits_count', 'total_max_payment',
+        )
@@ -13,4 +13,7 @@ class BankSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Bank
-        fields = ('id', 'name', 'bank_type', 'address')
+        fields = (
+            'id', 'name', 'bank_type', 'address', 'updated_at',
+            'clients_count', 'credits_count', 'total_max_payment',
+        )
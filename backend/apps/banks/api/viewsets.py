@@ -2,6 +2,7 @@ from rest_framework import viewsets
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema, extend_schema_view
 
 from apps.banks.models import Bank
+from config.mixins import AutocompleteMixin, BatchFetchMixin, Facet, FacetsMixin, ReplicaReadMixin
 from .serializers import BankSerializer
 from .filters import BankFilter
 
@@ -11,10 +12,14 @@ from .filters import BankFilter
         parameters=[
             OpenApiParameter('page', OpenApiTypes.INT, description='Page number.'),
             OpenApiParameter('page_size', OpenApiTypes.INT, description='Number of results per page.'),
+            OpenApiParameter('ids', OpenApiTypes.STR, description='Comma-separated list of bank IDs.'),
             OpenApiParameter(
                 'ordering',
                 OpenApiTypes.STR,
-                description='Ordering field (prefix with "-" for descending). Supported: id, name.',
+                description=(
+                    'Ordering field (prefix with "-" for descending). '
+                    'Supported: id, name, clients_count, credits_count, total_max_payment.'
+                ),
             ),
             OpenApiParameter(
                 'name',
@@ -31,12 +36,50 @@ from .filters import BankFilter
                 OpenApiTypes.STR,
                 description='Comma-separated list of bank types (PRIVATE,GOVERNMENT).',
             ),
+            OpenApiParameter(
+                'clients_count_min',
+                OpenApiTypes.NUMBER,
+                description='Only banks with a client count of at least this value.',
+            ),
+            OpenApiParameter(
+                'clients_count_max',
+                OpenApiTypes.NUMBER,
+                description='Only banks with a client count of at most this value.',
+            ),
+            OpenApiParameter(
+                'credits_count_min',
+                OpenApiTypes.NUMBER,
+                description='Only banks with a credit count of at least this value.',
+            ),
+            OpenApiParameter(
+                'credits_count_max',
+                OpenApiTypes.NUMBER,
+                description='Only banks with a credit count of at most this value.',
+            ),
+            OpenApiParameter(
+                'total_max_payment_min',
+                OpenApiTypes.NUMBER,
+                description='Only banks with a total max payment of at least this value.',
+            ),
+            OpenApiParameter(
+                'total_max_payment_max',
+                OpenApiTypes.NUMBER,
+                description='Only banks with a total max payment of at most this value.',
+            ),
+            OpenApiParameter(
+                'updated_since',
+                OpenApiTypes.DATETIME,
+                description='Only banks modified at or after this ISO 8601 timestamp.',
+            ),
         ]
     )
 )
-class BankViewSet(viewsets.ModelViewSet):
+class BankViewSet(ReplicaReadMixin, FacetsMixin, BatchFetchMixin, AutocompleteMixin, viewsets.ModelViewSet):
     queryset = Bank.objects.all().order_by('id')
     serializer_class = BankSerializer
     search_fields = ('name',)
     filterset_class = BankFilter
-    ordering_fields = ('id', 'name')
+    ordering_fields = ('id', 'name', 'clients_count', 'credits_count', 'total_max_payment')
+    facet_fields = (Facet('bank_type', 'bank_type'),)
+    autocomplete_field = 'name'
+    autocomplete_values = ('id', 'name')
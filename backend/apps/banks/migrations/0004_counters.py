@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banks', '0003_bank_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bank',
+            name='clients_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='bank',
+            name='credits_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='bank',
+            name='total_max_payment',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=18),
+        ),
+    ]
@@ -0,0 +1,35 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrentlyOnPostgres
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction; it does not block
+    # writes to the table while the index builds.
+    atomic = False
+
+    dependencies = [
+        ('banks', '0004_counters'),
+    ]
+
+    operations = [
+        # Also used by clients.0004_client_autocomplete_indexes.
+        TrigramExtension(),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='bank',
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'),
+                name='bank_name_prefix_idx',
+            ),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='bank',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'),
+                name='bank_name_trgm_idx',
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class Bank(models.Model):
@@ -9,6 +11,22 @@ class Bank(models.Model):
     name = models.CharField(max_length=255, unique=True)
     bank_type = models.CharField(max_length=32, choices=BankType.choices)
     address = models.CharField(max_length=255, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by apps.clients and apps.credits.counters; repair with manage.py repair_counters.
+    # Signed, so a drifted counter cannot make the next decrement fail.
+    clients_count = models.IntegerField(default=0, editable=False)
+    credits_count = models.IntegerField(default=0, editable=False)
+    total_max_payment = models.DecimalField(max_digits=18, decimal_places=2, default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            # Incremental sync walks rows in (updated_at, id) order.
+            models.Index(fields=['updated_at', 'id'], name='bank_updated_at_id_idx'),
+            # Autocomplete (PostgreSQL only): UPPER() matches the SQL of
+            # name__istartswith / __icontains.
+            models.Index(OpClass(Upper('name'), name='text_pattern_ops'), name='bank_name_prefix_idx'),
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='bank_name_trgm_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.name
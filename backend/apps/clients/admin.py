@@ -5,6 +5,6 @@ from .models import Client
 
 @admin.register(Client)
 class ClientAdmin(admin.ModelAdmin):
-    list_display = ('id', 'full_name', 'email', 'person_type', 'bank')
+    list_display = ('id', 'full_name', 'email', 'person_type', 'bank', 'credits_count', 'total_max_payment')
     list_filter = ('person_type', 'bank')
     search_fields = ('full_name', 'email')
@@ -12,12 +12,20 @@ class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
 
 
 class ClientFilter(django_filters.FilterSet):
+    ids = NumberInFilter(field_name='id', lookup_expr='in')
     full_name = django_filters.CharFilter(field_name='full_name', lookup_expr='icontains')
     email = django_filters.CharFilter(field_name='email', lookup_expr='icontains')
     bank_name = django_filters.CharFilter(field_name='bank__name', lookup_expr='icontains')
     person_type = CharInFilter(field_name='person_type', lookup_expr='in')
     bank = NumberInFilter(field_name='bank_id', lookup_expr='in')
+    updated_since = django_filters.IsoDateTimeFilter(field_name='updated_at', lookup_expr='gte')
+    # <field>_min / <field>_max
+    credits_count = django_filters.RangeFilter()
+    total_max_payment = django_filters.RangeFilter()
 
     class Meta:
         model = Client
-        fields = ('full_name', 'email', 'bank_name', 'person_type', 'bank')
+        fields = (
+            'ids', 'full_name', 'email', 'bank_name', 'person_type', 'bank', 'updated_since',
+            'credits_count', 'total_max_payment',
+        )
@@ -10,7 +10,8 @@ class ClientSerializer(serializers.ModelSerializer):
         model = Client
         fields = (
             'id', 'full_name', 'date_of_birth', 'age', 'nationality', 'address',
-            'email', 'phone', 'person_type', 'bank', 'bank_name'
+            'email', 'phone', 'person_type', 'bank', 'bank_name', 'updated_at',
+            'credits_count', 'total_max_payment',
         )
 
     def validate(self, attrs):
@@ -1,7 +1,15 @@
+from collections import defaultdict
+
+from django.db.models import Count
 from rest_framework import viewsets
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema, extend_schema_view
 
-from apps.clients.models import Client
+from apps.clients.models import Client, adjust_clients_count
+from apps.credits.bulk import delete_clients
+from apps.credits.counters import credit_totals, move_counters
+from apps.credits.models import Credit
+from apps.sync.changes import publish_upserts
+from config.mixins import AutocompleteMixin, BatchFetchMixin, BulkMixin, Facet, FacetsMixin, ReplicaReadMixin
 from .serializers import ClientSerializer
 from .filters import ClientFilter
 
@@ -11,10 +19,14 @@ from .filters import ClientFilter
         parameters=[
             OpenApiParameter('page', OpenApiTypes.INT, description='Page number.'),
             OpenApiParameter('page_size', OpenApiTypes.INT, description='Number of results per page.'),
+            OpenApiParameter('ids', OpenApiTypes.STR, description='Comma-separated list of client IDs.'),
             OpenApiParameter(
                 'ordering',
                 OpenApiTypes.STR,
-                description='Ordering field (prefix with "-" for descending). Supported: id, full_name.',
+                description=(
+                    'Ordering field (prefix with "-" for descending). '
+                    'Supported: id, full_name, credits_count, total_max_payment.'
+                ),
             ),
             OpenApiParameter(
                 'full_name',
@@ -41,12 +53,78 @@ from .filters import ClientFilter
                 OpenApiTypes.STR,
                 description='Comma-separated list of bank IDs.',
             ),
+            OpenApiParameter(
+                'credits_count_min',
+                OpenApiTypes.NUMBER,
+                description='Only clients with a credit count of at least this value.',
+            ),
+            OpenApiParameter(
+                'credits_count_max',
+                OpenApiTypes.NUMBER,
+                description='Only clients with a credit count of at most this value.',
+            ),
+            OpenApiParameter(
+                'total_max_payment_min',
+                OpenApiTypes.NUMBER,
+                description='Only clients with a total max payment of at least this value.',
+            ),
+            OpenApiParameter(
+                'total_max_payment_max',
+                OpenApiTypes.NUMBER,
+                description='Only clients with a total max payment of at most this value.',
+            ),
+            OpenApiParameter(
+                'updated_since',
+                OpenApiTypes.DATETIME,
+                description='Only clients modified at or after this ISO 8601 timestamp.',
+            ),
         ]
     )
 )
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(
+    ReplicaReadMixin, FacetsMixin, BatchFetchMixin, AutocompleteMixin, BulkMixin, viewsets.ModelViewSet,
+):
     queryset = Client.objects.select_related('bank').all().order_by('id')
     serializer_class = ClientSerializer
     search_fields = ('full_name', 'email')
     filterset_class = ClientFilter
-    ordering_fields = ('id', 'full_name')
+    ordering_fields = ('id', 'full_name', 'credits_count', 'total_max_payment')
+    facet_fields = (
+        Facet('person_type', 'person_type'),
+        Facet('bank', 'bank_id', label_field='bank__name'),
+    )
+    autocomplete_field = 'full_name'
+    autocomplete_values = ('id', 'full_name', 'bank_id')
+    bulk_update_fields = ('bank', 'person_type', 'nationality', 'address')
+
+    def perform_bulk_update(self, queryset, changes, now, using):
+        if 'bank' not in changes:
+            return super().perform_bulk_update(queryset, changes, now, using)
+        bank = changes['bank']
+        clients_before = list(queryset.order_by().values('bank_id').annotate(count=Count('pk')))
+        updated = super().perform_bulk_update(queryset, changes, now, using)
+        if bank is not None:
+            self._move_credits(queryset, bank, now, using)
+
+        clients_count = defaultdict(int)
+        for row in clients_before:
+            clients_count[row['bank_id']] -= row['count']
+            clients_count[bank and bank.pk] += row['count']
+        for bank_id, delta in clients_count.items():
+            if delta:
+                adjust_clients_count(bank_id, delta, using)
+        return updated
+
+    def _move_credits(self, clients, bank, now, using) -> None:
+        # A credit's bank must match its client's bank (see CreditSerializer),
+        # so the clients' credits follow them: one UPDATE per chunk.
+        credits = Credit.objects.using(using).filter(client__in=clients).exclude(bank=bank)
+        credit_ids = list(credits.values_list('pk', flat=True))
+        before = credit_totals(credits)
+        credits.update(bank=bank, updated_at=now)
+        move_counters(before, [{**row, 'bank_id': bank.pk} for row in before], using)
+        publish_upserts(Credit, credit_ids, now, using)
+
+    def perform_bulk_delete(self, queryset, using):
+        # The per-row cascade would load and handle every credit one by one.
+        return delete_clients(list(queryset.values_list('pk', flat=True)), using)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:07
+
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrentlyWhereSupported
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction; it does not block
+    # writes to the table while the index builds.
+    atomic = False
+
+    dependencies = [
+        ('clients', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        AddIndexConcurrentlyWhereSupported(
+            model_name='client',
+            index=models.Index(fields=['updated_at', 'id'], name='client_updated_at_id_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:27
+
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrentlyWhereSupported
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction; it does not block
+    # writes to the table while the index builds.
+    atomic = False
+
+    dependencies = [
+        ('banks', '0004_counters'),
+        ('clients', '0002_client_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='credits_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='total_max_payment',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=18),
+        ),
+        AddIndexConcurrentlyWhereSupported(
+            model_name='client',
+            index=models.Index(fields=['credits_count'], name='client_credits_count_idx'),
+        ),
+        AddIndexConcurrentlyWhereSupported(
+            model_name='client',
+            index=models.Index(fields=['total_max_payment'], name='client_total_max_payment_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrentlyOnPostgres
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction; it does not block
+    # writes to the table while the index builds.
+    atomic = False
+
+    dependencies = [
+        ('banks', '0005_bank_autocomplete_indexes'),
+        ('clients', '0003_counters'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyOnPostgres(
+            model_name='client',
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='text_pattern_ops'),
+                name='client_full_name_prefix_idx',
+            ),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='client',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'),
+                name='client_full_name_trgm_idx',
+            ),
+        ),
+    ]
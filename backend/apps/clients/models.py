@@ -1,7 +1,11 @@
 from datetime import date
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F
+from django.db.models.functions import Upper
+from django.utils import timezone
 
 from apps.banks.models import Bank
 
@@ -25,12 +29,52 @@ class Client(models.Model):
     phone = models.CharField(max_length=50, blank=True)
     person_type = models.CharField(max_length=32, choices=PersonType.choices, default=PersonType.NATURAL)
     bank = models.ForeignKey(Bank, on_delete=models.SET_NULL, null=True, blank=True, related_name='clients')
+    updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by apps.credits.counters; repair with manage.py repair_counters.
+    # Signed, so a drifted counter cannot make the next decrement fail.
+    credits_count = models.IntegerField(default=0, editable=False)
+    total_max_payment = models.DecimalField(max_digits=18, decimal_places=2, default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='client_updated_at_id_idx'),
+            models.Index(fields=['credits_count'], name='client_credits_count_idx'),
+            models.Index(fields=['total_max_payment'], name='client_total_max_payment_idx'),
+            # Autocomplete (PostgreSQL only): UPPER() matches the SQL of
+            # full_name__istartswith / __icontains.
+            models.Index(OpClass(Upper('full_name'), name='text_pattern_ops'), name='client_full_name_prefix_idx'),
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='client_full_name_trgm_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.full_name
 
+    def save(self, *args, **kwargs):
+        # Keep Bank.clients_count in step with creates and reassignments in the
+        # same transaction; deletes are handled in apps.clients.signals.
+        using = kwargs.get('using') or router.db_for_write(Client, instance=self)
+        with transaction.atomic(using=using):
+            before = None
+            if not self._state.adding:
+                before = Client.objects.using(using).select_for_update().filter(pk=self.pk).values('bank_id').first()
+            super().save(*args, **kwargs)
+            previous_bank_id = before['bank_id'] if before else None
+            if previous_bank_id != self.bank_id:
+                adjust_clients_count(previous_bank_id, -1, using)
+                adjust_clients_count(self.bank_id, 1, using)
+
     @staticmethod
     def calculate_age(dob: date) -> int:
         today = date.today()
         years = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
         return years
+
+
+def adjust_clients_count(bank_id: int | None, delta: int, using: str) -> None:
+    # apps.sync imports the models.
+    from apps.sync.changes import publish_upserts
+
+    if bank_id is not None:
+        now = timezone.now()
+        Bank.objects.using(using).filter(pk=bank_id).update(clients_count=F('clients_count') + delta, updated_at=now)
+        publish_upserts(Bank, [bank_id], now, using)
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Client, adjust_clients_count
+
+
+@receiver(post_delete, sender=Client)
+def release_bank_client_count(sender, instance, using, **kwargs):
+    # Runs inside the deletion's transaction.
+    adjust_clients_count(instance.bank_id, -1, using)
@@ -0,0 +1,41 @@
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+
+class Command(BaseCommand):
+    help = (
+        'Prepare the database for serving in a single process: apply pending '
+        'migrations (if any), keep credit partitions ahead and ensure the default admin user.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skip-superuser', action='store_true', help='Do not create the default admin.')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        if plan:
+            self.stdout.write(f'Applying {len(plan)} pending migration(s)...')
+            call_command('migrate', interactive=False, verbosity=options['verbosity'])
+        else:
+            self.stdout.write('Database schema is up to date.')
+
+        # Keep future monthly credit partitions in place once the table is partitioned.
+        from apps.credits import partitioning
+
+        if partitioning.is_partitioned():
+            created = partitioning.ensure_partitions(settings.CREDIT_PARTITION_MONTHS_AHEAD)
+            if created:
+                self.stdout.write(f"Created credit partitions: {', '.join(created)}")
+
+        if not options['skip_superuser']:
+            call_command('ensure_superuser', stdout=self.stdout)
+
+        self.stdout.write(f'Bootstrap finished in {time.perf_counter() - started:.2f}s')
@@ -0,0 +1,27 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Create the default admin user if it does not exist (idempotent).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default=os.getenv('DJANGO_SUPERUSER_USERNAME', 'admin'))
+        parser.add_argument('--email', default=os.getenv('DJANGO_SUPERUSER_EMAIL', 'admin@example.com'))
+        parser.add_argument('--password', default=os.getenv('DJANGO_SUPERUSER_PASSWORD', 'admin12345'))
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        user, created = User.objects.get_or_create(
+            username=options['username'],
+            defaults={'email': options['email'], 'is_superuser': True, 'is_staff': True},
+        )
+        if created:
+            # Existing users keep their password; it may have been changed since.
+            user.set_password(options['password'])
+            user.save(update_fields=['password'])
+            self.stdout.write(f"Default admin created: {user.username}")
+        else:
+            self.stdout.write(f"Default admin ready: {user.username}")
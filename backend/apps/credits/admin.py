@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Credit
+from .models import ArchivedCredit, Credit
 
 
 @admin.register(Credit)
@@ -8,3 +8,10 @@ class CreditAdmin(admin.ModelAdmin):
     list_display = ('id', 'client', 'bank', 'credit_type', 'min_payment', 'max_payment', 'term_months', 'created_at')
     list_filter = ('credit_type', 'bank')
     search_fields = ('description', 'client__full_name')
+
+
+@admin.register(ArchivedCredit)
+class ArchivedCreditAdmin(admin.ModelAdmin):
+    list_display = ('id', 'client', 'bank', 'credit_type', 'created_at', 'archived_at')
+    list_filter = ('credit_type', 'bank')
+    search_fields = ('description', 'client__full_name')
@@ -14,6 +14,7 @@ class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
 
 
 class CreditFilter(django_filters.FilterSet):
+    ids = NumberInFilter(field_name='id', lookup_expr='in')
     description = django_filters.CharFilter(field_name='description', lookup_expr='icontains')
     bank_name = django_filters.CharFilter(field_name='bank__name', lookup_expr='icontains')
     client_full_name = django_filters.CharFilter(field_name='client__full_name', lookup_expr='icontains')
@@ -22,10 +23,14 @@ class CreditFilter(django_filters.FilterSet):
     min_payment = django_filters.CharFilter(method='filter_decimal_contains')
     max_payment = django_filters.CharFilter(method='filter_decimal_contains')
     term_months = django_filters.CharFilter(method='filter_integer_contains')
+    updated_since = django_filters.IsoDateTimeFilter(field_name='updated_at', lookup_expr='gte')
+    # created_at_after / created_at_before; lets PostgreSQL prune partitions.
+    created_at = django_filters.IsoDateTimeFromToRangeFilter(field_name='created_at')
 
     class Meta:
         model = Credit
         fields = (
+            'ids',
             'description',
             'bank_name',
             'client_full_name',
@@ -34,6 +39,8 @@ class CreditFilter(django_filters.FilterSet):
             'min_payment',
             'max_payment',
             'term_months',
+            'updated_since',
+            'created_at',
         )
 
     def filter_decimal_contains(self, queryset, name, value):
@@ -1,3 +1,4 @@
+from drf_spectacular.utils import OpenApiTypes, extend_schema_field
 from rest_framework import serializers
 
 from apps.credits.models import Credit
@@ -6,15 +7,21 @@ from apps.credits.models import Credit
 class CreditSerializer(serializers.ModelSerializer):
     client_full_name = serializers.CharField(source='client.full_name', read_only=True)
     bank_name = serializers.CharField(source='bank.name', read_only=True)
+    is_archived = serializers.SerializerMethodField()
 
     class Meta:
         model = Credit
         fields = (
             'id', 'client', 'client_full_name', 'description',
             'min_payment', 'max_payment', 'term_months', 'created_at',
-            'bank', 'bank_name', 'credit_type'
+            'bank', 'bank_name', 'credit_type', 'updated_at', 'is_archived'
         )
-        read_only_fields = ('created_at',)
+        read_only_fields = ('created_at', 'updated_at')
+
+    @extend_schema_field(OpenApiTypes.BOOL)
+    def get_is_archived(self, obj) -> bool:
+        # Only set on rows read with ?include_archived=true.
+        return getattr(obj, 'is_archived', False)
 
     def validate(self, attrs):
         min_p = attrs.get('min_payment') if 'min_payment' in attrs else getattr(self.instance, 'min_payment', None)
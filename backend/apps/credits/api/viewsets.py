@@ -1,18 +1,35 @@
 from django.core.mail import send_mail
 from django.conf import settings
-from rest_framework import viewsets
+from django.db.models import Value, prefetch_related_objects
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from rest_framework import serializers, viewsets
+from rest_framework.filters import OrderingFilter, SearchFilter
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema, extend_schema_view
 
-from apps.credits.models import Credit
+from apps.credits.bulk import delete_credits
+from apps.credits.counters import credit_totals, move_counters
+from apps.credits.models import ArchivedCredit, Credit
+from config.mixins import BatchFetchMixin, BulkMixin, Facet, FacetsMixin, ReplicaReadMixin, violation
 from .serializers import CreditSerializer
 from .filters import CreditFilter
 
 
+INCLUDE_ARCHIVED = OpenApiParameter(
+    'include_archived',
+    OpenApiTypes.BOOL,
+    description='Also return credits moved to the archive (read-only; flagged with is_archived).',
+)
+
+
 @extend_schema_view(
+    retrieve=extend_schema(parameters=[INCLUDE_ARCHIVED]),
     list=extend_schema(
         parameters=[
+            INCLUDE_ARCHIVED,
             OpenApiParameter('page', OpenApiTypes.INT, description='Page number.'),
             OpenApiParameter('page_size', OpenApiTypes.INT, description='Number of results per page.'),
+            OpenApiParameter('ids', OpenApiTypes.STR, description='Comma-separated list of credit IDs.'),
             OpenApiParameter(
                 'ordering',
                 OpenApiTypes.STR,
@@ -61,15 +78,122 @@ from .filters import CreditFilter
                 OpenApiTypes.STR,
                 description='Filter credits whose term months contains this value.',
             ),
+            OpenApiParameter(
+                'created_at_after',
+                OpenApiTypes.DATETIME,
+                description='Only credits created at or after this ISO 8601 timestamp.',
+            ),
+            OpenApiParameter(
+                'created_at_before',
+                OpenApiTypes.DATETIME,
+                description='Only credits created before this ISO 8601 timestamp.',
+            ),
+            OpenApiParameter(
+                'updated_since',
+                OpenApiTypes.DATETIME,
+                description='Only credits modified at or after this ISO 8601 timestamp.',
+            ),
         ]
     )
 )
-class CreditViewSet(viewsets.ModelViewSet):
+class CreditViewSet(ReplicaReadMixin, FacetsMixin, BatchFetchMixin, BulkMixin, viewsets.ModelViewSet):
     queryset = Credit.objects.select_related('client', 'bank').all().order_by('-created_at')
     serializer_class = CreditSerializer
     search_fields = ('description', 'client__full_name')
     filterset_class = CreditFilter
     ordering_fields = ('created_at', 'min_payment', 'max_payment', 'term_months', 'id')
+    facet_fields = (
+        Facet('credit_type', 'credit_type'),
+        Facet('bank', 'bank_id', label_field='bank__name'),
+    )
+    bulk_update_fields = ('client', 'bank', 'credit_type', 'min_payment', 'max_payment', 'term_months')
+
+    @property
+    def include_archived(self) -> bool:
+        if self.action not in ('list', 'retrieve'):
+            return False
+        value = self.request.query_params.get('include_archived')
+        if value is None:
+            return False
+        try:
+            return serializers.BooleanField().to_internal_value(value)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({'include_archived': exc.detail}) from exc
+
+    def filter_queryset(self, queryset):
+        if self.action != 'list' or not self.include_archived:
+            return super().filter_queryset(queryset)
+        # Filters and search run on each table; ordering applies to the union.
+        # select_related is dropped because union() needs matching columns;
+        # paginate_queryset() loads client and bank for the page instead.
+        hot = queryset.select_related(None).order_by()
+        for backend in self.filter_backends:
+            if not issubclass(backend, OrderingFilter):
+                hot = backend().filter_queryset(self.request, hot, self)
+        cold = self.filterset_class(
+            data=self.request.query_params, queryset=ArchivedCredit.objects.defer('archived_at'), request=self.request,
+        ).qs
+        cold = SearchFilter().filter_queryset(self.request, cold, self)
+        ordering = OrderingFilter().get_ordering(self.request, queryset, self) or queryset.query.order_by
+        combined = hot.annotate(is_archived=Value(False)).union(cold.annotate(is_archived=Value(True)), all=True)
+        return combined.order_by(*ordering)
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None and self.include_archived:
+            prefetch_related_objects(page, 'client', 'bank')
+        return page
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if not self.include_archived:
+                raise
+        credit = get_object_or_404(ArchivedCredit.objects.select_related('client', 'bank'), pk=self.kwargs['pk'])
+        credit.is_archived = True
+        self.check_object_permissions(self.request, credit)
+        return credit
+
+    def validate_bulk_update(self, queryset, changes):
+        # The serializer already checked pairs given together; these check a
+        # new value against what each selected row keeps.
+        errors = {}
+        if 'min_payment' in changes and 'max_payment' not in changes:
+            errors['min_payment'] = violation(
+                queryset.filter(max_payment__lt=changes['min_payment']), 'have max_payment below this min_payment'
+            )
+        if 'max_payment' in changes and 'min_payment' not in changes:
+            errors['max_payment'] = violation(
+                queryset.filter(min_payment__gt=changes['max_payment']), 'have min_payment above this max_payment'
+            )
+        if 'client' in changes and 'bank' not in changes and changes['client'].bank_id:
+            errors['client'] = violation(
+                queryset.exclude(bank_id=changes['client'].bank_id), "have a bank other than this client's bank"
+            )
+        if 'bank' in changes and 'client' not in changes:
+            errors['bank'] = violation(
+                queryset.filter(client__bank__isnull=False).exclude(client__bank=changes['bank']),
+                'belong to clients of another bank',
+            )
+        errors = {field: [message] for field, message in errors.items() if message}
+        if errors:
+            raise serializers.ValidationError(errors)
+
+    def perform_bulk_update(self, queryset, changes, now, using):
+        if not {'client', 'bank', 'max_payment'} & changes.keys():
+            return super().perform_bulk_update(queryset, changes, now, using)
+        # Counters move by the chunk's per-owner totals before and after.
+        before = credit_totals(queryset)
+        updated = super().perform_bulk_update(queryset, changes, now, using)
+        move_counters(before, credit_totals(queryset), using)
+        return updated
+
+    def perform_bulk_delete(self, queryset, using):
+        # Nothing references a credit, so one DELETE replaces the per-row
+        # collector; tombstones and counters are handled in bulk.
+        deleted = delete_credits('id', list(queryset.values_list('pk', flat=True)), using)
+        return {Credit._meta.label: deleted}
 
     def perform_create(self, serializer):
         credit = serializer.save()
@@ -0,0 +1,65 @@
+"""Moving aged credits between ``Credit`` and ``ArchivedCredit``.
+
+Rows move in batches, each in its own short transaction, so no lock is held
+for longer than one batch. Rows are copied with ``INSERT ... SELECT`` and
+removed with a plain ``DELETE``: archiving is storage tiering, not deletion,
+so timestamps are kept as they were and no tombstones or change events are
+emitted. Client and bank counters only cover hot credits, so each batch
+moves them by its per-owner totals.
+"""
+from collections.abc import Iterator
+from datetime import datetime
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.credits.counters import credit_totals, move_counters
+from apps.credits.models import ArchivedCredit, Credit
+
+# Shared by both tables; ``archived_at`` only exists on the archive.
+COLUMNS = [field.column for field in Credit._meta.concrete_fields]
+
+
+def _move(source, target, ids: list[int], extra: dict | None = None) -> None:
+    qn = connection.ops.quote_name
+    extra = extra or {}
+    placeholders = ', '.join(['%s'] * len(ids))
+    target_columns = ', '.join(qn(column) for column in [*COLUMNS, *extra])
+    source_columns = ', '.join([*(qn(column) for column in COLUMNS), *(['%s'] * len(extra))])
+    source_table, target_table = qn(source._meta.db_table), qn(target._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {target_table} ({target_columns}) '
+            f'SELECT {source_columns} FROM {source_table} WHERE {qn("id")} IN ({placeholders})',
+            [*extra.values(), *ids],
+        )
+        cursor.execute(f'DELETE FROM {source_table} WHERE {qn("id")} IN ({placeholders})', ids)
+
+
+def _batches(queryset: QuerySet, source, target, batch_size: int, extra=None) -> Iterator[int]:
+    while True:
+        with transaction.atomic():
+            # Rows a writer holds are skipped rather than waited for.
+            locked = queryset.select_for_update(skip_locked=True).order_by('id')
+            ids = list(locked.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return
+            totals = credit_totals(source.objects.filter(pk__in=ids))
+            _move(source, target, ids, extra)
+            if source is Credit:
+                move_counters(totals, [], connection.alias)
+            else:
+                move_counters([], totals, connection.alias)
+        yield len(ids)
+
+
+def archive_credits(cutoff: datetime, batch_size: int) -> Iterator[int]:
+    """Move credits created before ``cutoff``; yields the size of each batch."""
+    queryset = Credit.objects.filter(created_at__lt=cutoff)
+    return _batches(queryset, Credit, ArchivedCredit, batch_size, extra={'archived_at': timezone.now()})
+
+
+def restore_credits(queryset: QuerySet, batch_size: int) -> Iterator[int]:
+    """Move the ``ArchivedCredit`` rows in ``queryset`` back to the hot table."""
+    return _batches(queryset, ArchivedCredit, Credit, batch_size)
@@ -0,0 +1,69 @@
+"""Set-based client and credit deletes for the bulk endpoints.
+
+Clients and credits have ``post_delete`` receivers, so ``QuerySet.delete()``
+(including a client's cascade to its credits) loads every row and runs
+counter updates, a tombstone insert and a notification per row. These
+helpers do the same work with one ``DELETE ... RETURNING`` per chunk plus a
+handful of set-based statements.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import connections
+
+from apps.banks.models import Bank
+from apps.clients.models import Client, adjust_clients_count
+from apps.credits.counters import move_counters
+from apps.credits.models import ArchivedCredit, Credit
+from apps.sync.changes import record_deletes
+
+
+def _delete_returning(model, column: str, values: list, using: str, returning: tuple) -> list[tuple]:
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {qn(model._meta.db_table)} WHERE {qn(column)} IN ({', '.join(['%s'] * len(values))}) "
+            f"RETURNING {', '.join(qn(name) for name in returning)}",
+            values,
+        )
+        return cursor.fetchall()
+
+
+def delete_credits(column: str, values: list, using: str, owners: tuple = (Client, Bank)) -> int:
+    """Delete the credits whose ``column`` is in ``values``; returns how many.
+
+    Tombstones are recorded and the ``owners``' counters move by the deleted
+    totals. Pass ``owners=(Bank,)`` when the clients are deleted next anyway.
+    """
+    if not values:
+        return 0
+    rows = _delete_returning(Credit, column, values, using, ('id', 'client_id', 'bank_id', 'max_payment'))
+    totals = defaultdict(lambda: {'count': 0, 'total': Decimal(0)})
+    for _pk, client_id, bank_id, max_payment in rows:
+        totals[client_id, bank_id]['count'] += 1
+        totals[client_id, bank_id]['total'] += Decimal(str(max_payment))
+    record_deletes(Credit, [row[0] for row in rows], using)
+    move_counters(
+        [{'client_id': client_id, 'bank_id': bank_id, **row} for (client_id, bank_id), row in totals.items()],
+        [], using, owners,
+    )
+    return len(rows)
+
+
+def delete_clients(ids: list, using: str) -> dict:
+    """Delete clients with their hot and archived credits; returns deleted row counts per model label."""
+    if not ids:
+        return {}
+    deleted = {Credit._meta.label: delete_credits('client_id', ids, using, owners=(Bank,))}
+    # Archived credits have no receivers, so this is already a single DELETE.
+    deleted.update(ArchivedCredit.objects.using(using).filter(client_id__in=ids).delete()[1])
+    rows = _delete_returning(Client, 'id', ids, using, ('id', 'bank_id'))
+    clients_count = defaultdict(int)
+    for _pk, bank_id in rows:
+        clients_count[bank_id] -= 1
+    for bank_id, delta in clients_count.items():
+        adjust_clients_count(bank_id, delta, using)
+    record_deletes(Client, [row[0] for row in rows], using)
+    deleted[Client._meta.label] = len(rows)
+    return {label: count for label, count in deleted.items() if count}
@@ -0,0 +1,91 @@
+"""Set-based maintenance of the stored Bank/Client counters.
+
+Day-to-day the counters move incrementally (``Client.save``,
+``Credit.save`` and the delete signals). Paths that bypass the ORM
+(archiving, ``QuerySet.update``, raw deletes) move them by per-owner deltas
+with ``credit_totals`` and ``move_counters``. ``repair_clients`` and
+``repair_banks`` rebuild them from the credits table for
+``manage.py repair_counters``.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Count, DecimalField, F, OuterRef, Q, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit, apply_counter_deltas
+from apps.sync.changes import publish_upserts
+
+
+def credit_totals(queryset: QuerySet) -> list[dict]:
+    """``client_id``, ``bank_id``, ``count`` and ``total`` (of ``max_payment``) per owner pair, in one query."""
+    rows = queryset.order_by().values('client_id', 'bank_id')
+    return list(rows.annotate(count=Count('pk'), total=Sum('max_payment')))
+
+
+def move_counters(before: list[dict], after: list[dict], using: str, owners: tuple = (Client, Bank)) -> None:
+    """Move the ``owners``' counters from ``before`` to ``after``, both from ``credit_totals``."""
+    deltas = defaultdict(lambda: [0, Decimal(0)])
+    for rows, sign in ((before, -1), (after, 1)):
+        for row in rows:
+            for model, pk in ((Client, row['client_id']), (Bank, row['bank_id'])):
+                if model not in owners:
+                    continue
+                deltas[model, pk][0] += sign * row['count']
+                deltas[model, pk][1] += sign * row['total']
+    apply_counter_deltas(deltas, using)
+
+
+def _aggregate(queryset: QuerySet, group_by: str, expression):
+    rows = queryset.filter(**{group_by: OuterRef('pk')}).order_by().values(group_by)
+    return Subquery(rows.annotate(value=expression).values('value'))
+
+
+def _counter_expressions(owner: str) -> dict:
+    money = DecimalField(max_digits=18, decimal_places=2)
+    return {
+        'credits_count': Coalesce(_aggregate(Credit.objects.all(), owner, Count('pk')), Value(0)),
+        'total_max_payment': Coalesce(
+            _aggregate(Credit.objects.all(), owner, Sum('max_payment')), Value(Decimal(0)), output_field=money,
+        ),
+    }
+
+
+def _repair(queryset: QuerySet, expressions: dict) -> int:
+    """Rewrite the counters of rows in ``queryset`` that drifted; returns how many.
+
+    Each chunk commits on its own, so a full repair never holds locks on
+    every row at once.
+    """
+    model = queryset.model
+    stale = queryset.annotate(**{f'actual_{name}': expression for name, expression in expressions.items()}).filter(
+        Q(*[~Q(**{name: F(f'actual_{name}')}) for name in expressions], _connector=Q.OR)
+    )
+    ids = list(stale.values_list('pk', flat=True))
+    now = timezone.now()
+    using = router.db_for_write(model)
+    updated = 0
+    for start in range(0, len(ids), settings.BULK_CHUNK_SIZE):
+        chunk = ids[start:start + settings.BULK_CHUNK_SIZE]
+        with transaction.atomic(using=using):
+            updated += model.objects.using(using).filter(pk__in=chunk).update(updated_at=now, **expressions)
+            publish_upserts(model, chunk, now, using)
+    return updated
+
+
+def repair_clients(queryset: QuerySet | None = None) -> int:
+    return _repair(Client.objects.all() if queryset is None else queryset, _counter_expressions('client'))
+
+
+def repair_banks(queryset: QuerySet | None = None) -> int:
+    clients = Client.objects.filter(bank=OuterRef('pk')).order_by().values('bank')
+    expressions = {
+        **_counter_expressions('bank'),
+        'clients_count': Coalesce(Subquery(clients.annotate(value=Count('pk')).values('value')), Value(0)),
+    }
+    return _repair(Bank.objects.all() if queryset is None else queryset, expressions)
@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.credits.archive import archive_credits
+from apps.credits.models import Credit
+
+
+class Command(BaseCommand):
+    help = 'Move credits older than the archive horizon from the hot table to the archive.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days', type=int, default=settings.CREDIT_ARCHIVE_AFTER_DAYS,
+            help='Archive credits created more than this many days ago.',
+        )
+        parser.add_argument('--batch-size', type=int, default=settings.CREDIT_ARCHIVE_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many credits would move.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+        if options['dry_run']:
+            count = Credit.objects.filter(created_at__lt=cutoff).count()
+            self.stdout.write(f'{count} credit(s) created before {cutoff:%Y-%m-%d} would be archived.')
+            return
+
+        moved = 0
+        for batch in archive_credits(cutoff, options['batch_size']):
+            moved += batch
+            self.stdout.write(f'Archived {moved} credit(s)...')
+        self.stdout.write(self.style.SUCCESS(f'Archived {moved} credit(s) created before {cutoff:%Y-%m-%d}.'))
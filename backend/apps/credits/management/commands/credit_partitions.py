@@ -0,0 +1,61 @@
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.credits import partitioning
+from apps.credits.api.filters import CreditFilter
+from apps.credits.api.viewsets import CreditViewSet
+
+
+class Command(BaseCommand):
+    help = 'Manage monthly range partitions of the credits table (PostgreSQL only).'
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest='action', required=True)
+
+        convert = subparsers.add_parser('convert', help='Rebuild credits_credit as a partitioned table (one-off).')
+        ensure = subparsers.add_parser('ensure', help='Create partitions for the coming months (idempotent).')
+        for subparser in (convert, ensure):
+            subparser.add_argument(
+                '--months-ahead', type=int, default=settings.CREDIT_PARTITION_MONTHS_AHEAD,
+                help='How many future months to pre-create.',
+            )
+
+        subparsers.add_parser('explain', help='Show which partitions typical API queries touch.')
+
+    def handle(self, *args, **options):
+        try:
+            if options['action'] == 'convert':
+                created = partitioning.convert_to_partitioned(options['months_ahead'])
+                self.stdout.write(self.style.SUCCESS(f'Converted {partitioning.TABLE}: {len(created)} monthly partitions.'))
+            elif options['action'] == 'ensure':
+                created = partitioning.ensure_partitions(options['months_ahead'])
+                self.stdout.write(f"Created partitions: {', '.join(created) if created else 'none needed'}")
+            else:
+                self._explain()
+        except partitioning.PartitioningError as exc:
+            raise CommandError(str(exc)) from exc
+
+    def _explain(self):
+        if not partitioning.is_partitioned():
+            raise CommandError(f'{partitioning.TABLE} is not partitioned.')
+        month = partitioning.month_start(date.today())
+        base = CreditViewSet.queryset
+        page = settings.REST_FRAMEWORK['PAGE_SIZE']
+        scenarios = {
+            'default list (recent first)': base[:page],
+            'created_at range (this month)': CreditFilter(
+                data={
+                    'created_at_after': month.isoformat(),
+                    'created_at_before': partitioning.add_months(month, 1).isoformat(),
+                },
+                queryset=base,
+            ).qs[:page],
+            'credit_type filter': CreditFilter(data={'credit_type': 'AUTO'}, queryset=base).qs[:page],
+        }
+        for label, queryset in scenarios.items():
+            result = partitioning.explain_partitions(queryset)
+            self.stdout.write(f"{label}: {result['node']} over {len(result['partitions'])} partition(s)")
+            for name in result['partitions']:
+                self.stdout.write(f'    {name}')
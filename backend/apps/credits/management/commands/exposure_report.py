@@ -0,0 +1,54 @@
+import argparse
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.credits import reports
+from config.db_router import replica_alias
+
+
+class Command(BaseCommand):
+    help = 'Write per-client and per-bank credit exposure CSVs, aggregating client id ranges in parallel.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Directory for the report; rerun with the same directory to resume.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes (1 runs inline).')
+        parser.add_argument(
+            '--partitions', type=int,
+            help=f'Client id ranges (default: the existing plan, else {settings.EXPOSURE_REPORT_PARTITIONS}).',
+        )
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched per server-side cursor round trip.')
+        parser.add_argument(
+            '--database', default=replica_alias() or DEFAULT_DB_ALIAS,
+            help='Database alias to read from (defaults to the replica when configured).',
+        )
+        parser.add_argument(
+            '--include-archived', action=argparse.BooleanOptionalAction,
+            help='Also aggregate credits moved to the archive (default: the existing plan, else included).',
+        )
+        parser.add_argument('--restart', action='store_true', help='Discard finished partitions and start over.')
+
+    def handle(self, *args, **options):
+        if (options['partitions'] is not None and options['partitions'] < 1) or options['workers'] < 1:
+            raise CommandError('--partitions and --workers must be at least 1.')
+        output = Path(options['output'])
+        output.mkdir(parents=True, exist_ok=True)
+
+        try:
+            plan, include_archived = reports.load_or_plan(
+                output, options['partitions'], options['database'], options['restart'], options['include_archived'],
+            )
+        except reports.ManifestMismatch as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(f"Archived credits are {'included' if include_archived else 'excluded'}.")
+        if not plan:
+            self.stdout.write('No credits to report.')
+        reports.run(
+            plan, output, options['database'], options['workers'], options['chunk_size'], self.stdout.write,
+            include_archived,
+        )
+        clients_path, banks_path = reports.merge(plan, output)
+        self.stdout.write(self.style.SUCCESS(f'Wrote {clients_path} and {banks_path}.'))
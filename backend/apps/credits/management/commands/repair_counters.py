@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.credits.counters import repair_banks, repair_clients
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored client/credit counters on banks and clients from the credits table.'
+
+    def handle(self, *args, **options):
+        # Each chunk of repaired rows commits separately.
+        clients = repair_clients()
+        banks = repair_banks()
+        self.stdout.write(self.style.SUCCESS(f'Repaired counters on {clients} client(s) and {banks} bank(s).'))
@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.credits.archive import restore_credits
+from apps.credits.models import ArchivedCredit
+
+
+class Command(BaseCommand):
+    help = 'Move archived credits back to the hot table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', type=int, nargs='+', help='Credit ids to restore.')
+        parser.add_argument('--created-after', help='Restore credits created at or after this ISO 8601 timestamp.')
+        parser.add_argument('--created-before', help='Restore credits created before this ISO 8601 timestamp.')
+        parser.add_argument('--all', action='store_true', help='Restore every archived credit.')
+        parser.add_argument('--batch-size', type=int, default=settings.CREDIT_ARCHIVE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        queryset = ArchivedCredit.objects.all()
+        if options['ids']:
+            queryset = queryset.filter(id__in=options['ids'])
+        for option, lookup in (('created_after', 'created_at__gte'), ('created_before', 'created_at__lt')):
+            if options[option]:
+                value = parse_datetime(options[option])
+                if value is None:
+                    raise CommandError(f'--{option.replace("_", "-")} must be an ISO 8601 timestamp.')
+                if timezone.is_naive(value):
+                    value = timezone.make_aware(value)
+                queryset = queryset.filter(**{lookup: value})
+        if not (options['all'] or options['ids'] or options['created_after'] or options['created_before']):
+            raise CommandError('Select credits with --ids, --created-after/--created-before, or pass --all.')
+
+        moved = 0
+        for batch in restore_credits(queryset, options['batch_size']):
+            moved += batch
+            self.stdout.write(f'Restored {moved} credit(s)...')
+        self.stdout.write(self.style.SUCCESS(f'Restored {moved} credit(s).'))
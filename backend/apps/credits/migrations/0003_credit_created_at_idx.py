@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:21
+
+from django.db import migrations, models
+
+from apps.core.operations import AddIndexConcurrentlyWhereSupported
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction; it does not block
+    # writes to the table while the index builds.
+    atomic = False
+
+    dependencies = [
+        ('credits', '0002_credit_updated_at'),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyWhereSupported(
+            model_name='credit',
+            index=models.Index(fields=['created_at'], name='credit_created_at_idx'),
+        ),
+    ]
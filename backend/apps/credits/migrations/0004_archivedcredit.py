@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:23
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banks', '0003_bank_updated_at'),
+        ('clients', '0002_client_updated_at'),
+        ('credits', '0003_credit_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedCredit',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('description', models.CharField(max_length=255)),
+                ('min_payment', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('max_payment', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('term_months', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(1)])),
+                ('created_at', models.DateTimeField()),
+                ('credit_type', models.CharField(choices=[('AUTO', 'Automotive'), ('MORTGAGE', 'Mortgage'), ('COMMERCIAL', 'Commercial')], max_length=32)),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('bank', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_credits', to='banks.bank')),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_credits', to='clients.client')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['created_at'], name='archivedcredit_created_at_idx')],
+            },
+        ),
+    ]
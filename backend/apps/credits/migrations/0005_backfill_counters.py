@@ -0,0 +1,39 @@
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import Count, DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def _aggregate(queryset, group_by, expression):
+    rows = queryset.filter(**{group_by: OuterRef('pk')}).order_by().values(group_by)
+    return Subquery(rows.annotate(value=expression).values('value'))
+
+
+def backfill_counters(apps, schema_editor):
+    Bank = apps.get_model('banks', 'Bank')
+    Client = apps.get_model('clients', 'Client')
+    Credit = apps.get_model('credits', 'Credit')
+    money = DecimalField(max_digits=18, decimal_places=2)
+
+    for model, owner in ((Client, 'client'), (Bank, 'bank')):
+        model.objects.update(
+            credits_count=Coalesce(_aggregate(Credit.objects.all(), owner, Count('pk')), Value(0)),
+            total_max_payment=Coalesce(
+                _aggregate(Credit.objects.all(), owner, Sum('max_payment')), Value(Decimal(0)), output_field=money,
+            ),
+        )
+    Bank.objects.update(clients_count=Coalesce(_aggregate(Client.objects.all(), 'bank', Count('pk')), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banks', '0004_counters'),
+        ('clients', '0003_counters'),
+        ('credits', '0004_archivedcredit'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,10 @@
+from collections import defaultdict
+from decimal import Decimal
+
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from apps.banks.models import Bank
 from apps.clients.models import Client
@@ -19,6 +24,104 @@ class Credit(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     bank = models.ForeignKey(Bank, on_delete=models.PROTECT, related_name='credits')
     credit_type = models.CharField(max_length=32, choices=CreditType.choices)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='credit_updated_at_id_idx'),
+            # Recent-first listing; also lets partitioned tables stop after the newest months.
+            models.Index(fields=['created_at'], name='credit_created_at_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.client.full_name} - {self.description}"
+
+    def save(self, *args, **kwargs):
+        # Client/Bank counters move in the same transaction as the credit;
+        # deletes are handled in apps.credits.signals.
+        using = kwargs.get('using') or router.db_for_write(Credit, instance=self)
+        with transaction.atomic(using=using):
+            before = None
+            if not self._state.adding:
+                before = Credit.objects.using(using).select_for_update().filter(pk=self.pk).values(*COUNTED_FIELDS).first()
+            super().save(*args, **kwargs)
+            apply_credit_change(before, {field: getattr(self, field) for field in COUNTED_FIELDS}, using)
+
+
+# Credit fields that feed the Client and Bank counters.
+COUNTED_FIELDS = ('client_id', 'bank_id', 'max_payment')
+
+
+def apply_credit_change(before: dict | None, after: dict | None, using: str) -> None:
+    """Move ``credits_count``/``total_max_payment`` from ``before``'s owners to ``after``'s.
+
+    ``before``/``after`` hold ``COUNTED_FIELDS`` (``None`` for a create or a
+    delete).
+    """
+    deltas = defaultdict(lambda: [0, Decimal(0)])
+    for row, sign in ((before, -1), (after, 1)):
+        if row is None:
+            continue
+        for model, pk in ((Client, row['client_id']), (Bank, row['bank_id'])):
+            deltas[model, pk][0] += sign
+            deltas[model, pk][1] += sign * Decimal(row['max_payment'])
+    apply_counter_deltas(deltas, using)
+
+
+def apply_counter_deltas(deltas: dict, using: str) -> None:
+    """Add ``{(model, pk): [count, total]}`` to the owners' credit counters.
+
+    Each affected row gets an ``F()`` update, a new ``updated_at`` and a live
+    upsert event, so the changes feed and live clients agree. Rows with the
+    same delta share one ``UPDATE``.
+
+    The bank row stays locked until the transaction commits, so credit writes
+    for the same bank queue behind each other for that long.
+    """
+    # apps.sync imports the models.
+    from apps.sync.changes import publish_upserts
+
+    now = timezone.now()
+    groups = defaultdict(list)
+    for (model, pk), (count, total) in deltas.items():
+        if pk is not None and (count != 0 or total != 0):
+            groups[model, count, total].append(pk)
+    changed = defaultdict(list)
+    for (model, count, total), ids in groups.items():
+        model.objects.using(using).filter(pk__in=ids).update(
+            credits_count=F('credits_count') + count,
+            total_max_payment=F('total_max_payment') + total,
+            updated_at=now,
+        )
+        changed[model] += ids
+    for model, ids in changed.items():
+        publish_upserts(model, ids, now, using)
+
+
+class ArchivedCredit(models.Model):
+    """A credit moved out of the hot table by ``manage.py archive_credits``.
+
+    Fields mirror ``Credit`` and are declared in the same order (``archived_at``
+    last), so querysets of both models can be combined with ``union()``.
+    ``id`` keeps the original credit id.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='archived_credits')
+    description = models.CharField(max_length=255)
+    min_payment = models.DecimalField(max_digits=12, decimal_places=2)
+    max_payment = models.DecimalField(max_digits=12, decimal_places=2)
+    term_months = models.PositiveIntegerField(validators=[MinValueValidator(1)])
+    created_at = models.DateTimeField()
+    bank = models.ForeignKey(Bank, on_delete=models.PROTECT, related_name='archived_credits')
+    credit_type = models.CharField(max_length=32, choices=Credit.CreditType.choices)
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='archivedcredit_created_at_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.client.full_name} - {self.description} (archived)"
@@ -0,0 +1,231 @@
+"""Monthly range partitioning of the credits table on PostgreSQL.
+
+Django keeps treating ``Credit`` as an ordinary model. Only the physical
+table changes:
+
+- ``credits_credit`` becomes ``PARTITION BY RANGE (created_at)`` with one
+  partition per month (``credits_credit_pYYYYMM``) and a default partition;
+- the primary key becomes ``(id, created_at)`` because PostgreSQL requires
+  the partition key in unique constraints. ``id`` still comes from a single
+  sequence, so it stays unique;
+- indexes and foreign keys are recreated on the parent with their original
+  names, so later Django migrations can still refer to them.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timezone
+
+from django.db import connection, transaction
+
+from apps.credits.models import Credit
+
+TABLE = Credit._meta.db_table
+LEGACY_TABLE = f'{TABLE}_legacy'
+DEFAULT_PARTITION = f'{TABLE}_default'
+SEQUENCE = f'{TABLE}_id_seq'
+
+
+class PartitioningError(Exception):
+    pass
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f'{TABLE}_p{month:%Y%m}'
+
+
+def month_range(first: date, last: date) -> list[date]:
+    months = []
+    current = month_start(first)
+    while current <= month_start(last):
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def _qn(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def _require_postgres() -> None:
+    if connection.vendor != 'postgresql':
+        raise PartitioningError('Credit partitioning requires PostgreSQL.')
+
+
+def is_partitioned() -> bool:
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)', [TABLE])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def _bounds(month: date) -> tuple[str, str]:
+    upper_month = add_months(month, 1)
+    lower = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    upper = datetime(upper_month.year, upper_month.month, 1, tzinfo=timezone.utc)
+    return lower.isoformat(), upper.isoformat()
+
+
+def create_partition_sql(month: date) -> str:
+    lower, upper = _bounds(month)
+    return (
+        f'CREATE TABLE IF NOT EXISTS {_qn(partition_name(month))} PARTITION OF {_qn(TABLE)} '
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+
+
+def add_partitions_sql(months: list[date]) -> list[str]:
+    """Statements that add ``months`` next to a default partition.
+
+    Creating a partition while the default partition is attached makes
+    PostgreSQL scan the default partition under lock, and fails if it already
+    holds rows for that month (a late cron run, a future ``created_at``). So
+    the default partition is detached, the new partitions are created, their
+    rows are moved out of it, and it is attached again. Re-attaching still
+    validates the default partition, which normally holds only stray rows.
+    """
+    table, default = _qn(TABLE), _qn(DEFAULT_PARTITION)
+    statements = [f'ALTER TABLE {table} DETACH PARTITION {default}']
+    for month in months:
+        lower, upper = _bounds(month)
+        statements += [
+            create_partition_sql(month),
+            f'WITH moved AS (DELETE FROM {default} '
+            f"WHERE created_at >= '{lower}' AND created_at < '{upper}' RETURNING *) "
+            f'INSERT INTO {_qn(partition_name(month))} SELECT * FROM moved',
+        ]
+    statements.append(f'ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT')
+    return statements
+
+
+def _missing_months(cursor, months: list[date]) -> list[date]:
+    missing = []
+    for month in months:
+        cursor.execute('SELECT to_regclass(%s)', [partition_name(month)])
+        if cursor.fetchone()[0] is None:
+            missing.append(month)
+    return missing
+
+
+def ensure_partitions(months_ahead: int, today: date | None = None) -> list[str]:
+    """Create monthly partitions from the current month to ``months_ahead``; idempotent."""
+    _require_postgres()
+    if not is_partitioned():
+        raise PartitioningError(f'{TABLE} is not partitioned; run "credit_partitions convert" first.')
+    today = today or date.today()
+    months = month_range(today, add_months(today, months_ahead))
+    with transaction.atomic(), connection.cursor() as cursor:
+        if not _missing_months(cursor, months):
+            return []
+        # Serialize concurrent runs, then look again under the lock.
+        cursor.execute(f'LOCK TABLE {_qn(TABLE)} IN ACCESS EXCLUSIVE MODE')
+        missing = _missing_months(cursor, months)
+        for statement in add_partitions_sql(missing) if missing else []:
+            cursor.execute(statement)
+    return [partition_name(month) for month in missing]
+
+
+def _legacy_definitions(cursor) -> tuple[list[str], list[tuple[str, str]]]:
+    """Index DDL and foreign keys of the legacy table, retargeted at the parent."""
+    cursor.execute(
+        """
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.tablename = %s
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c
+              WHERE c.conname = i.indexname AND c.contype = 'p'
+          )
+        """,
+        [LEGACY_TABLE],
+    )
+    indexes = [
+        indexdef.replace(f' ON public.{LEGACY_TABLE} ', f' ON public.{TABLE} ')
+        .replace(f' ON {LEGACY_TABLE} ', f' ON {TABLE} ')
+        for _name, indexdef in cursor.fetchall()
+    ]
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = to_regclass(%s) AND contype = 'f'
+        """,
+        [LEGACY_TABLE],
+    )
+    foreign_keys = cursor.fetchall()
+    return indexes, foreign_keys
+
+
+def convert_to_partitioned(months_ahead: int, today: date | None = None) -> list[str]:
+    """Rebuild ``credits_credit`` as a monthly partitioned table, copying all rows.
+
+    Everything runs in one transaction under an ACCESS EXCLUSIVE lock on the
+    credits table, so writers wait until the copy finishes. Run it in a
+    maintenance window on large tables.
+    """
+    _require_postgres()
+    if is_partitioned():
+        raise PartitioningError(f'{TABLE} is already partitioned.')
+    today = today or date.today()
+    table, legacy = _qn(TABLE), _qn(LEGACY_TABLE)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+        cursor.execute(f'SELECT MIN(created_at), MAX(id) FROM {table}')
+        oldest, max_id = cursor.fetchone()
+
+        cursor.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+        indexes, foreign_keys = _legacy_definitions(cursor)
+
+        cursor.execute(
+            f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        # PostgreSQL 16 does not allow identity columns on partitioned tables;
+        # use an owned sequence continuing after the highest existing id.
+        cursor.execute(f'CREATE SEQUENCE {_qn(SEQUENCE + "_part")} OWNED BY {table}.id')
+        cursor.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}_part')")
+        cursor.execute(f"SELECT setval('{SEQUENCE}_part', %s, false)", [(max_id or 0) + 1])
+
+        first = month_start(oldest.date()) if oldest else month_start(today)
+        created = []
+        for month in month_range(first, add_months(today, months_ahead)):
+            cursor.execute(create_partition_sql(month))
+            created.append(partition_name(month))
+        cursor.execute(f'CREATE TABLE {_qn(DEFAULT_PARTITION)} PARTITION OF {table} DEFAULT')
+
+        cursor.execute(f'INSERT INTO {table} SELECT * FROM {legacy}')
+        cursor.execute(f'DROP TABLE {legacy}')
+
+        cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT {_qn(TABLE + "_pkey")} PRIMARY KEY (id, created_at)')
+        for indexdef in indexes:
+            cursor.execute(indexdef)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT {_qn(name)} {definition}')
+
+    return created
+
+
+def _relations(plan: dict) -> list[str]:
+    found = [plan['Relation Name']] if 'Relation Name' in plan else []
+    for child in plan.get('Plans', []):
+        found.extend(_relations(child))
+    return found
+
+
+def explain_partitions(queryset) -> dict:
+    """Which credit partitions the planner keeps for ``queryset``."""
+    plan = json.loads(queryset.explain(format='json'))[0]['Plan']
+    relations = [name for name in _relations(plan) if name.startswith(TABLE)]
+    return {'node': plan['Node Type'], 'partitions': relations}
@@ -0,0 +1,269 @@
+"""Per-client and per-bank exposure report, computed in parallel.
+
+The client id space is cut into fixed ranges (partitions). Each partition is
+aggregated independently: the database groups its credits by
+``(client, bank, credit_type)`` and the grouped rows are streamed back
+through a server-side cursor (``QuerySet.iterator``) and folded into
+per-client and per-bank totals. Archived credits are still owed, so by
+default they are aggregated alongside the hot table; the choice is recorded
+in the manifest. Finished partitions are written to
+``<output>/parts/`` so an interrupted run resumes where it stopped; the final
+CSV files are merged from the parts.
+
+Weighted term is the exposure-weighted average term,
+``sum(term_months * max_payment) / sum(max_payment)``.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, F, Max, Min, Sum
+
+from apps.credits.models import ArchivedCredit, Credit
+
+CREDIT_TYPES = [value for value, _label in Credit.CreditType.choices]
+CLIENT_COLUMNS = ['client_id', 'credits', 'total_max_payment', 'weighted_term_months'] + [
+    f'count_{credit_type.lower()}' for credit_type in CREDIT_TYPES
+]
+BANK_COLUMNS = ['bank_id', 'clients', *CLIENT_COLUMNS[1:]]
+
+
+@dataclass(frozen=True)
+class Partition:
+    index: int
+    first_client_id: int
+    last_client_id: int
+
+    @property
+    def filename(self) -> str:
+        return f'part-{self.index:05d}.json'
+
+
+def _sources(include_archived: bool) -> list:
+    return [Credit, ArchivedCredit] if include_archived else [Credit]
+
+
+def plan_partitions(count: int, database: str, include_archived: bool) -> list[Partition]:
+    """Split the client ids that have credits into ``count`` equal id ranges."""
+    bounds = [
+        model.objects.using(database).aggregate(first=Min('client_id'), last=Max('client_id'))
+        for model in _sources(include_archived)
+    ]
+    firsts = [bound['first'] for bound in bounds if bound['first'] is not None]
+    if not firsts:
+        return []
+    first, last = min(firsts), max(bound['last'] for bound in bounds if bound['last'] is not None)
+    size = max(1, -(-(last - first + 1) // count))
+    return [
+        Partition(index, start, min(start + size - 1, last))
+        for index, start in enumerate(range(first, last + 1, size))
+    ]
+
+
+def _empty_totals() -> dict:
+    return {'credits': 0, 'total_max_payment': Decimal(0), 'term_weight': Decimal(0), 'by_type': defaultdict(int)}
+
+
+def _add(totals: dict, credits: int, total: Decimal, term_weight: Decimal, by_type: dict) -> None:
+    totals['credits'] += credits
+    totals['total_max_payment'] += total
+    totals['term_weight'] += term_weight
+    for credit_type, count in by_type.items():
+        totals['by_type'][credit_type] += count
+
+
+def _grouped_rows(model, partition: Partition, database: str):
+    return (
+        model.objects.using(database)
+        .filter(client_id__gte=partition.first_client_id, client_id__lte=partition.last_client_id)
+        .order_by()
+        .values('client_id', 'bank_id', 'credit_type')
+        .annotate(credits=Count('pk'), total=Sum('max_payment'), term_weight=Sum(F('term_months') * F('max_payment')))
+    )
+
+
+def aggregate_partition(partition: Partition, database: str, chunk_size: int, include_archived: bool) -> dict:
+    """Totals for one partition, as JSON-ready data."""
+    clients = defaultdict(_empty_totals)
+    banks = defaultdict(_empty_totals)
+    bank_clients = defaultdict(set)
+    credits = 0
+    for model in _sources(include_archived):
+        for row in _grouped_rows(model, partition, database).iterator(chunk_size=chunk_size):
+            values = (
+                row['credits'], Decimal(str(row['total'])), Decimal(str(row['term_weight'])),
+                {row['credit_type']: row['credits']},
+            )
+            _add(clients[row['client_id']], *values)
+            _add(banks[row['bank_id']], *values)
+            bank_clients[row['bank_id']].add(row['client_id'])
+            credits += row['credits']
+
+    def dump(totals):
+        return {**totals, 'total_max_payment': str(totals['total_max_payment']), 'term_weight': str(totals['term_weight'])}
+
+    return {
+        'partition': partition.index,
+        'credits': credits,
+        'clients': {pk: dump(totals) for pk, totals in clients.items()},
+        # Partitions never share a client, so per-bank client counts add up across parts.
+        'banks': {pk: {**dump(totals), 'clients': len(bank_clients[pk])} for pk, totals in banks.items()},
+    }
+
+
+def _write_json(path: Path, data) -> None:
+    # Write then rename, so a crash never leaves a half-written part behind.
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+def _run_partition(
+    partition: Partition, database: str, chunk_size: int, include_archived: bool, parts_dir: str,
+) -> tuple[int, int, float]:
+    started = time.perf_counter()
+    result = aggregate_partition(partition, database, chunk_size, include_archived)
+    _write_json(Path(parts_dir) / partition.filename, result)
+    return partition.index, result['credits'], time.perf_counter() - started
+
+
+def _init_worker() -> None:
+    # No-op for forked workers; needed when processes are spawned.
+    django.setup()
+
+
+class ManifestMismatch(Exception):
+    pass
+
+
+def load_or_plan(
+    output: Path, partitions: int | None, database: str, restart: bool, include_archived: bool | None = None,
+) -> tuple[list[Partition], bool]:
+    """Reuse the plan of an interrupted run so finished parts stay valid; returns it with its archive choice.
+
+    ``partitions=None`` and ``include_archived=None`` mean "whatever the
+    existing plan used" (or ``EXPOSURE_REPORT_PARTITIONS`` and archived rows
+    included for a new one). A different explicit choice needs ``restart``:
+    the finished parts were computed for the old plan.
+    """
+    manifest = output / 'manifest.json'
+    if manifest.exists() and not restart:
+        saved = json.loads(manifest.read_text())
+        plan = [Partition(**entry) for entry in saved['partitions']]
+        requested = saved.get('requested', len(plan))
+        if partitions is not None and partitions != requested:
+            raise ManifestMismatch(
+                f'{output} holds a run planned with {requested} partition(s), not {partitions}; '
+                'rerun without --partitions to resume it, or pass --restart.'
+            )
+        # Manifests written before the option existed only read the hot table.
+        archived = saved.get('include_archived', False)
+        if include_archived is not None and include_archived != archived:
+            raise ManifestMismatch(
+                f"{output} holds a run that {'includes' if archived else 'excludes'} archived credits; "
+                'rerun without --include-archived/--no-include-archived to resume it, or pass --restart.'
+            )
+        return plan, archived
+    partitions = partitions or settings.EXPOSURE_REPORT_PARTITIONS
+    include_archived = True if include_archived is None else include_archived
+    parts_dir = output / 'parts'
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    for stale in parts_dir.glob('part-*.json'):
+        stale.unlink()
+    plan = plan_partitions(partitions, database, include_archived)
+    _write_json(manifest, {
+        'database': database,
+        'requested': partitions,
+        'include_archived': include_archived,
+        'partitions': [vars(p) for p in plan],
+    })
+    return plan, include_archived
+
+
+def run(
+    plan: list[Partition], output: Path, database: str, workers: int, chunk_size: int, progress,
+    include_archived: bool = True,
+):
+    """Aggregate every partition without a finished part file; ``progress`` gets one line per partition."""
+    parts_dir = output / 'parts'
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    pending = [p for p in plan if not (parts_dir / p.filename).exists()]
+    if len(pending) < len(plan):
+        progress(f'Resuming: {len(plan) - len(pending)} of {len(plan)} partition(s) already done.')
+
+    started, done, credits = time.perf_counter(), len(plan) - len(pending), 0
+
+    def report(index, partition_credits, seconds):
+        nonlocal done, credits
+        done += 1
+        credits += partition_credits
+        elapsed = time.perf_counter() - started
+        progress(
+            f'[{done}/{len(plan)}] partition {index}: {partition_credits} credits in {seconds:.2f}s; '
+            f'overall {credits / elapsed if elapsed else 0:,.0f} credits/s'
+        )
+
+    if workers <= 1:
+        for partition in pending:
+            report(*_run_partition(partition, database, chunk_size, include_archived, str(parts_dir)))
+        return
+
+    # Forked workers must open their own connections, not inherit ours.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(_run_partition, p, database, chunk_size, include_archived, str(parts_dir)) for p in pending
+        ]
+        for future in as_completed(futures):
+            report(*future.result())
+
+
+def _metrics(totals: dict) -> dict:
+    total = Decimal(totals['total_max_payment'])
+    weighted = Decimal(totals['term_weight']) / total if total else Decimal(0)
+    return {
+        'credits': totals['credits'],
+        'total_max_payment': f'{total:.2f}',
+        'weighted_term_months': f'{weighted:.2f}',
+        **{f'count_{t.lower()}': totals['by_type'].get(t, 0) for t in CREDIT_TYPES},
+    }
+
+
+def merge(plan: list[Partition], output: Path) -> tuple[Path, Path]:
+    """Combine part files into ``clients.csv`` and ``banks.csv``."""
+    banks = defaultdict(_empty_totals)
+    bank_clients = defaultdict(int)
+    clients_path, banks_path = output / 'clients.csv', output / 'banks.csv'
+
+    with clients_path.open('w', newline='') as clients_file:
+        writer = csv.DictWriter(clients_file, CLIENT_COLUMNS)
+        writer.writeheader()
+        for partition in plan:
+            part = json.loads((output / 'parts' / partition.filename).read_text())
+            # Partitions split the client id space, so each client appears once.
+            for pk, totals in sorted(part['clients'].items(), key=lambda item: int(item[0])):
+                writer.writerow({'client_id': pk, **_metrics(totals)})
+            for pk, totals in part['banks'].items():
+                _add(
+                    banks[pk], totals['credits'], Decimal(totals['total_max_payment']),
+                    Decimal(totals['term_weight']), totals['by_type'],
+                )
+                bank_clients[pk] += totals['clients']
+
+    with banks_path.open('w', newline='') as banks_file:
+        writer = csv.DictWriter(banks_file, BANK_COLUMNS)
+        writer.writeheader()
+        for pk, totals in sorted(banks.items(), key=lambda item: int(item[0])):
+            writer.writerow({'bank_id': pk, 'clients': bank_clients[pk], **_metrics(totals)})
+    return clients_path, banks_path
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import COUNTED_FIELDS, Credit, apply_credit_change
+
+
+@receiver(post_delete, sender=Credit)
+def release_credit_counters(sender, instance, using, **kwargs):
+    # Runs inside the deletion's transaction, including client cascades.
+    apply_credit_change({field: getattr(instance, field) for field in COUNTED_FIELDS}, None, using)
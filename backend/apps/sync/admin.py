@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import Tombstone
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    list_display = ('id', 'resource', 'object_id', 'deleted_at')
+    list_filter = ('resource',)
+    search_fields = ('object_id',)
@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.sync.events import RESYNC_EVENT, broker
+from apps.sync.feed import UPSERT_SOURCES
+
+
+def _authenticate(request):
+    # EventSource cannot send headers, so the access token may also arrive as
+    # ?access_token=.
+    auth = JWTAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else request.GET.get('access_token')
+    if not raw_token:
+        return None
+    try:
+        return auth.get_user(auth.get_validated_token(raw_token))
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+
+
+def _format(event: dict) -> str:
+    name = 'resync' if event is RESYNC_EVENT else 'change'
+    return f'event: {name}\ndata: {json.dumps(event)}\n\n'
+
+
+async def event_stream(request):
+    """Stream bank/client/credit change events as ``text/event-stream``.
+
+    Each ``change`` event carries ``type``, ``op`` (upsert/delete), ``id`` and
+    ``changed_at``. A ``resync`` event means events may have been dropped and
+    the client should catch up through ``/v1/changes/?updated_since=``.
+    """
+    if not hasattr(request, 'scope'):
+        return JsonResponse({'detail': 'The event stream is only available under the ASGI server.'}, status=503)
+
+    user = await sync_to_async(_authenticate)(request)
+    if user is None or not user.is_active:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+    types = {t.strip() for t in request.GET.get('types', '').split(',') if t.strip()} or set(UPSERT_SOURCES)
+
+    async def stream():
+        queue = broker.subscribe()
+        try:
+            yield f'retry: {settings.EVENTS_RETRY_MS}\n\n'
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream.
+                    yield ': ping\n\n'
+                    continue
+                if event is RESYNC_EVENT or event['type'] in types:
+                    yield _format(event)
+        finally:
+            broker.unsubscribe(queue)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,87 @@
+from datetime import timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from apps.sync.feed import InvalidCursor, UPSERT_SOURCES, collect_changes, decode_cursor, encode_cursor, since_cursor
+
+
+class ChangesViewSet(viewsets.ViewSet):
+    """Incremental sync feed: everything changed since a watermark."""
+
+    def get_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params.get('limit', settings.SYNC_PAGE_SIZE))
+        except ValueError:
+            raise ValidationError({'limit': 'A valid integer is required.'})
+        return max(1, min(limit, settings.SYNC_MAX_PAGE_SIZE))
+
+    def get_throttle_rows(self, request) -> int:
+        # Read by config.throttling; an invalid limit is rejected by list().
+        try:
+            return self.get_limit(request)
+        except ValidationError:
+            return settings.SYNC_PAGE_SIZE
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                'cursor',
+                OpenApiTypes.STR,
+                description='Opaque position returned as next_cursor by the previous call.',
+            ),
+            OpenApiParameter(
+                'updated_since',
+                OpenApiTypes.DATETIME,
+                description='Start from changes at or after this timestamp (ignored when cursor is given).',
+            ),
+            OpenApiParameter(
+                'types',
+                OpenApiTypes.STR,
+                description='Comma-separated list of resources (bank,client,credit). Defaults to all.',
+            ),
+            OpenApiParameter('limit', OpenApiTypes.INT, description='Maximum number of changes to return.'),
+        ],
+        responses=OpenApiTypes.OBJECT,
+    )
+    def list(self, request):
+        params = request.query_params
+        if params.get('cursor'):
+            try:
+                position = decode_cursor(params['cursor'])
+            except InvalidCursor as exc:
+                raise ValidationError({'cursor': str(exc)})
+        elif params.get('updated_since'):
+            updated_since = parse_datetime(params['updated_since'])
+            if updated_since is None:
+                raise ValidationError({'updated_since': 'Enter a valid ISO 8601 datetime.'})
+            if timezone.is_naive(updated_since):
+                updated_since = timezone.make_aware(updated_since, dt_timezone.utc)
+            position = since_cursor(updated_since)
+        else:
+            position = None
+
+        limit = self.get_limit(request)
+
+        resources = [r.strip() for r in params.get('types', '').split(',') if r.strip()]
+        unknown = set(resources) - set(UPSERT_SOURCES)
+        if unknown:
+            raise ValidationError({'types': f"Unknown types: {', '.join(sorted(unknown))}."})
+
+        # Rows stamped in the last few seconds may belong to transactions that
+        # have not committed yet; hold them back so a cursor never skips them.
+        until = timezone.now() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+        changes, next_cursor, has_more = collect_changes(position, until, limit, resources)
+        if next_cursor is None:
+            next_cursor = params.get('cursor') or (encode_cursor(*position) if position else None)
+
+        return Response({
+            'results': changes,
+            'next_cursor': next_cursor,
+            'has_more': has_more,
+        })
@@ -0,0 +1,21 @@
+"""Change tracking for writes that bypass model signals (``QuerySet.update``, raw deletes)."""
+from django.utils import timezone
+
+from .events import publish_many
+from .models import Tombstone
+from .signals import RESOURCE_BY_MODEL, _event
+
+
+def publish_upserts(model, ids, changed_at, using: str = 'default') -> None:
+    resource = RESOURCE_BY_MODEL[model]
+    publish_many([_event(resource, 'upsert', pk, changed_at) for pk in ids], using=using)
+
+
+def record_deletes(model, ids, using: str = 'default') -> None:
+    """Tombstone and announce rows removed without ``post_delete``."""
+    resource = RESOURCE_BY_MODEL[model]
+    now = timezone.now()
+    Tombstone.objects.using(using).bulk_create(
+        [Tombstone(resource=resource, object_id=pk, deleted_at=now) for pk in ids]
+    )
+    publish_many([_event(resource, 'delete', pk, now) for pk in ids], using=using)
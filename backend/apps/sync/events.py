@@ -0,0 +1,116 @@
+"""Live change events for server-sent event streams.
+
+Model signals publish small ``{type, op, id, changed_at}`` events. On
+PostgreSQL they go through ``pg_notify`` so every server process sees them
+once the writing transaction commits. Other backends (tests, local SQLite)
+fall back to an in-process hand-off on commit.
+
+Each process runs one ``EventBroker``. It holds at most one LISTEN connection
+and fans events out to per-subscriber ``asyncio.Queue`` objects, so an idle SSE
+client costs one queue and one suspended coroutine.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+RESYNC_EVENT = {'type': '*', 'op': 'resync'}
+
+
+class EventBroker:
+    def __init__(self) -> None:
+        self._subscribers: dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+        self._listener: asyncio.Task | None = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a queue on the running event loop (call from async code)."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[queue] = loop
+        if connections['default'].vendor == 'postgresql':
+            self._ensure_listener(loop)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def dispatch(self, event: dict) -> None:
+        """Deliver ``event`` to every subscriber; safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._offer, queue, event)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, event: dict) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow consumer gets one resync marker instead of an unbounded backlog.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC_EVENT)
+
+    def _ensure_listener(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            if self._listener is None or self._listener.done():
+                self._listener = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        import psycopg
+
+        db = settings.DATABASES['default']
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(
+                    dbname=db['NAME'],
+                    user=db['USER'],
+                    password=db['PASSWORD'],
+                    host=db['HOST'],
+                    port=db['PORT'],
+                    autocommit=True,
+                )
+                async with conn:
+                    await conn.execute(f'LISTEN {settings.EVENTS_CHANNEL}')
+                    async for notify in conn.notifies():
+                        self.dispatch(json.loads(notify.payload))
+            except psycopg.Error:
+                logger.warning('Event listener lost its connection; retrying.', exc_info=True)
+                # Anything published while disconnected is lost; tell clients.
+                self.dispatch(RESYNC_EVENT)
+                await asyncio.sleep(settings.EVENTS_RECONNECT_SECONDS)
+
+
+broker = EventBroker()
+
+
+def publish(event: dict, using: str = 'default') -> None:
+    """Publish ``event`` to live subscribers once the current transaction commits."""
+    publish_many([event], using=using)
+
+
+def publish_many(events: list[dict], using: str = 'default') -> None:
+    """Like ``publish`` for several events, with a single statement on PostgreSQL."""
+    if not events:
+        return
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        # NOTIFY is transactional: listeners only see it after COMMIT.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload',
+                [settings.EVENTS_CHANNEL, [json.dumps(event) for event in events]],
+            )
+    else:
+        transaction.on_commit(lambda: [broker.dispatch(event) for event in events], using=using)
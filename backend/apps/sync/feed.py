@@ -0,0 +1,127 @@
+"""Ordered, resumable feed of bank/client/credit changes.
+
+Every change is keyed by ``(changed_at, source rank, id)``. Each source is read
+with a keyset query on its ``(timestamp, id)`` index and the already-sorted
+streams are merged, so a page costs O(limit) regardless of table size.
+"""
+from __future__ import annotations
+
+import base64
+import heapq
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+
+from django.db.models import Q
+
+from apps.banks.api.serializers import BankSerializer
+from apps.banks.models import Bank
+from apps.clients.api.serializers import ClientSerializer
+from apps.clients.models import Client
+from apps.credits.api.serializers import CreditSerializer
+from apps.credits.models import Credit
+
+from .models import Tombstone
+
+
+@dataclass(frozen=True)
+class Source:
+    resource: str
+    rank: int
+    timestamp_field: str
+
+
+UPSERT_SOURCES = {
+    Tombstone.Resource.BANK: (Source('bank', 0, 'updated_at'), Bank.objects.all(), BankSerializer),
+    Tombstone.Resource.CLIENT: (
+        Source('client', 1, 'updated_at'), Client.objects.select_related('bank'), ClientSerializer,
+    ),
+    Tombstone.Resource.CREDIT: (
+        Source('credit', 2, 'updated_at'), Credit.objects.select_related('client', 'bank'), CreditSerializer,
+    ),
+}
+TOMBSTONE_SOURCE = Source('tombstone', 3, 'deleted_at')
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(changed_at: datetime, rank: int, pk: int) -> str:
+    raw = f'{changed_at.isoformat()}|{rank}|{pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int, int]:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        changed_at, rank, pk = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        return datetime.fromisoformat(changed_at), int(rank), int(pk)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise InvalidCursor('Invalid cursor.') from exc
+
+
+def since_cursor(updated_since: datetime) -> tuple[datetime, int, int]:
+    """Position just before every change at or after ``updated_since``."""
+    return updated_since, -1, 0
+
+
+def _after(queryset, source: Source, position: tuple[datetime, int, int] | None):
+    if position is None:
+        return queryset
+    changed_at, rank, pk = position
+    field = source.timestamp_field
+    if source.rank > rank:
+        return queryset.filter(**{f'{field}__gte': changed_at})
+    if source.rank < rank:
+        return queryset.filter(**{f'{field}__gt': changed_at})
+    return queryset.filter(Q(**{f'{field}__gt': changed_at}) | Q(**{field: changed_at, 'pk__gt': pk}))
+
+
+def _stream(queryset, source: Source, position, until: datetime, limit: int):
+    field = source.timestamp_field
+    rows = _after(queryset, source, position).filter(**{f'{field}__lte': until})
+    for row in rows.order_by(field, 'pk')[:limit]:
+        yield (getattr(row, field), source.rank, row.pk), source, row
+
+
+def collect_changes(position, until: datetime, limit: int, resources=None) -> tuple[list[dict], str | None, bool]:
+    """Return ``(changes, next_cursor, has_more)`` for up to ``limit`` changes."""
+    resources = set(resources or UPSERT_SOURCES)
+    streams = []
+    serializers = {}
+    for resource, (source, queryset, serializer_class) in UPSERT_SOURCES.items():
+        if resource in resources:
+            streams.append(_stream(queryset, source, position, until, limit + 1))
+            serializers[source.rank] = serializer_class
+    streams.append(
+        _stream(
+            Tombstone.objects.filter(resource__in=resources), TOMBSTONE_SOURCE, position, until, limit + 1,
+        )
+    )
+
+    merged = list(islice(heapq.merge(*streams, key=lambda item: item[0]), limit + 1))
+    has_more = len(merged) > limit
+    merged = merged[:limit]
+
+    changes = []
+    for (changed_at, rank, _pk), source, row in merged:
+        if source is TOMBSTONE_SOURCE:
+            changes.append({
+                'type': row.resource,
+                'op': 'delete',
+                'id': row.object_id,
+                'changed_at': changed_at,
+                'data': None,
+            })
+        else:
+            changes.append({
+                'type': source.resource,
+                'op': 'upsert',
+                'id': row.pk,
+                'changed_at': changed_at,
+                'data': serializers[rank](row).data,
+            })
+
+    next_cursor = encode_cursor(*merged[-1][0]) if merged else None
+    return changes, next_cursor, has_more
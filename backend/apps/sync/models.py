@@ -0,0 +1,23 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """Record of a deleted bank, client or credit, served by the changes feed."""
+
+    class Resource(models.TextChoices):
+        BANK = 'bank', 'Bank'
+        CLIENT = 'client', 'Client'
+        CREDIT = 'credit', 'Credit'
+
+    resource = models.CharField(max_length=16, choices=Resource.choices)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='tombstone_deleted_at_id_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.resource} #{self.object_id} deleted at {self.deleted_at:%Y-%m-%d %H:%M:%S}"
@@ -0,0 +1,46 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit
+
+from .events import publish, publish_many
+from .models import Tombstone
+
+RESOURCE_BY_MODEL = {
+    Bank: Tombstone.Resource.BANK,
+    Client: Tombstone.Resource.CLIENT,
+    Credit: Tombstone.Resource.CREDIT,
+}
+
+
+def _event(resource, op, pk, changed_at) -> dict:
+    return {'type': str(resource), 'op': op, 'id': pk, 'changed_at': changed_at.isoformat()}
+
+
+@receiver(post_save, sender=Bank)
+@receiver(post_save, sender=Client)
+@receiver(post_save, sender=Credit)
+def publish_upsert(sender, instance, using, **kwargs):
+    publish(_event(RESOURCE_BY_MODEL[sender], 'upsert', instance.pk, instance.updated_at), using=using)
+
+
+@receiver(post_delete, sender=Bank)
+@receiver(post_delete, sender=Client)
+@receiver(post_delete, sender=Credit)
+def record_tombstone(sender, instance, using, **kwargs):
+    tombstone = Tombstone.objects.using(using).create(resource=RESOURCE_BY_MODEL[sender], object_id=instance.pk)
+    publish(_event(tombstone.resource, 'delete', instance.pk, tombstone.deleted_at), using=using)
+
+
+@receiver(pre_delete, sender=Bank)
+def touch_clients_losing_bank(sender, instance, using, **kwargs):
+    # on_delete=SET_NULL is applied with a bulk UPDATE that skips auto_now,
+    # so bump the affected clients explicitly for the changes feed.
+    now = timezone.now()
+    clients = Client.objects.using(using).filter(bank=instance)
+    client_ids = list(clients.values_list('pk', flat=True))
+    clients.update(updated_at=now)
+    publish_many([_event(Tombstone.Resource.CLIENT, 'upsert', pk, now) for pk in client_ids], using=using)
@@ -0,0 +1,124 @@
+"""Primary/replica database routing.
+
+Reads are sent to the optional ``replica`` alias only while a request has
+explicitly opted in (see ``config.mixins.ReplicaReadMixin``); everything else,
+including all writes and migrations, goes to ``default``.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_DB_ALIAS = 'default'
+
+_use_replica: ContextVar[bool] = ContextVar('use_replica', default=False)
+_replica_health = {'checked_at': 0.0, 'healthy': False}
+
+
+def replica_alias() -> str | None:
+    alias = getattr(settings, 'DATABASE_REPLICA_ALIAS', 'replica')
+    return alias if alias in settings.DATABASES else None
+
+
+def set_replica_reads(enabled: bool):
+    """Enable or disable replica reads for the current context; returns a reset token."""
+    return _use_replica.set(enabled)
+
+
+def reset_replica_reads(token) -> None:
+    _use_replica.reset(token)
+
+
+@contextmanager
+def read_from_replica(enabled: bool = True):
+    """Route reads issued inside the block to the replica (when healthy)."""
+    token = set_replica_reads(enabled)
+    try:
+        yield
+    finally:
+        reset_replica_reads(token)
+
+
+def _sticky_key(user_id) -> str:
+    return f'db:sticky-primary:{user_id}'
+
+
+def mark_recent_write(user) -> None:
+    """Pin the user's reads to the primary for ``REPLICA_STICKY_SECONDS``."""
+    if user is None or not user.is_authenticated:
+        return
+    cache.set(_sticky_key(user.pk), True, timeout=settings.REPLICA_STICKY_SECONDS)
+
+
+def has_recent_write(user) -> bool:
+    if user is None or not user.is_authenticated:
+        return False
+    return bool(cache.get(_sticky_key(user.pk)))
+
+
+def _replica_lag_seconds(alias: str) -> float:
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0.0
+    with connection.cursor() as cursor:
+        # NULL on a primary (or a replica that has not replayed anything yet).
+        cursor.execute(
+            'SELECT COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)'
+        )
+        return float(cursor.fetchone()[0])
+
+
+def replica_is_healthy() -> bool:
+    """Return whether the replica is reachable and within the lag budget.
+
+    The result is cached per process for ``REPLICA_HEALTH_CHECK_SECONDS`` so
+    the probe costs one query every few seconds rather than one per request.
+    """
+    alias = replica_alias()
+    if alias is None:
+        return False
+
+    now = time.monotonic()
+    if now - _replica_health['checked_at'] < settings.REPLICA_HEALTH_CHECK_SECONDS:
+        return _replica_health['healthy']
+
+    try:
+        lag = _replica_lag_seconds(alias)
+        healthy = lag <= settings.REPLICA_MAX_LAG_SECONDS
+        if not healthy:
+            logger.warning('Replica %s is lagging by %.1fs; reading from primary.', alias, lag)
+    except DatabaseError:
+        logger.warning('Replica %s is unavailable; reading from primary.', alias, exc_info=True)
+        healthy = False
+
+    _replica_health.update(checked_at=now, healthy=healthy)
+    return healthy
+
+
+def reset_replica_health() -> None:
+    _replica_health.update(checked_at=0.0, healthy=False)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() and replica_is_healthy():
+            return replica_alias()
+        return PRIMARY_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != replica_alias()
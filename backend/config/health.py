@@ -0,0 +1,23 @@
+from django.db import DatabaseError, connection
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_safe
+
+
+@never_cache
+@require_safe
+def healthz(request):
+    """Liveness: the process is up and serving requests. Touches nothing else."""
+    return JsonResponse({'status': 'ok'})
+
+
+@never_cache
+@require_safe
+def readyz(request):
+    """Readiness: the primary database accepts queries."""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except DatabaseError:
+        return JsonResponse({'status': 'unavailable', 'database': 'error'}, status=503)
+    return JsonResponse({'status': 'ok', 'database': 'ok'})
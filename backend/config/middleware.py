@@ -1,3 +1,20 @@
+import gzip
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+
 class PermissionsPolicyMiddleware:
     """Adds a Permissions-Policy header.
 
@@ -13,3 +30,152 @@ class PermissionsPolicyMiddleware:
             "camera=(), microphone=(), geolocation=(), fullscreen=(self), payment=(), usb=()"
         )
         return response
+
+
+class _GzipStream:
+    def __init__(self, level):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def chunk(self, data):
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._obj.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level):
+        self._obj = brotli.Compressor(quality=level)
+
+    def chunk(self, data):
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self):
+        return self._obj.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def chunk(self, data):
+        return self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._obj.flush()
+
+
+def _available_codecs():
+    """Content-codings we can produce, in server preference order."""
+    codecs = {}
+    if zstandard is not None:
+        codecs['zstd'] = (lambda data: zstandard.ZstdCompressor(level=3).compress(data), lambda: _ZstdStream(3))
+    if brotli is not None:
+        codecs['br'] = (lambda data: brotli.compress(data, quality=4), lambda: _BrotliStream(4))
+    codecs['gzip'] = (lambda data: gzip.compress(data, compresslevel=6, mtime=0), lambda: _GzipStream(6))
+    return codecs
+
+
+def _accepted_codings(header):
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = q
+    return accepted
+
+
+class APICompressionMiddleware:
+    """Compresses API responses with zstd, brotli or gzip.
+
+    Only paths under ``API_COMPRESSION_PREFIX`` are considered, and buffered
+    bodies smaller than ``API_COMPRESSION_MIN_SIZE`` are left alone. zstd and
+    brotli are used when the ``zstandard``/``brotli`` packages are installed.
+    Event streams are never compressed so events are not held back.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.codecs = _available_codecs()
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not request.path.startswith(settings.API_COMPRESSION_PREFIX):
+            return response
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return response
+        if response.get('Content-Type', '').startswith('text/event-stream'):
+            return response
+        if not response.streaming and len(response.content) < settings.API_COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        coding = self._negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if coding is None:
+            return response
+        compress, stream_factory = self.codecs[coding]
+
+        if response.streaming:
+            response.streaming_content = self._compress_stream(response, stream_factory())
+            del response.headers['Content-Length']
+        else:
+            compressed = compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # The representation changed, so a strong ETag becomes weak (RFC 9110 8.8.1).
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = coding
+        return response
+
+    def _negotiate(self, header):
+        accepted = _accepted_codings(header)
+        wildcard = accepted.get('*', 0.0)
+        for coding in self.codecs:
+            if accepted.get(coding, wildcard) > 0:
+                return coding
+        return None
+
+    @staticmethod
+    def _compress_stream(response, stream):
+        content = response.streaming_content
+        if response.is_async:
+            async def compressed():
+                async for chunk in content:
+                    yield stream.chunk(chunk)
+                yield stream.finish()
+        else:
+            def compressed():
+                for chunk in content:
+                    yield stream.chunk(chunk)
+                yield stream.finish()
+        return compressed()
+
+
+class RateLimitHeadersMiddleware:
+    """Adds RateLimit-* headers for requests charged by TokenBucketThrottle."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        rate_limit = getattr(request, 'rate_limit', None)
+        if rate_limit:
+            response['RateLimit-Limit'] = str(rate_limit['limit'])
+            response['RateLimit-Remaining'] = str(rate_limit['remaining'])
+            response['RateLimit-Reset'] = str(rate_limit['reset'])
+            response['RateLimit-Policy'] = rate_limit['policy']
+        return response
@@ -0,0 +1,369 @@
+import hashlib
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import Count
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema
+from rest_framework import serializers
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import SearchFilter
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from apps.sync.changes import publish_upserts
+from config.db_router import has_recent_write, mark_recent_write, reset_replica_reads, set_replica_reads
+
+
+class ReplicaReadMixin:
+    """Serve safe-method requests from the read replica.
+
+    Users who wrote recently keep reading from the primary for a short window
+    so they always see their own changes (read-your-writes).
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # Authentication has run at this point, so the user is known.
+        use_replica = request.method in SAFE_METHODS and not has_recent_write(request.user)
+        self._replica_token = set_replica_reads(use_replica)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_replica_token', None)
+        if token is not None:
+            reset_replica_reads(token)
+            self._replica_token = None
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            mark_recent_write(request.user)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+@dataclass(frozen=True)
+class Facet:
+    """A filter parameter to count values for.
+
+    ``field`` is grouped on; ``label_field`` (optional) is a related field
+    returned as the label, e.g. ``bank__name`` for ``bank_id``.
+    """
+
+    param: str
+    field: str
+    label_field: str | None = None
+
+
+# Query params that do not change which rows match.
+NON_FILTER_PARAMS = {'page', 'page_size', 'ordering', 'format', 'include_archived'}
+
+
+class FacetsMixin:
+    """``GET <list>/facets/``: per-value counts for the viewset's ``facet_fields``.
+
+    Counts are disjunctive: each dimension is counted with every current
+    filter applied except its own, so the numbers show what selecting another
+    value would return. All dimensions come from a single grouped query over
+    the value combinations, which is then folded per dimension in Python.
+    Results are cached for ``FACETS_CACHE_SECONDS`` per filter signature.
+    """
+
+    facet_fields: tuple[Facet, ...] = ()
+
+    @extend_schema(filters=True, responses=OpenApiTypes.OBJECT, description='Per-value counts for the enum/FK filters.')
+    @action(detail=False, methods=['get'], pagination_class=None)
+    def facets(self, request):
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            if key not in NON_FILTER_PARAMS
+            for value in values
+        )
+        signature = hashlib.sha256(repr(params).encode()).hexdigest()[:32]
+        cache_key = f'facets:{self.basename}:{signature}'
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._compute_facets(request)
+            cache.set(cache_key, data, timeout=settings.FACETS_CACHE_SECONDS)
+        return Response(data)
+
+    def _compute_facets(self, request):
+        facet_params = {facet.param for facet in self.facet_fields}
+
+        full = self.filterset_class(data=request.query_params, queryset=self.get_queryset(), request=request)
+        if not full.is_valid():
+            raise ValidationError(full.errors)
+        selected = {
+            facet.param: full.form.cleaned_data.get(facet.param)
+            for facet in self.facet_fields
+        }
+
+        # Everything except the facet filters narrows the grouped query; the
+        # facet filters are applied per dimension below.
+        other_params = request.query_params.copy()
+        for param in facet_params:
+            other_params.pop(param, None)
+        queryset = SearchFilter().filter_queryset(request, self.get_queryset(), self)
+        queryset = self.filterset_class(data=other_params, queryset=queryset, request=request).qs
+
+        group_fields = [facet.field for facet in self.facet_fields]
+        label_fields = [facet.label_field for facet in self.facet_fields if facet.label_field]
+        rows = queryset.order_by().values(*group_fields, *label_fields).annotate(_count=Count('pk'))
+
+        counts = {facet.param: {} for facet in self.facet_fields}
+        labels = {facet.param: {} for facet in self.facet_fields}
+        for row in rows:
+            for facet in self.facet_fields:
+                matches_others = all(
+                    not selected[other.param] or row[other.field] in selected[other.param]
+                    for other in self.facet_fields
+                    if other is not facet
+                )
+                if not matches_others:
+                    continue
+                value = row[facet.field]
+                counts[facet.param][value] = counts[facet.param].get(value, 0) + row['_count']
+                if facet.label_field:
+                    labels[facet.param][value] = row[facet.label_field]
+
+        model = self.get_queryset().model
+        result = {}
+        for facet in self.facet_fields:
+            choices = model._meta.get_field(facet.field).choices
+            if choices:
+                # Enum dimensions list every choice, including zero counts.
+                result[facet.param] = [
+                    {'value': value, 'label': str(label), 'count': counts[facet.param].get(value, 0)}
+                    for value, label in choices
+                ]
+            else:
+                result[facet.param] = [
+                    {'value': value, 'label': labels[facet.param].get(value), 'count': count}
+                    for value, count in sorted(counts[facet.param].items(), key=lambda item: (-item[1], str(item[0])))
+                ]
+        return result
+
+
+class BatchFetchMixin:
+    """``GET <list>/batch/?ids=3,1,2``: several rows by id in one request and one query.
+
+    Results follow the order of ``ids`` (repeats dropped); ids that do not
+    exist are listed under ``missing``. The list queryset is used, so related
+    objects are joined exactly as in the list.
+    """
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                'ids', OpenApiTypes.STR, required=True,
+                description='Comma-separated ids, at most BATCH_MAX_IDS (default 500).',
+            ),
+        ],
+        responses=OpenApiTypes.OBJECT,
+    )
+    @action(detail=False, methods=['get'], pagination_class=None, filter_backends=[])
+    def batch(self, request):
+        ids = self.get_batch_ids(request)
+        if not ids:
+            raise ValidationError({'ids': ['This parameter is required.']})
+        if len(ids) > settings.BATCH_MAX_IDS:
+            raise ValidationError({'ids': [f'At most {settings.BATCH_MAX_IDS} ids per request.']})
+
+        found = {obj.pk: obj for obj in self.get_queryset().filter(pk__in=ids)}
+        serializer = self.get_serializer([found[pk] for pk in ids if pk in found], many=True)
+        return Response({'results': serializer.data, 'missing': [pk for pk in ids if pk not in found]})
+
+    def get_batch_ids(self, request) -> list[int]:
+        """The requested ids in order, without repeats or empty values."""
+        try:
+            return list(dict.fromkeys(int(value) for value in request.query_params.get('ids', '').split(',') if value))
+        except ValueError:
+            raise ValidationError({'ids': ['Provide a comma-separated list of integer ids.']}) from None
+
+    def get_throttle_rows(self, request) -> int | None:
+        # Read by config.throttling: batch calls are charged per distinct id.
+        if self.action != 'batch':
+            parent = getattr(super(), 'get_throttle_rows', None)
+            return parent(request) if parent else None
+        try:
+            return len(self.get_batch_ids(request))
+        except ValidationError:
+            return None
+
+
+class AutocompleteMixin:
+    """``GET <list>/autocomplete/?q=``: a few ``autocomplete_values`` rows matching ``q``.
+
+    Prefix matches on ``autocomplete_field`` come first, then (for ``q`` of
+    three or more characters) substring matches. Neither query has an ORDER BY,
+    so each stops after ``limit`` rows of an index scan: a ``text_pattern_ops``
+    index for the prefix and a ``pg_trgm`` GIN index for the substring, both
+    on ``UPPER(field)`` to match Django's ``istartswith``/``icontains`` SQL
+    (declared in the models' ``Meta.indexes``). The few rows returned
+    are sorted in Python. Responses are cached for
+    ``AUTOCOMPLETE_CACHE_SECONDS``.
+    """
+
+    autocomplete_field = ''
+    autocomplete_values: tuple[str, ...] = ()
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('q', OpenApiTypes.STR, required=True, description='Text to complete.'),
+            OpenApiParameter('limit', OpenApiTypes.INT, description='At most AUTOCOMPLETE_LIMIT (default 10).'),
+        ],
+        responses=OpenApiTypes.OBJECT,
+    )
+    @action(detail=False, methods=['get'], pagination_class=None, filter_backends=[])
+    def autocomplete(self, request):
+        query = ' '.join(request.query_params.get('q', '').split())
+        if not query:
+            raise ValidationError({'q': ['This parameter is required.']})
+        try:
+            limit = min(int(request.query_params.get('limit', settings.AUTOCOMPLETE_LIMIT)), settings.AUTOCOMPLETE_LIMIT)
+        except ValueError:
+            raise ValidationError({'limit': ['A valid integer is required.']}) from None
+        limit = max(limit, 1)
+
+        digest = hashlib.sha256(query.casefold().encode()).hexdigest()[:32]
+        cache_key = f'autocomplete:{self.basename}:{digest}:{limit}'
+        results = cache.get(cache_key)
+        if results is None:
+            results = self._complete(query, limit)
+            cache.set(cache_key, results, timeout=settings.AUTOCOMPLETE_CACHE_SECONDS)
+        return Response(results)
+
+    def _complete(self, query: str, limit: int) -> list[dict]:
+        field = self.autocomplete_field
+        rows = self.get_queryset().model.objects.values(*self.autocomplete_values)
+        prefix = list(rows.filter(**{f'{field}__istartswith': query})[:limit])
+        matches = sorted(prefix, key=lambda row: (row[field].casefold(), row['id']))
+        if len(matches) < limit and len(query) >= 3:
+            seen = {row['id'] for row in matches}
+            others = rows.filter(**{f'{field}__icontains': query}).exclude(id__in=seen)[:limit - len(matches)]
+            matches += sorted(others, key=lambda row: (row[field].casefold(), row['id']))
+        return matches
+
+
+class BulkSelectionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    changes = serializers.DictField(required=False)
+
+
+def violation(queryset, message: str) -> str | None:
+    """``message`` with the count and a few ids of ``queryset``'s rows, or ``None`` if it is empty."""
+    sample = list(queryset.order_by('pk').values_list('pk', flat=True)[:5])
+    if not sample:
+        return None
+    count = queryset.count()
+    return f"{count} selected row(s) {message} (e.g. ids {', '.join(map(str, sample))})."
+
+
+class BulkMixin:
+    """``PATCH``/``DELETE <list>/bulk/``: change or delete many rows at once.
+
+    Rows are selected by ``ids`` in the body, by the list's filter and search
+    query params, or both. One of them is required, so a bare call never
+    touches the whole table. ``changes`` may only name ``bulk_update_fields``.
+    It is validated with the viewset's serializer, then
+    ``validate_bulk_update`` checks cross-row invariants with queries before
+    anything is written. Writes go out as one statement per
+    ``BULK_CHUNK_SIZE`` ids, all in one transaction.
+    """
+
+    bulk_update_fields: tuple[str, ...] = ()
+
+    @extend_schema(
+        filters=True,
+        request=BulkSelectionSerializer,
+        responses=OpenApiTypes.OBJECT,
+        description='Update (PATCH) or delete (DELETE) the rows selected by ids and/or filters.',
+    )
+    @action(detail=False, methods=['patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        selection = BulkSelectionSerializer(data=request.data)
+        selection.is_valid(raise_exception=True)
+        queryset = self._bulk_queryset(request, selection.validated_data.get('ids'))
+        changes = None if request.method == 'DELETE' else self._bulk_changes(selection.validated_data.get('changes'))
+        model = queryset.model
+        using = router.db_for_write(model)
+
+        with transaction.atomic(using=using):
+            if changes is not None:
+                self.validate_bulk_update(queryset, changes)
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+            size = settings.BULK_CHUNK_SIZE
+            chunks = [ids[start:start + size] for start in range(0, len(ids), size)]
+
+            if changes is None:
+                deleted = {}
+                for chunk in chunks:
+                    for label, count in self.perform_bulk_delete(model.objects.filter(pk__in=chunk), using).items():
+                        deleted[label] = deleted.get(label, 0) + count
+                return Response({'matched': len(ids), 'deleted': deleted})
+
+            updated, now = 0, timezone.now()
+            for chunk in chunks:
+                updated += self.perform_bulk_update(model.objects.filter(pk__in=chunk), changes, now, using)
+                # QuerySet.update() sends no post_save, so announce the rows here.
+                publish_upserts(model, chunk, now, using)
+        return Response({'matched': len(ids), 'updated': updated})
+
+    def _bulk_queryset(self, request, ids):
+        if not ids and not self._has_filters(request):
+            raise ValidationError({'ids': ['Select rows with ids or with filter parameters.']})
+        queryset = self.filter_queryset(self.get_queryset())
+        if ids:
+            queryset = queryset.filter(pk__in=ids)
+        return queryset
+
+    def _has_filters(self, request) -> bool:
+        # Only parameters the filterset or search understands count; a typo
+        # must not widen the selection to the whole table.
+        if request.query_params.get(api_settings.SEARCH_PARAM):
+            return True
+        filterset = self.filterset_class(data=request.query_params, queryset=self.get_queryset(), request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        return any(value not in (None, '', [], ()) for value in filterset.form.cleaned_data.values())
+
+    def _bulk_changes(self, changes):
+        if not changes:
+            raise ValidationError({'changes': ['Provide at least one field to change.']})
+        unknown = sorted(set(changes) - set(self.bulk_update_fields))
+        if unknown:
+            raise ValidationError(
+                {'changes': [f"Cannot bulk update {', '.join(unknown)}; allowed: {', '.join(self.bulk_update_fields)}."]}
+            )
+        serializer = self.get_serializer(data=changes, partial=True)
+        if not serializer.is_valid():
+            raise ValidationError({'changes': serializer.errors})
+        return serializer.validated_data
+
+    def get_throttle_rows(self, request) -> int | None:
+        # Read by config.throttling: bulk calls are charged per selected row.
+        if self.action != 'bulk':
+            return None
+        selection = BulkSelectionSerializer(data=request.data)
+        if not selection.is_valid():
+            return None
+        ids = selection.validated_data.get('ids')
+        try:
+            if ids and not self._has_filters(request):
+                return len(set(ids))
+            return self._bulk_queryset(request, ids).count()
+        except ValidationError:
+            return None
+
+    def validate_bulk_update(self, queryset, changes) -> None:
+        """Raise ``ValidationError`` if ``changes`` would break an invariant for any selected row."""
+
+    def perform_bulk_update(self, queryset, changes, now, using) -> int:
+        # update() skips auto_now, so updated_at is set explicitly.
+        return queryset.update(**changes, updated_at=now)
+
+    def perform_bulk_delete(self, queryset, using) -> dict:
+        """Delete one chunk; returns deleted row counts per model label."""
+        _total, per_model = queryset.delete()
+        return per_model
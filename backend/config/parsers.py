@@ -0,0 +1,22 @@
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class ORJSONParser(JSONParser):
+    """Drop-in ``JSONParser`` using orjson (which, like strict mode, rejects NaN/Infinity)."""
+
+    def __init__(self):
+        if orjson is None:
+            raise ImproperlyConfigured('ORJSONParser requires the "orjson" package.')
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,41 @@
+"""orjson-backed JSON renderer with byte-identical output to DRF's JSONRenderer.
+
+Values orjson cannot handle natively (``Decimal``, lazy translation strings,
+datetimes, querysets, ...) go through DRF's own ``JSONEncoder.default`` so
+they format exactly as before. Pretty-printed (``indent``) responses and
+anything orjson rejects fall back to the stdlib renderer.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    def __init__(self):
+        if orjson is None:
+            raise ImproperlyConfigured('ORJSONRenderer requires the "orjson" package.')
+        self.options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        self._default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not self.compact or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self._default, option=self.options)
+        except (orjson.JSONEncodeError, ValueError):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Match JSONRenderer: keep output a strict JavaScript subset.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class ORJSONOptInRenderer(ORJSONRenderer):
+    """Chosen only when the client asks with ``Accept: application/json; encoder=orjson``."""
+
+    media_type = 'application/json; encoder=orjson'
+    format = 'orjson'
@@ -0,0 +1,73 @@
+"""OpenAPI schema served from memory instead of regenerated per request.
+
+The document is loaded from ``OPENAPI_SCHEMA_FILE`` (written at image build
+time with ``manage.py spectacular --file``) or, failing that, generated once
+per process. Rendered bytes are cached per media type and served with an
+``ETag``, so repeated fetches cost a dictionary lookup or a 304.
+"""
+import hashlib
+import threading
+from pathlib import Path
+
+import yaml
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import translation
+from drf_spectacular.views import SpectacularAPIView
+
+_schemas: dict = {}
+_rendered: dict = {}
+_lock = threading.Lock()
+
+
+def clear_schema_cache() -> None:
+    with _lock:
+        _schemas.clear()
+        _rendered.clear()
+
+
+def _load_schema_file():
+    path = getattr(settings, 'OPENAPI_SCHEMA_FILE', None)
+    if path and Path(path).is_file():
+        with open(path, encoding='utf-8') as fh:
+            return yaml.safe_load(fh)
+    return None
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    def _get_schema_response(self, request):
+        version = self.api_version or request.version or self._get_version_parameter(request)
+        key = (version, translation.get_language())
+
+        schema = _schemas.get(key)
+        if schema is None:
+            with _lock:
+                schema = _schemas.get(key)
+                if schema is None:
+                    schema = _load_schema_file()
+                    if schema is None:
+                        generator = self.generator_class(
+                            urlconf=self.urlconf, api_version=version, patterns=self.patterns,
+                        )
+                        schema = generator.get_schema(request=request, public=self.serve_public)
+                    _schemas[key] = schema
+
+        renderer, media_type = self.perform_content_negotiation(request)
+        rendered_key = (key, media_type)
+        cached = _rendered.get(rendered_key)
+        if cached is None:
+            body = renderer.render(schema, media_type, {'request': request, 'view': self})
+            etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+            cached = _rendered[rendered_key] = (body, etag)
+        body, etag = cached
+
+        if etag in request.headers.get('If-None-Match', ''):
+            response = HttpResponseNotModified()
+        else:
+            content_type = f'{media_type}; charset={renderer.charset}' if renderer.charset else media_type
+            response = HttpResponse(body, content_type=content_type)
+            response['Content-Disposition'] = f'inline; filename="{self._get_filename(request, version)}"'
+        response['ETag'] = etag
+        response['Vary'] = 'Accept'
+        response['Cache-Control'] = 'public, max-age=300'
+        return response
@@ -4,6 +4,8 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 BASE_DIR = Path(__file__).resolve().parents[2]
 
 SECRET_KEY = os.getenv('DJANGO_SECRET_KEY', 'dev-insecure-secret-key')
@@ -22,6 +24,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Third-party
     'rest_framework',
@@ -31,9 +34,11 @@ INSTALLED_APPS = [
     'csp',
 
     # Local apps
+    'apps.core',
     'apps.banks',
     'apps.clients',
     'apps.credits',
+    'apps.sync',
 
     # cors header
     'corsheaders'
@@ -42,6 +47,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'config.middleware.APICompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -52,12 +58,17 @@ MIDDLEWARE = [
     # Security headers
     'csp.middleware.CSPMiddleware',
     'config.middleware.PermissionsPolicyMiddleware',
+    'config.middleware.RateLimitHeadersMiddleware',
 
     # corsheader middleward
     'corsheaders.middleware.CorsMiddleware',
 
 ]
 
+# API response compression (config.middleware.APICompressionMiddleware)
+API_COMPRESSION_PREFIX = '/v1/'
+API_COMPRESSION_MIN_SIZE = int(os.getenv('API_COMPRESSION_MIN_SIZE', '1024'))
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -93,6 +104,48 @@ DATABASES = {
     }
 }
 
+# Cache: Redis when REDIS_URL is set so workers share throttle buckets,
+# facet counts and read-your-writes markers; per-process memory otherwise.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
+THROTTLE_CACHE_ALIAS = 'default'
+
+# Optional read replica. When POSTGRES_REPLICA_HOST is set, safe-method API
+# reads are routed there (see config.db_router); tests mirror it to default.
+DATABASE_REPLICA_ALIAS = 'replica'
+if os.getenv('POSTGRES_REPLICA_HOST'):
+    # Read-your-writes markers live in the cache; a per-process cache would
+    # let a write on one worker miss the next read on another.
+    if not REDIS_URL:
+        raise ImproperlyConfigured('POSTGRES_REPLICA_HOST requires REDIS_URL so all workers share read-your-writes markers.')
+    DATABASES[DATABASE_REPLICA_ALIAS] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('POSTGRES_REPLICA_HOST'),
+        'PORT': os.getenv('POSTGRES_REPLICA_PORT', DATABASES['default']['PORT']),
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    }
+
+DATABASE_ROUTERS = ['config.db_router.PrimaryReplicaRouter']
+# Read-your-writes window after a user writes, in seconds.
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '5'))
+# Fall back to the primary when replay lag exceeds this many seconds.
+REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', '2'))
+REPLICA_HEALTH_CHECK_SECONDS = float(os.getenv('REPLICA_HEALTH_CHECK_SECONDS', '5'))
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -127,8 +180,77 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # Token buckets per client (config.throttling); "expensive" list/search
+    # calls cost ceil(page_size / PAGE_SIZE) tokens, "bulk" calls
+    # ceil(selected rows / BULK_CHUNK_SIZE).
+    'DEFAULT_THROTTLE_CLASSES': (
+        'config.throttling.TokenBucketThrottle',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'read': os.getenv('THROTTLE_READ_RATE', '600/min'),
+        'expensive': os.getenv('THROTTLE_EXPENSIVE_RATE', '120/min'),
+        'write': os.getenv('THROTTLE_WRITE_RATE', '60/min'),
+        'bulk': os.getenv('THROTTLE_BULK_RATE', '20/min'),
+    },
 }
 
+# orjson-based JSON rendering/parsing (config.renderers / config.parsers).
+# When off, clients can still opt in per request with
+# "Accept: application/json; encoder=orjson".
+API_FAST_JSON = os.getenv('API_FAST_JSON', '0') == '1'
+if API_FAST_JSON:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = (
+        'config.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    )
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = (
+        'config.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    )
+else:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = (
+        'config.renderers.ORJSONOptInRenderer',
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    )
+
+# Facet counts (<resource>/facets/) cache lifetime per filter signature.
+FACETS_CACHE_SECONDS = int(os.getenv('FACETS_CACHE_SECONDS', '30'))
+
+# Monthly credit partitions kept ahead of time (manage.py credit_partitions ensure).
+CREDIT_PARTITION_MONTHS_AHEAD = int(os.getenv('CREDIT_PARTITION_MONTHS_AHEAD', '3'))
+
+# Credits older than this move to the archive table (manage.py archive_credits).
+CREDIT_ARCHIVE_AFTER_DAYS = int(os.getenv('CREDIT_ARCHIVE_AFTER_DAYS', '730'))
+CREDIT_ARCHIVE_BATCH_SIZE = int(os.getenv('CREDIT_ARCHIVE_BATCH_SIZE', '1000'))
+
+# Client id ranges the nightly exposure report is split into (manage.py exposure_report).
+EXPOSURE_REPORT_PARTITIONS = int(os.getenv('EXPOSURE_REPORT_PARTITIONS', '64'))
+
+# <list>/autocomplete/: result cap and cache lifetime per query.
+AUTOCOMPLETE_LIMIT = int(os.getenv('AUTOCOMPLETE_LIMIT', '10'))
+AUTOCOMPLETE_CACHE_SECONDS = int(os.getenv('AUTOCOMPLETE_CACHE_SECONDS', '30'))
+
+# Largest ?ids= list accepted by <list>/batch/.
+BATCH_MAX_IDS = int(os.getenv('BATCH_MAX_IDS', '500'))
+
+# Rows per UPDATE/DELETE statement in <list>/bulk/ actions.
+BULK_CHUNK_SIZE = int(os.getenv('BULK_CHUNK_SIZE', '1000'))
+
+# Incremental sync feed (/v1/changes/)
+SYNC_PAGE_SIZE = 500
+SYNC_MAX_PAGE_SIZE = 5000
+# Changes newer than this are held back until in-flight transactions settle.
+SYNC_SETTLE_SECONDS = float(os.getenv('SYNC_SETTLE_SECONDS', '2'))
+
+# Live change events (/v1/events/, served under ASGI only)
+EVENTS_CHANNEL = 'tu_credito_changes'
+EVENTS_QUEUE_SIZE = 256
+EVENTS_HEARTBEAT_SECONDS = 15
+EVENTS_RETRY_MS = 3000
+EVENTS_RECONNECT_SECONDS = 2
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=int(os.getenv('JWT_ACCESS_MINUTES', '60'))),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=int(os.getenv('JWT_REFRESH_DAYS', '7'))),
@@ -144,6 +266,10 @@ SPECTACULAR_SETTINGS = {
     },
 }
 
+# Pre-generated OpenAPI document (written by the Dockerfile). When unset, the
+# schema is generated once per process and kept in memory.
+OPENAPI_SCHEMA_FILE = os.getenv('OPENAPI_SCHEMA_FILE')
+
 # Email (console by default)
 EMAIL_BACKEND = os.getenv('DJANGO_EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'no-reply@tu-credito.local')
@@ -0,0 +1,156 @@
+"""Token-bucket request throttling.
+
+Every request is charged against one of four budgets per client (user id,
+or IP for anonymous requests):
+
+- ``read``: cheap safe-method calls (detail views, schema, ...);
+- ``expensive``: list, search, facet, batch and sync calls, weighted by the
+  requested page size (or the row count a view reports through
+  ``get_throttle_rows``: distinct batch ids, the sync ``limit``) relative to
+  ``PAGE_SIZE``;
+- ``bulk``: ``PATCH``/``DELETE <list>/bulk/``, one token per
+  ``BULK_CHUNK_SIZE`` selected rows (reported through ``get_throttle_rows``);
+- ``write``: everything else.
+
+Buckets live in the ``THROTTLE_CACHE_ALIAS`` cache (Redis when configured) so
+all workers share them. Each debit is atomic: a Lua script on Redis, a
+process lock for local-memory caches. If that cache fails, each process
+falls back to its own local-memory buckets rather than letting requests
+through unthrottled.
+"""
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+EXPENSIVE_ACTIONS = {'list', 'facets', 'batch'}
+BULK_ACTIONS = {'bulk'}
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+_local_fallback = LocMemCache('throttle-fallback', {})
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """``'120/min'`` -> ``(120, 60)``."""
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    def __init__(self):
+        self.rates = api_settings.DEFAULT_THROTTLE_RATES
+        self.wait_seconds = None
+
+    def get_scope(self, request, view) -> str:
+        if request.method not in SAFE_METHODS:
+            return 'bulk' if getattr(view, 'action', None) in BULK_ACTIONS else 'write'
+        if getattr(view, 'action', None) in EXPENSIVE_ACTIONS or getattr(view, 'throttle_expensive', False):
+            return 'expensive'
+        return 'read'
+
+    def get_cost(self, request, view, scope: str) -> int:
+        if scope not in ('expensive', 'bulk'):
+            return 1
+        requested = view.get_throttle_rows(request) if hasattr(view, 'get_throttle_rows') else None
+        if scope == 'bulk':
+            return max(1, math.ceil((requested or 0) / settings.BULK_CHUNK_SIZE))
+        page_size = api_settings.PAGE_SIZE or 1
+        if requested is None:
+            try:
+                requested = int(request.query_params.get('page_size', page_size))
+            except ValueError:
+                requested = page_size
+        return max(1, math.ceil(requested / page_size))
+
+    def allow_request(self, request, view):
+        scope = self.get_scope(request, view)
+        rate = self.rates.get(scope)
+        if rate is None:
+            return True
+        capacity, period = parse_rate(rate)
+        refill_per_second = capacity / period
+        cost = min(self.get_cost(request, view, scope), capacity)
+        key = f'throttle:{scope}:{self.get_ident_key(request)}'
+
+        allowed, tokens = debit(key, capacity, period, cost, time.time())
+        self.wait_seconds = None if allowed else (cost - tokens) / refill_per_second
+
+        # Picked up by config.middleware.RateLimitHeadersMiddleware.
+        request._request.rate_limit = {
+            'limit': capacity,
+            'remaining': int(tokens),
+            'reset': math.ceil((capacity - tokens) / refill_per_second),
+            'policy': f'{capacity};w={period};scope={scope}',
+        }
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+    def get_ident_key(self, request):
+        if request.user and request.user.is_authenticated:
+            return f'user:{request.user.pk}'
+        return f'ip:{self.get_ident(request)}'
+
+
+# Refill, check and debit in one step so concurrent requests from the same
+# client cannot all spend the same tokens.
+_REDIS_DEBIT = """
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local capacity, refill, cost, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * refill)
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return {allowed, tostring(tokens)}
+"""
+
+# Local-memory caches are per process, so a process-wide lock makes their
+# read-modify-write atomic.
+_local_lock = threading.Lock()
+
+
+def debit(key: str, capacity: int, period: int, cost: int, now: float) -> tuple[bool, float]:
+    """Take ``cost`` tokens from the bucket at ``key``; returns (allowed, tokens left)."""
+    cache = caches[settings.THROTTLE_CACHE_ALIAS]
+    try:
+        if isinstance(cache, RedisCache):
+            return _redis_debit(cache, key, capacity, period, cost, now)
+        return _local_debit(cache, key, capacity, period, cost, now)
+    except Exception:
+        logger.warning('Throttle cache unavailable; using local buckets.', exc_info=True)
+        return _local_debit(_local_fallback, key, capacity, period, cost, now)
+
+
+def _redis_debit(cache, key, capacity, period, cost, now):
+    redis_key = cache.make_and_validate_key(key)
+    client = cache._cache.get_client(redis_key, write=True)
+    allowed, tokens = client.eval(_REDIS_DEBIT, 1, redis_key, capacity, capacity / period, cost, now, period)
+    return bool(allowed), float(tokens)
+
+
+def _local_debit(cache, key, capacity, period, cost, now):
+    with _local_lock:
+        tokens, updated = cache.get(key) or (capacity, now)
+        tokens = min(capacity, tokens + max(0.0, now - updated) * capacity / period)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        cache.set(key, (tokens, now), timeout=period)
+    return allowed, tokens
@@ -2,20 +2,25 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 
+from config.health import healthz, readyz
+
 urlpatterns = [
+    path("healthz", healthz, name="healthz"),
+    path("readyz", readyz, name="readyz"),
     path("admin/", admin.site.urls),
     path("v1/", include("config.v1_urls")),
 ]
 
 if settings.DEBUG:
     from drf_spectacular.views import (
-        SpectacularAPIView,
         SpectacularSwaggerView,
         SpectacularRedocView,
     )
 
+    from config.schema import CachedSpectacularAPIView
+
     urlpatterns += [
-        path("v1/schema/", SpectacularAPIView.as_view(), name="schema"),
+        path("v1/schema/", CachedSpectacularAPIView.as_view(), name="schema"),
         path("v1/docs/", SpectacularSwaggerView.as_view(url_name="schema")),
         path("v1/redoc/", SpectacularRedocView.as_view(url_name="schema")),
     ]
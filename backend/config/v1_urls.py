@@ -1,21 +1,25 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework.permissions import AllowAny
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from drf_spectacular.views import SpectacularSwaggerView, SpectacularRedocView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from apps.banks.api.viewsets import BankViewSet
 from apps.clients.api.viewsets import ClientViewSet
 from apps.credits.api.viewsets import CreditViewSet
+from apps.sync.api.views import event_stream
+from apps.sync.api.viewsets import ChangesViewSet
+from config.schema import CachedSpectacularAPIView
 
 router = DefaultRouter()
 router.register(r'banks', BankViewSet, basename='bank')
 router.register(r'clients', ClientViewSet, basename='client')
 router.register(r'credits', CreditViewSet, basename='credit')
+router.register(r'changes', ChangesViewSet, basename='changes')
 
 urlpatterns = [
     # OpenAPI schema + Swagger UI
-    path('schema/', SpectacularAPIView.as_view(permission_classes=[AllowAny]), name='schema'),
+    path('schema/', CachedSpectacularAPIView.as_view(permission_classes=[AllowAny]), name='schema'),
     path('docs/', SpectacularSwaggerView.as_view(url_name='schema', permission_classes=[AllowAny]), name='swagger-ui'),
     path('redoc/', SpectacularRedocView.as_view(url_name='schema', permission_classes=[AllowAny]), name='redoc'),
 
@@ -23,6 +27,9 @@ urlpatterns = [
     path('auth/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
 
+    # Live change events (server-sent events)
+    path('events/', event_stream, name='events'),
+
     # API
     path('', include(router.urls)),
 ]
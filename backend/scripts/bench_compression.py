@@ -0,0 +1,42 @@
+"""Measure bytes and latency saved by APICompressionMiddleware on credit list pages.
+
+Latency saved = transfer time of the bytes saved at ``--mbps`` minus the time
+spent compressing. Codecs whose packages are not installed are skipped.
+
+    python scripts/bench_compression.py --page-size 20 100 --mbps 10 50
+"""
+import argparse
+import timeit
+
+from bench_json_renderer import build_page  # also sets up Django
+
+from config.middleware import _available_codecs  # noqa: E402
+from config.renderers import ORJSONRenderer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--page-size', type=int, nargs='+', default=[20, 100, 1000])
+    parser.add_argument('--mbps', type=float, nargs='+', default=[10.0, 50.0])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    codecs = _available_codecs()
+    header = f"{'page_size':>9}  {'coding':<6} {'bytes':>8} {'ratio':>6} {'compress_ms':>11}"
+    header += ''.join(f" {f'saved@{m:g}Mbps_ms':>18}" for m in args.mbps)
+    print(header)
+    for page_size in args.page_size:
+        body = ORJSONRenderer().render(build_page(page_size))
+        print(f"{page_size:>9}  {'none':<6} {len(body):>8} {1.0:>6.2f} {0.0:>11.2f}")
+        for coding, (compress, _stream) in codecs.items():
+            compressed = compress(body)
+            seconds = min(timeit.repeat(lambda: compress(body), number=args.repeat, repeat=3)) / args.repeat
+            row = f'{page_size:>9}  {coding:<6} {len(compressed):>8} {len(body) / len(compressed):>6.2f} {seconds * 1e3:>11.2f}'
+            for mbps in args.mbps:
+                saved = (len(body) - len(compressed)) * 8 / (mbps * 1e6) - seconds
+                row += f' {saved * 1e3:>18.2f}'
+            print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare DRF's JSONRenderer with ORJSONRenderer on CreditViewSet list pages.
+
+Builds paginated credit list payloads through ``CreditSerializer`` (unsaved
+model instances, so no database is needed) and times rendering them.
+
+    python scripts/bench_json_renderer.py --page-size 100 --repeat 200
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.banks.models import Bank  # noqa: E402
+from apps.clients.models import Client  # noqa: E402
+from apps.credits.api.serializers import CreditSerializer  # noqa: E402
+from apps.credits.models import Credit  # noqa: E402
+from config.renderers import ORJSONRenderer  # noqa: E402
+
+
+def build_page(page_size: int) -> dict:
+    bank = Bank(id=1, name='Banco Benchmark', bank_type=Bank.BankType.PRIVATE)
+    client = Client(id=1, full_name='José Benchmark', date_of_birth=date(1990, 1, 1), email='b@example.com', bank=bank)
+    stamp = datetime(2026, 1, 19, 13, 36, 12, 345678, tzinfo=timezone.utc)
+    credits = [
+        Credit(
+            id=i, client=client, bank=bank, description=f'Crédito #{i}',
+            min_payment=Decimal('1250.50') + i, max_payment=Decimal('98000.75') + i,
+            term_months=12 + i % 48, credit_type=Credit.CreditType.MORTGAGE,
+            created_at=stamp, updated_at=stamp,
+        )
+        for i in range(page_size)
+    ]
+    return {'count': page_size * 10, 'next': None, 'previous': None, 'results': CreditSerializer(credits, many=True).data}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--page-size', type=int, nargs='+', default=[20, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    renderers = {'stdlib json': JSONRenderer(), 'orjson': ORJSONRenderer()}
+    print(f"{'page_size':>9}  {'renderer':<12} {'bytes':>8} {'us/page':>10} {'speedup':>8}")
+    for page_size in args.page_size:
+        page = build_page(page_size)
+        outputs = {name: r.render(page, 'application/json') for name, r in renderers.items()}
+        assert len(set(outputs.values())) == 1, 'renderers disagree'
+        baseline = None
+        for name, renderer in renderers.items():
+            seconds = min(timeit.repeat(lambda: renderer.render(page, 'application/json'), number=args.repeat, repeat=3))
+            per_page = seconds / args.repeat * 1e6
+            baseline = baseline or per_page
+            print(f'{page_size:>9}  {name:<12} {len(outputs[name]):>8} {per_page:>10.1f} {baseline / per_page:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,29 +3,25 @@ set -e
 
 export DJANGO_SETTINGS_MODULE=${DJANGO_SETTINGS_MODULE:-config.settings.dev}
 
-python manage.py migrate --noinput
-
-# Create a default admin user for review if it doesn't exist.
-DJANGO_SUPERUSER_USERNAME=${DJANGO_SUPERUSER_USERNAME:-admin}
-DJANGO_SUPERUSER_PASSWORD=${DJANGO_SUPERUSER_PASSWORD:-admin12345}
-DJANGO_SUPERUSER_EMAIL=${DJANGO_SUPERUSER_EMAIL:-admin@example.com}
-
-python manage.py shell <<'PY'
-from django.contrib.auth.models import User
-import os
-
-username = os.getenv("DJANGO_SUPERUSER_USERNAME")
-password = os.getenv("DJANGO_SUPERUSER_PASSWORD")
-email = os.getenv("DJANGO_SUPERUSER_EMAIL")
-
-user, created = User.objects.get_or_create(username=username, defaults={"email": email})
-if created:
-    user.set_password(password)
-    user.is_superuser = True
-    user.is_staff = True
-    user.save()
-
-print("Default admin ready:", username)
-PY
-
-exec gunicorn config.wsgi:application --bind 0.0.0.0:8001 --workers 2 --timeout 60
+# Default admin user for review; created by the bootstrap step if missing.
+export DJANGO_SUPERUSER_USERNAME=${DJANGO_SUPERUSER_USERNAME:-admin}
+export DJANGO_SUPERUSER_PASSWORD=${DJANGO_SUPERUSER_PASSWORD:-admin12345}
+export DJANGO_SUPERUSER_EMAIL=${DJANGO_SUPERUSER_EMAIL:-admin@example.com}
+
+# Migrations and the default admin run inside the gunicorn master (see
+# gunicorn.conf.py) so Django boots once per container start.
+export DJANGO_BOOTSTRAP=${DJANGO_BOOTSTRAP:-1}
+
+# DJANGO_IMPORT_PROFILE=1 prints per-module import times to stderr
+# (python -X importtime) to find slow imports during boot.
+if [ "${DJANGO_IMPORT_PROFILE:-0}" = "1" ]; then
+  export PYTHONPROFILEIMPORTTIME=1
+fi
+
+# DJANGO_ASGI=1 serves the app through uvicorn workers, which is required for
+# the /v1/events/ server-sent event stream.
+if [ "${DJANGO_ASGI:-0}" = "1" ]; then
+  exec gunicorn config.asgi:application -c gunicorn.conf.py -k uvicorn_worker.UvicornWorker
+fi
+
+exec gunicorn config.wsgi:application -c gunicorn.conf.py
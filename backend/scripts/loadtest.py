@@ -0,0 +1,367 @@
+"""Replay a mix of API traffic against a running server and report latency per endpoint.
+
+``seed`` fills the local database (through Django, like the other scripts)
+with banks, clients, credits and load-test users. ``run`` only talks HTTP,
+so it can target any deployment: each worker thread logs in through
+``/v1/auth/token/`` and sends a weighted mix of list, filter, search, create
+and update requests until ``--duration`` runs out.
+
+    python scripts/loadtest.py seed --banks 50 --clients 5000 --credits 50000
+    python scripts/loadtest.py run --base-url http://localhost:8001 --concurrency 16 --duration 60 --json run.json
+    python scripts/loadtest.py run ... --compare run.json
+
+Start the server with throttle rates above the planned load (see README),
+otherwise most calls are answered with 429 and measure the throttle.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+PASSWORD = 'loadtest12345'
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+DEFAULT_PAGE_SIZE = 20  # REST_FRAMEWORK['PAGE_SIZE']
+SEARCH_TERMS = ('ana', 'mar', 'jos', 'car', 'lu', 'credit', 'bank')
+
+# name -> weight; roughly what the frontend sends while people browse and edit.
+MIX = {
+    'credits:list': 20,
+    'credits:filter': 15,
+    'credits:search': 10,
+    'credits:create': 4,
+    'credits:update': 4,
+    'clients:list': 12,
+    'clients:filter': 8,
+    'clients:search': 8,
+    'clients:create': 3,
+    'clients:update': 3,
+    'banks:list': 6,
+    'banks:filter': 3,
+    'banks:search': 3,
+    'banks:update': 1,
+}
+
+
+def seed(args) -> None:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+    import django
+
+    django.setup()
+    from decimal import Decimal
+
+    from django.contrib.auth import get_user_model
+    from django.db import transaction
+
+    from apps.banks.models import Bank
+    from apps.clients.models import Client
+    from apps.credits.counters import repair_banks, repair_clients
+    from apps.credits.models import Credit
+
+    rng = random.Random(args.random_seed)
+    names = ('Ana', 'Mario', 'José', 'Carla', 'Lucía', 'Pedro', 'Marta', 'Carlos', 'Luis', 'Sofía')
+    surnames = ('García', 'Martínez', 'López', 'Sánchez', 'Pérez', 'Gómez', 'Díaz', 'Ruiz')
+    prefix = uuid.uuid4().hex[:6]
+
+    User = get_user_model()
+    for i in range(1, args.users + 1):
+        user, created = User.objects.get_or_create(username=f'loadtest{i}')
+        if created:
+            user.set_password(args.password)
+            user.save(update_fields=['password'])
+
+    with transaction.atomic():
+        banks = Bank.objects.bulk_create(
+            Bank(name=f'Load Bank {prefix}-{i}', bank_type=rng.choice(Bank.BankType.values), address=f'Street {i}')
+            for i in range(args.banks)
+        )
+        clients = Client.objects.bulk_create(
+            (
+                Client(
+                    full_name=f'{rng.choice(names)} {rng.choice(surnames)} {i}',
+                    date_of_birth=date(rng.randint(1950, 2004), rng.randint(1, 12), rng.randint(1, 28)),
+                    email=f'client{prefix}{i}@example.com',
+                    person_type=rng.choice(Client.PersonType.values),
+                    bank=rng.choice(banks),
+                )
+                for i in range(args.clients)
+            ),
+            batch_size=args.batch_size,
+        )
+        credits = (
+            Credit(
+                client=client, bank_id=client.bank_id, description=f'Credit {i}',
+                min_payment=Decimal(rng.randint(100, 5000)), max_payment=Decimal(rng.randint(5000, 500000)),
+                term_months=rng.randint(6, 360), credit_type=rng.choice(Credit.CreditType.values),
+            )
+            for i, client in enumerate(rng.choice(clients) for _ in range(args.credits))
+        )
+        Credit.objects.bulk_create(credits, batch_size=args.batch_size)
+        # bulk_create bypasses the save() hooks that keep the counters.
+        repair_clients()
+        repair_banks()
+    print(f'Seeded {args.banks} banks, {args.clients} clients, {args.credits} credits and {args.users} users.')
+
+
+class Session:
+    """One keep-alive connection with a JWT for one worker thread."""
+
+    def __init__(self, base_url: str, username: str, password: str, timeout: float):
+        url = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(url.netloc, timeout=timeout)
+        self.prefix = url.path.rstrip('/')
+        self.credentials = {'username': username, 'password': password}
+        self.token = None
+
+    def login(self) -> None:
+        status, body = self._exchange('POST', '/v1/auth/token/', self.credentials, authenticate=False)
+        if status != 200:
+            raise SystemExit(f'Login as {self.credentials["username"]} failed with {status}: {body[:200]!r}')
+        self.token = json.loads(body)['access']
+
+    def request(self, method: str, path: str, payload=None) -> tuple[int, bytes]:
+        """Status and body; status 0 when no response arrived (timeout, reset, refused)."""
+        status, data = self._exchange(method, path, payload)
+        if status == 401:
+            # The access token expired during the run.
+            try:
+                self.login()
+            except SystemExit:
+                return status, data
+            status, data = self._exchange(method, path, payload)
+        return status, data
+
+    def _exchange(self, method: str, path: str, payload=None, authenticate=True) -> tuple[int, bytes]:
+        headers = {'Accept': 'application/json'}
+        if authenticate:
+            headers['Authorization'] = f'Bearer {self.token}'
+        body = None
+        if payload is not None:
+            body = json.dumps(payload)
+            headers['Content-Type'] = 'application/json'
+        for _attempt in range(2):
+            sent = False
+            try:
+                self.connection.request(method, self.prefix + path, body=body, headers=headers)
+                sent = True
+                response = self.connection.getresponse()
+                return response.status, response.read()
+            except (OSError, http.client.HTTPException):
+                self.connection.close()
+                # Reconnect and retry once (gunicorn's sync workers drop idle
+                # connections), but never resend a write the server may have
+                # received: that could create the row twice.
+                if sent and method not in IDEMPOTENT_METHODS:
+                    break
+        return 0, b''
+
+    def get(self, path: str, **params) -> tuple[int, bytes]:
+        return self.request('GET', f'{path}?{urlencode(params)}' if params else path)
+
+
+class Traffic:
+    """Builds the request for each scenario name from ids sampled at start-up."""
+
+    def __init__(self, session: Session, rng: random.Random):
+        self.rng = rng
+        # Browsing stays within the first few default-sized pages that exist.
+        self.pages = {}
+        self.banks = self._sample(session, 'banks')
+        self.clients = self._sample(session, 'clients')
+        self.credits = self._sample(session, 'credits')
+        if not (self.banks and self.clients and self.credits):
+            raise SystemExit('The target has no banks, clients or credits; run "loadtest.py seed" first.')
+
+    def _sample(self, session: Session, resource: str) -> list[dict]:
+        status, body = session.get(f'/v1/{resource}/', page_size=200)
+        if status != 200:
+            raise SystemExit(f'GET /v1/{resource}/ returned {status}: {body[:200]!r}')
+        page = json.loads(body)
+        self.pages[resource] = min(5, max(1, math.ceil(page['count'] / DEFAULT_PAGE_SIZE)))
+        return page['results']
+
+    def build(self, name: str) -> tuple[str, str, dict | None]:
+        rng = self.rng
+        resource, kind = name.split(':')
+        path = f'/v1/{resource}/'
+        if kind == 'list':
+            return 'GET', f'{path}?{urlencode({"page": rng.randint(1, self.pages[resource])})}', None
+        if kind == 'search':
+            return 'GET', f'{path}?{urlencode({"search": rng.choice(SEARCH_TERMS)})}', None
+        if kind == 'filter':
+            params = {
+                'credits': lambda: {'credit_type': rng.choice(['AUTO', 'MORTGAGE', 'COMMERCIAL']),
+                                    'bank': rng.choice(self.banks)['id'], 'ordering': '-max_payment'},
+                'clients': lambda: {'person_type': 'NATURAL', 'credits_count_min': 1, 'ordering': '-total_max_payment'},
+                'banks': lambda: {'bank_type': rng.choice(['PRIVATE', 'GOVERNMENT']), 'ordering': '-credits_count'},
+            }[resource]()
+            return 'GET', f'{path}?{urlencode(params)}', None
+        if kind == 'create':
+            return 'POST', path, self._new(resource)
+        if kind == 'update':
+            row = rng.choice(getattr(self, resource))
+            change = {
+                'credits': {'description': f'Updated {uuid.uuid4().hex[:8]}', 'term_months': rng.randint(6, 360)},
+                'clients': {'phone': f'+34 6{rng.randint(10000000, 99999999)}'},
+                'banks': {'address': f'Street {rng.randint(1, 999)}'},
+            }[resource]
+            return 'PATCH', f'{path}{row["id"]}/', change
+        raise ValueError(f'Unknown scenario {name!r}')
+
+    def _new(self, resource: str) -> dict:
+        rng = self.rng
+        if resource == 'credits':
+            client = rng.choice([c for c in self.clients if c['bank']] or self.clients)
+            max_payment = rng.randint(5000, 500000)
+            return {
+                'client': client['id'], 'bank': client['bank'] or rng.choice(self.banks)['id'],
+                'description': 'Load test credit', 'min_payment': str(rng.randint(100, 5000)),
+                'max_payment': str(max_payment), 'term_months': rng.randint(6, 360),
+                'credit_type': rng.choice(['AUTO', 'MORTGAGE', 'COMMERCIAL']),
+            }
+        if resource == 'clients':
+            return {
+                'full_name': f'Load Test {uuid.uuid4().hex[:8]}', 'date_of_birth': '1990-05-17',
+                'email': f'{uuid.uuid4().hex[:12]}@example.com', 'bank': rng.choice(self.banks)['id'],
+            }
+        return {'name': f'Load Bank {uuid.uuid4().hex}', 'bank_type': 'PRIVATE'}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: dict[str, list], elapsed: float) -> dict:
+    results = {}
+    for name in sorted(samples):
+        rows = samples[name]
+        latencies = sorted(ms for ms, _status in rows)
+        results[name] = {
+            'requests': len(rows),
+            'errors': sum(1 for _ms, status in rows if status == 0 or (status >= 400 and status != 429)),
+            'throttled': sum(1 for _ms, status in rows if status == 429),
+            'rps': len(rows) / elapsed,
+            **{f'p{p}_ms': percentile(latencies, p) for p in (50, 95, 99)},
+            'max_ms': latencies[-1] if latencies else 0.0,
+        }
+    return results
+
+
+def print_report(results: dict, baseline: dict | None) -> None:
+    header = f"{'endpoint':<16} {'requests':>8} {'errors':>6} {'429':>5} {'rps':>8} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'max_ms':>8}"
+    if baseline:
+        header += f" {'rps_vs_base':>11} {'p95_vs_base':>11}"
+    print(header)
+    for name, row in results.items():
+        line = (
+            f"{name:<16} {row['requests']:>8} {row['errors']:>6} {row['throttled']:>5} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+        base = (baseline or {}).get(name)
+        if base:
+            line += f" {_change(row['rps'], base['rps']):>11} {_change(row['p95_ms'], base['p95_ms']):>11}"
+        print(line)
+
+
+def _change(value: float, base: float) -> str:
+    return f'{(value - base) / base:+.0%}' if base else '-'
+
+
+def run(args) -> None:
+    mix = dict(MIX)
+    for item in args.mix or []:
+        name, _, weight = item.partition('=')
+        if name not in MIX:
+            raise SystemExit(f'Unknown scenario {name!r}; choose from {", ".join(MIX)}.')
+        mix[name] = int(weight)
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+
+    samples: dict[str, list] = {name: [] for name in names}
+    lock = threading.Lock()
+    start = time.monotonic()
+    warm_until = start + args.warmup
+    stop_at = warm_until + args.duration
+
+    def worker(index: int) -> None:
+        rng = random.Random(args.random_seed + index)
+        session = Session(args.base_url, f'{args.user_prefix}{index % args.users + 1}', args.password, args.timeout)
+        session.login()
+        traffic = Traffic(session, rng)
+        local = {name: [] for name in names}
+        while (now := time.monotonic()) < stop_at:
+            name = rng.choices(names, weights)[0]
+            method, path, payload = traffic.build(name)
+            began = time.perf_counter()
+            status, _body = session.request(method, path, payload)
+            if now >= warm_until:
+                local[name].append(((time.perf_counter() - began) * 1e3, status))
+        with lock:
+            for name, rows in local.items():
+                samples[name].extend(rows)
+
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        for future in [pool.submit(worker, i) for i in range(args.concurrency)]:
+            future.result()
+
+    results = summarize(samples, args.duration)
+    everything = [row for rows in samples.values() for row in rows]
+    results['total'] = summarize({'total': everything}, args.duration)['total']
+    baseline = json.loads(Path(args.compare).read_text())['results'] if args.compare else None
+    print(f'{args.base_url}  concurrency={args.concurrency}  duration={args.duration}s  warmup={args.warmup}s')
+    print_report(results, baseline)
+    if args.json:
+        meta = {key: getattr(args, key) for key in ('base_url', 'concurrency', 'duration', 'warmup', 'users')}
+        Path(args.json).write_text(json.dumps({'run': {**meta, 'mix': mix}, 'results': results}, indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seeder = commands.add_parser('seed', help='Create load-test users and data in the local database.')
+    seeder.add_argument('--banks', type=int, default=50)
+    seeder.add_argument('--clients', type=int, default=5000)
+    seeder.add_argument('--credits', type=int, default=50000)
+    seeder.add_argument('--users', type=int, default=8)
+    seeder.add_argument('--password', default=PASSWORD)
+    seeder.add_argument('--batch-size', type=int, default=2000)
+    seeder.add_argument('--random-seed', type=int, default=1)
+    seeder.set_defaults(handler=seed)
+
+    runner = commands.add_parser('run', help='Send the traffic mix and report latency per endpoint.')
+    runner.add_argument('--base-url', default='http://localhost:8001')
+    runner.add_argument('--concurrency', type=int, default=16)
+    runner.add_argument('--duration', type=float, default=60.0, help='Measured seconds, after the warm-up.')
+    runner.add_argument('--warmup', type=float, default=5.0)
+    runner.add_argument('--users', type=int, default=8, help='Workers log in as loadtest1..N round-robin.')
+    runner.add_argument('--user-prefix', default='loadtest')
+    runner.add_argument('--password', default=PASSWORD)
+    runner.add_argument('--timeout', type=float, default=30.0)
+    runner.add_argument('--mix', nargs='+', metavar='NAME=WEIGHT', help='Override scenario weights; 0 disables one.')
+    runner.add_argument('--json', help='Write the results here for later --compare.')
+    runner.add_argument('--compare', help='Results JSON of an earlier run to compare rps and p95 against.')
+    runner.add_argument('--random-seed', type=int, default=1)
+    runner.set_defaults(handler=run)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.fields import Field
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# Frames that sit between every query and its real cause.
+IGNORED_FRAMES = ('/django/db/', '/contextlib.py')
+GENERIC_PROJECT_FRAMES = ('config/middleware.py', 'tests/conftest.py')
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Throttle buckets, facet counts and read-your-writes markers live in the
+    # cache and would otherwise leak between tests.
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryLog:
+    """Queries run on the default connection, with the project frames that issued them.
+
+    Live-event ``pg_notify`` calls (``apps.sync.events``) are not counted:
+    they only run on PostgreSQL, and budgets must hold on every backend.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __len__(self):
+        return len(self.queries)
+
+    def __call__(self, execute, sql, params, many, context):
+        if 'pg_notify(' not in sql:
+            self.queries.append((sql, _call_sites()))
+        return execute(sql, params, many, context)
+
+    def report(self) -> str:
+        """Queries grouped by SQL text, most repeated first, with their call sites."""
+        groups = {}
+        for sql, sites in self.queries:
+            count, all_sites = groups.get(sql, (0, {}))
+            all_sites.update(dict.fromkeys(sites))
+            groups[sql] = (count + 1, all_sites)
+        lines = []
+        for sql, (count, sites) in sorted(groups.items(), key=lambda item: -item[1][0]):
+            marker = 'DUPLICATED ' if count > 1 else ''
+            lines.append(f'{marker}{count}x {sql}')
+            lines.extend(f'    at {site}' for site in sites)
+        return '\n'.join(lines)
+
+
+def _call_sites(depth: int = 2) -> list[str]:
+    """The library frame that triggered the query, then the innermost project frames."""
+    sites, trigger, field_name = [], None, None
+    frame = sys._getframe(2)
+    while frame is not None and len(sites) < depth:
+        filename = frame.f_code.co_filename
+        location = f'{frame.f_lineno} in {frame.f_code.co_name}'
+        path = Path(filename)
+        if path.is_relative_to(BACKEND_DIR):
+            if not any(noise in filename for noise in GENERIC_PROJECT_FRAMES):
+                sites.append(f'{path.relative_to(BACKEND_DIR)}:{location}')
+        elif trigger is None and not any(part in filename for part in IGNORED_FRAMES):
+            trigger = f'{filename}:{location}'
+        # Name the serializer field that lazily loaded a relation.
+        field = frame.f_locals.get('self')
+        if trigger and field_name is None and isinstance(field, Field) and field.parent is not None:
+            field_name = f'{type(field.parent).__name__}.{field.field_name}'
+        frame = frame.f_back
+    if trigger and field_name:
+        trigger += f' (serializer field {field_name})'
+    return ([trigger] if trigger else []) + sites
+
+
+@contextmanager
+def _capture():
+    log = QueryLog()
+    with connection.execute_wrapper(log):
+        yield log
+
+
+class QueryBudget:
+    """Assertions on how many queries a block or request runs.
+
+    ``with query_budget(5): ...`` fails if the block runs more than 5 queries.
+    ``query_budget.constant(request, seed)`` calls ``seed(n)`` then
+    ``request()`` for each size and fails unless the query count is the same
+    every time, which is what catches a missing ``select_related`` or N+1.
+    Failures list the SQL grouped by statement with the call sites.
+    """
+
+    @contextmanager
+    def __call__(self, limit: int):
+        with _capture() as log:
+            yield log
+        if len(log) > limit:
+            raise QueryBudgetExceeded(f'{len(log)} queries, budget was {limit}:\n{log.report()}')
+
+    def constant(self, request, seed, sizes=(1, 5)):
+        counts = {}
+        for size in sizes:
+            seed(size)
+            with _capture() as log:
+                response = request()
+            assert response.status_code < 400, response.content
+            counts[size] = log
+        first, last = counts[sizes[0]], counts[sizes[-1]]
+        if len({len(log) for log in counts.values()}) > 1:
+            sizes_text = ', '.join(f'{size} rows: {len(log)}' for size, log in counts.items())
+            raise QueryBudgetExceeded(
+                f'Query count grows with the number of rows ({sizes_text}).\n'
+                f'With {sizes[-1]} rows:\n{last.report()}'
+            )
+        return len(first)
+
+
+@pytest.fixture
+def query_budget():
+    return QueryBudget()
@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+
+
+@pytest.fixture
+def api():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_user(username='complete-user', password='password123'))
+    return client
+
+
+@pytest.fixture
+def people():
+    bank = Bank.objects.create(name='Andes Bank', bank_type=Bank.BankType.PRIVATE)
+    for name in ('Marta Lopez', 'mario Diaz', 'Ana Maria Ruiz', 'Bruno Mar'):
+        Client.objects.create(full_name=name, date_of_birth=date(1990, 1, 1), email='p@example.com', bank=bank)
+    return bank
+
+
+@pytest.mark.django_db
+def test_prefix_matches_come_before_substring_matches(api, people, django_assert_max_num_queries):
+    with django_assert_max_num_queries(2):
+        response = api.get('/v1/clients/autocomplete/', {'q': 'mar'})
+
+    assert response.status_code == 200
+    assert [row['full_name'] for row in response.data] == ['mario Diaz', 'Marta Lopez', 'Ana Maria Ruiz', 'Bruno Mar']
+    assert set(response.data[0]) == {'id', 'full_name', 'bank_id'}
+    assert response.data[0]['bank_id'] == people.id
+
+    # Short queries only complete prefixes.
+    response = api.get('/v1/clients/autocomplete/', {'q': 'ma'})
+    assert [row['full_name'] for row in response.data] == ['mario Diaz', 'Marta Lopez']
+    assert len(api.get('/v1/clients/autocomplete/', {'q': 'ma', 'limit': 1}).data) == 1
+
+
+@pytest.mark.django_db
+def test_results_are_cached_briefly(api, people, django_assert_num_queries):
+    api.get('/v1/banks/autocomplete/', {'q': 'and'})
+    Bank.objects.create(name='Andean Trust', bank_type=Bank.BankType.PRIVATE)
+
+    with django_assert_num_queries(0):
+        response = api.get('/v1/banks/autocomplete/', {'q': 'AND '})
+
+    assert response.data == [{'id': people.id, 'name': 'Andes Bank'}]
+
+
+@pytest.mark.django_db
+def test_autocomplete_requires_query(api):
+    assert api.get('/v1/clients/autocomplete/').status_code == 400
+    assert api.get('/v1/clients/autocomplete/', {'q': 'x', 'limit': 'many'}).status_code == 400
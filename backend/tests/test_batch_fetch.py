@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit
+
+
+@pytest.fixture
+def api():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_user(username='batch-user', password='password123'))
+    return client
+
+
+@pytest.fixture
+def clients():
+    bank = Bank.objects.create(name='Batch Bank', bank_type=Bank.BankType.PRIVATE)
+    return [
+        Client.objects.create(
+            full_name=f'Batch {n}', date_of_birth=date(1990, 1, 1), email=f'batch{n}@example.com', bank=bank,
+        )
+        for n in range(3)
+    ]
+
+
+@pytest.mark.django_db
+def test_batch_keeps_order_and_reports_missing(api, clients, django_assert_num_queries):
+    first, second, third = clients
+    ids = f'{third.id},{first.id},999999,{third.id}'
+
+    with django_assert_num_queries(1):
+        response = api.get('/v1/clients/batch/', {'ids': ids})
+
+    assert response.status_code == 200
+    assert [row['id'] for row in response.data['results']] == [third.id, first.id]
+    assert response.data['results'][0]['bank_name'] == 'Batch Bank'
+    assert response.data['missing'] == [999999]
+
+
+@pytest.mark.django_db
+def test_batch_credits_join_like_the_list(api, clients, django_assert_num_queries):
+    bank = Bank.objects.get()
+    credits = [
+        Credit.objects.create(
+            client=client, bank=bank, credit_type=Credit.CreditType.AUTO, description='Batch loan',
+            min_payment='1.00', max_payment='2.00', term_months=12,
+        )
+        for client in clients
+    ]
+
+    with django_assert_num_queries(1):
+        response = api.get('/v1/credits/batch/', {'ids': f'{credits[1].id},{credits[0].id}'})
+
+    assert [row['client_full_name'] for row in response.data['results']] == ['Batch 1', 'Batch 0']
+
+
+@pytest.mark.django_db
+def test_batch_validates_ids(api, clients, settings):
+    settings.BATCH_MAX_IDS = 2
+
+    assert api.get('/v1/banks/batch/').status_code == 400
+    assert api.get('/v1/banks/batch/', {'ids': '1,x'}).status_code == 400
+    assert api.get('/v1/clients/batch/', {'ids': '1,2,3'}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_ids_filter_on_list(api, clients):
+    response = api.get('/v1/clients/', {'ids': f'{clients[0].id},{clients[2].id}'})
+
+    assert [row['id'] for row in response.data['results']] == [clients[0].id, clients[2].id]
@@ -0,0 +1,29 @@
+from io import StringIO
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_ensure_superuser_is_idempotent():
+    call_command('ensure_superuser', username='boot-admin', password='first-pass', stdout=StringIO())
+    call_command('ensure_superuser', username='boot-admin', password='second-pass', stdout=StringIO())
+
+    user = User.objects.get(username='boot-admin')
+    assert user.is_superuser and user.is_staff
+    assert user.check_password('first-pass')
+
+
+@pytest.mark.django_db
+def test_bootstrap_skips_migrate_when_schema_is_current(monkeypatch):
+    monkeypatch.setenv('DJANGO_SUPERUSER_USERNAME', 'env-admin')
+    out = StringIO()
+
+    call_command('bootstrap', stdout=out)
+
+    output = out.getvalue()
+    assert 'Database schema is up to date.' in output
+    assert 'Bootstrap finished in' in output
+    assert User.objects.filter(username='env-admin', is_superuser=True).exists()
@@ -0,0 +1,135 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit
+from apps.sync.models import Tombstone
+
+
+@pytest.fixture
+def api():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_user(username='bulk-user', password='password123'))
+    return client
+
+
+@pytest.fixture
+def portfolio():
+    north = Bank.objects.create(name='North Bulk', bank_type=Bank.BankType.PRIVATE)
+    south = Bank.objects.create(name='South Bulk', bank_type=Bank.BankType.PRIVATE)
+    free = Client.objects.create(full_name='Free Client', date_of_birth=date(1990, 1, 1), email='free@example.com')
+    tied = Client.objects.create(
+        full_name='Tied Client', date_of_birth=date(1990, 1, 1), email='tied@example.com', bank=north,
+    )
+    credits = [
+        Credit.objects.create(
+            client=client, bank=north, credit_type=Credit.CreditType.AUTO, description='Bulk loan',
+            min_payment='10.00', max_payment=max_payment, term_months=12,
+        )
+        for client, max_payment in ((free, '100.00'), (free, '200.00'), (tied, '300.00'))
+    ]
+    return north, south, free, tied, credits
+
+
+@pytest.mark.django_db
+def test_bulk_patch_by_filter_moves_counters(api, portfolio, django_assert_max_num_queries):
+    north, south, free, _tied, credits = portfolio
+
+    with django_assert_max_num_queries(20):
+        response = api.patch(
+            '/v1/credits/bulk/?client_full_name=Free',
+            {'changes': {'bank': south.id, 'credit_type': 'MORTGAGE'}},
+            format='json',
+        )
+
+    assert response.status_code == 200
+    assert response.data == {'matched': 2, 'updated': 2}
+    moved = Credit.objects.get(pk=credits[0].pk)
+    assert (moved.bank_id, moved.credit_type) == (south.id, 'MORTGAGE')
+    assert moved.updated_at > credits[0].updated_at
+    south.refresh_from_db()
+    north.refresh_from_db()
+    assert (south.credits_count, south.total_max_payment) == (2, Decimal('300.00'))
+    assert (north.credits_count, north.total_max_payment) == (1, Decimal('300.00'))
+
+
+@pytest.mark.django_db
+def test_bulk_patch_checks_invariants_as_a_set(api, portfolio):
+    _north, south, _free, _tied, credits = portfolio
+    ids = [credit.id for credit in credits]
+
+    response = api.patch('/v1/credits/bulk/', {'ids': ids, 'changes': {'min_payment': '150.00'}}, format='json')
+    assert response.status_code == 400
+    assert response.data['min_payment'] == [f'1 selected row(s) have max_payment below this min_payment (e.g. ids {ids[0]}).']
+
+    response = api.patch('/v1/credits/bulk/', {'ids': ids, 'changes': {'bank': south.id}}, format='json')
+    assert response.status_code == 400
+    assert 'belong to clients of another bank' in str(response.data['bank'])
+
+    response = api.patch('/v1/credits/bulk/', {'ids': ids, 'changes': {'description': 'x'}}, format='json')
+    assert response.status_code == 400
+
+    # Neither ids nor (known) filters: refuse rather than touch every row.
+    response = api.patch('/v1/credits/bulk/', {'changes': {'term_months': 6}}, format='json')
+    assert response.status_code == 400
+    response = api.patch('/v1/credits/bulk/?clinet=1', {'changes': {'term_months': 6}}, format='json')
+    assert response.status_code == 400
+    assert not Credit.objects.filter(term_months=6).exists()
+
+
+@pytest.mark.django_db
+def test_bulk_delete_credits_records_tombstones(api, portfolio):
+    north, _south, free, _tied, credits = portfolio
+
+    response = api.delete('/v1/credits/bulk/', {'ids': [credits[0].id, credits[1].id]}, format='json')
+
+    assert response.status_code == 200
+    assert response.data == {'matched': 2, 'deleted': {'credits.Credit': 2}}
+    assert set(Tombstone.objects.values_list('object_id', flat=True)) == {credits[0].id, credits[1].id}
+    free.refresh_from_db()
+    north.refresh_from_db()
+    assert free.credits_count == 0
+    assert north.credits_count == 1
+
+
+@pytest.mark.django_db
+def test_bulk_client_bank_change(api, portfolio, django_assert_max_num_queries):
+    north, _south, free, tied, credits = portfolio
+
+    response = api.patch('/v1/clients/bulk/', {'ids': [free.id, tied.id], 'changes': {'bank': north.id}}, format='json')
+    assert response.data == {'matched': 2, 'updated': 2}
+    north.refresh_from_db()
+    assert north.clients_count == 2
+
+    # Credits go in one DELETE per chunk, not through the per-row cascade.
+    with django_assert_max_num_queries(20):
+        response = api.delete(f'/v1/clients/bulk/?bank={north.id}')
+    assert response.data == {'matched': 2, 'deleted': {'credits.Credit': 3, 'clients.Client': 2}}
+    north.refresh_from_db()
+    assert (north.clients_count, north.credits_count, north.total_max_payment) == (0, 0, Decimal('0.00'))
+    assert set(Tombstone.objects.filter(resource='credit').values_list('object_id', flat=True)) == {
+        credit.id for credit in credits
+    }
+
+
+@pytest.mark.django_db
+def test_bulk_moves_a_whole_bank_portfolio(api, portfolio):
+    north, south, free, tied, credits = portfolio
+    api.patch('/v1/clients/bulk/', {'ids': [free.id], 'changes': {'bank': north.id}}, format='json')
+
+    response = api.patch(f'/v1/clients/bulk/?bank={north.id}', {'changes': {'bank': south.id}}, format='json')
+
+    assert response.data == {'matched': 2, 'updated': 2}
+    assert set(Credit.objects.values_list('bank_id', flat=True)) == {south.id}
+    assert Credit.objects.get(pk=credits[2].pk).updated_at > credits[2].updated_at
+    for bank, counters in ((north, (0, 0, Decimal('0.00'))), (south, (2, 3, Decimal('600.00')))):
+        bank.refresh_from_db()
+        assert (bank.clients_count, bank.credits_count, bank.total_max_payment) == counters
+    tied.refresh_from_db()
+    assert (tied.credits_count, tied.total_max_payment) == (1, Decimal('300.00'))
@@ -0,0 +1,99 @@
+import gzip
+import json
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from config.middleware import APICompressionMiddleware
+from config.schema import clear_schema_cache
+
+
+@pytest.fixture
+def api():
+    user = User.objects.create_user(username='gzip-user', password='password123')
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+def test_large_api_response_is_compressed_and_keeps_headers(api):
+    Bank.objects.bulk_create(
+        Bank(name=f'Compression Bank {i}', bank_type=Bank.BankType.PRIVATE, address='Main street 1')
+        for i in range(60)
+    )
+
+    plain = api.get('/v1/banks/', {'page_size': 60})
+    compressed = api.get('/v1/banks/', {'page_size': 60}, HTTP_ACCEPT_ENCODING='gzip')
+
+    assert 'Content-Encoding' not in plain
+    assert compressed['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed['Vary']
+    assert 'Content-Security-Policy' in compressed
+    assert 'Permissions-Policy' in compressed
+    assert int(compressed['Content-Length']) < len(plain.content)
+    assert json.loads(gzip.decompress(compressed.content)) == json.loads(plain.content)
+
+
+@pytest.mark.django_db
+def test_small_and_non_api_responses_are_not_compressed(api):
+    small = api.get('/v1/banks/', HTTP_ACCEPT_ENCODING='gzip')
+    health = api.get('/healthz', HTTP_ACCEPT_ENCODING='gzip')
+
+    assert 'Content-Encoding' not in small
+    assert 'Content-Encoding' not in health
+
+
+@pytest.mark.django_db
+def test_compressed_schema_keeps_working_etag():
+    clear_schema_cache()
+    api = APIClient()
+
+    first = api.get('/v1/schema/', HTTP_ACCEPT_ENCODING='gzip')
+    assert first['Content-Encoding'] == 'gzip'
+    assert first['ETag'].startswith('W/"')
+
+    again = api.get('/v1/schema/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=first['ETag'])
+    assert again.status_code == 304
+    clear_schema_cache()
+
+
+def test_streaming_responses_are_compressed_incrementally(settings):
+    middleware = APICompressionMiddleware(
+        lambda request: StreamingHttpResponse(iter([b'{"a":', b'1}']), content_type='application/json')
+    )
+    request = RequestFactory().get('/v1/export/', HTTP_ACCEPT_ENCODING='gzip;q=1.0, identity;q=0.5')
+
+    response = middleware(request)
+
+    assert response['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(b''.join(response.streaming_content)) == b'{"a":1}'
+
+
+def test_event_streams_and_refused_codings_pass_through():
+    events = APICompressionMiddleware(
+        lambda request: StreamingHttpResponse(iter([b'data: 1\n\n']), content_type='text/event-stream')
+    )
+    refused = APICompressionMiddleware(lambda request: StreamingHttpResponse(iter([b'x' * 2048])))
+    factory = RequestFactory()
+
+    assert 'Content-Encoding' not in events(factory.get('/v1/events/', HTTP_ACCEPT_ENCODING='gzip'))
+    assert 'Content-Encoding' not in refused(factory.get('/v1/banks/', HTTP_ACCEPT_ENCODING='gzip;q=0, br;q=0'))
+
+
+def test_brotli_preferred_when_installed():
+    brotli = pytest.importorskip('brotli')
+    middleware = APICompressionMiddleware(
+        lambda request: StreamingHttpResponse(iter([b'{"name":"bank"}'] * 200), content_type='application/json')
+    )
+    middleware.codecs.pop('zstd', None)
+
+    response = middleware(RequestFactory().get('/v1/banks/', HTTP_ACCEPT_ENCODING='gzip, br'))
+
+    assert response['Content-Encoding'] == 'br'
+    assert brotli.decompress(b''.join(response.streaming_content)) == b'{"name":"bank"}' * 200
@@ -0,0 +1,136 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit
+from apps.sync import changes
+
+
+def _client(name, bank=None):
+    return Client.objects.create(full_name=name, date_of_birth=date(1990, 1, 1), email=f'{name}@example.com', bank=bank)
+
+
+def _credit(client, bank, max_payment):
+    return Credit.objects.create(
+        client=client, bank=bank, credit_type=Credit.CreditType.AUTO, description='Counted loan',
+        min_payment='1.00', max_payment=max_payment, term_months=12,
+    )
+
+
+def _counters(obj):
+    obj.refresh_from_db()
+    values = [obj.credits_count, obj.total_max_payment]
+    return [obj.clients_count, *values] if isinstance(obj, Bank) else values
+
+
+@pytest.mark.django_db
+def test_counters_follow_creates_updates_and_deletes():
+    north = Bank.objects.create(name='North Counter', bank_type=Bank.BankType.PRIVATE)
+    south = Bank.objects.create(name='South Counter', bank_type=Bank.BankType.PRIVATE)
+    ana = _client('ana', north)
+    ben = _client('ben')
+    first = _credit(ana, north, '100.00')
+    _credit(ana, north, '50.00')
+
+    assert _counters(north) == [1, 2, Decimal('150.00')]
+    assert _counters(ana) == [2, Decimal('150.00')]
+
+    # Reassign a credit to another client and bank, changing its amount.
+    first.client, first.bank, first.max_payment = ben, south, Decimal('70.00')
+    first.save()
+    assert _counters(ana) == [1, Decimal('50.00')]
+    assert _counters(ben) == [1, Decimal('70.00')]
+    assert _counters(north) == [1, 1, Decimal('50.00')]
+    assert _counters(south) == [0, 1, Decimal('70.00')]
+
+    ben.bank = south
+    ben.save()
+    assert _counters(south)[0] == 1
+
+    # Deleting a client cascades to its credits.
+    ana.delete()
+    assert _counters(north) == [0, 0, Decimal('0.00')]
+
+    # Deleting a bank sets its clients' bank to NULL; nothing else to adjust.
+    Credit.objects.filter(bank=south).delete()
+    south.delete()
+    assert _counters(ben) == [0, Decimal('0.00')]
+
+
+@pytest.mark.django_db
+def test_counter_moves_publish_upserts_for_the_owners(monkeypatch):
+    bank = Bank.objects.create(name='Event Counter', bank_type=Bank.BankType.PRIVATE)
+    ana = _client('ana', bank)
+    events = []
+    monkeypatch.setattr(changes, 'publish_many', lambda batch, using='default': events.extend(batch))
+
+    _credit(ana, bank, '100.00')
+
+    # The owners' updated_at moved, so live clients hear about them too.
+    bank.refresh_from_db()
+    assert sorted((event['type'], event['id'], event['changed_at']) for event in events) == [
+        ('bank', bank.id, bank.updated_at.isoformat()),
+        ('client', ana.id, Client.objects.get(pk=ana.pk).updated_at.isoformat()),
+    ]
+
+
+@pytest.mark.django_db
+def test_repair_counters_fixes_drift_only():
+    bank = Bank.objects.create(name='Drift Bank', bank_type=Bank.BankType.PRIVATE)
+    client = _client('drift', bank)
+    _credit(client, bank, '10.00')
+    _client('steady')
+    Client.objects.filter(pk=client.pk).update(credits_count=7, total_max_payment=0)
+
+    out = StringIO()
+    call_command('repair_counters', stdout=out)
+
+    assert 'Repaired counters on 1 client(s) and 0 bank(s).' in out.getvalue()
+    assert _counters(client) == [1, Decimal('10.00')]
+
+
+@pytest.mark.django_db
+def test_drifted_counters_do_not_block_credit_writes():
+    bank = Bank.objects.create(name='Zero Bank', bank_type=Bank.BankType.PRIVATE)
+    client = _client('zero', bank)
+    credit = _credit(client, bank, '10.00')
+    Bank.objects.filter(pk=bank.pk).update(credits_count=0, total_max_payment=0)
+
+    credit.delete()
+    assert _counters(bank) == [1, -1, Decimal('-10.00')]
+
+    call_command('repair_counters', stdout=StringIO())
+    assert _counters(bank) == [1, 0, Decimal('0.00')]
+
+
+@pytest.mark.django_db
+def test_counters_are_filterable_and_orderable():
+    bank = Bank.objects.create(name='Order Bank', bank_type=Bank.BankType.PRIVATE)
+    busy, quiet = _client('busy', bank), _client('quiet', bank)
+    for amount in ('10.00', '20.00'):
+        _credit(busy, bank, amount)
+    _credit(quiet, bank, '5.00')
+    api = APIClient()
+    api.force_authenticate(user=User.objects.create_user(username='counter-user', password='password123'))
+
+    response = api.get('/v1/clients/', {'ordering': '-credits_count'})
+    assert [row['full_name'] for row in response.data['results']] == ['busy', 'quiet']
+    assert response.data['results'][0]['total_max_payment'] == '30.00'
+
+    response = api.get('/v1/clients/', {'total_max_payment_min': '10'})
+    assert [row['full_name'] for row in response.data['results']] == ['busy']
+
+    response = api.get('/v1/banks/', {'credits_count_min': 3})
+    assert response.data['results'][0]['clients_count'] == 2
+
+    # Counters are read-only through the API.
+    api.patch(f'/v1/clients/{quiet.id}/', {'credits_count': 99}, format='json')
+    assert _counters(quiet)[0] == 1
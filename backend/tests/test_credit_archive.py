@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import ArchivedCredit, Credit
+from apps.sync.models import Tombstone
+
+
+@pytest.fixture
+def api():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_user(username='archive-user', password='password123'))
+    return client
+
+
+@pytest.fixture
+def aged_credits():
+    bank = Bank.objects.create(name='Archive Bank', bank_type=Bank.BankType.PRIVATE)
+    client = Client.objects.create(full_name='Ola Archive', date_of_birth=date(1990, 1, 1), email='ola@example.com')
+    now = timezone.now()
+    credits = {}
+    for label, days_ago, credit_type in [
+        ('recent', 10, Credit.CreditType.AUTO),
+        ('old', 900, Credit.CreditType.AUTO),
+        ('older', 1000, Credit.CreditType.MORTGAGE),
+    ]:
+        credit = Credit.objects.create(
+            client=client, bank=bank, credit_type=credit_type, description=f'{label} loan',
+            min_payment='1.00', max_payment='2.00', term_months=12,
+        )
+        Credit.objects.filter(pk=credit.pk).update(created_at=now - timedelta(days=days_ago))
+        credits[label] = Credit.objects.get(pk=credit.pk)
+    return credits
+
+
+@pytest.mark.django_db
+def test_archive_moves_aged_credits_without_tombstones(aged_credits):
+    out = StringIO()
+    call_command('archive_credits', '--older-than-days', '365', '--batch-size', '1', stdout=out)
+
+    assert 'Archived 2 credit(s)' in out.getvalue()
+    assert list(Credit.objects.values_list('id', flat=True)) == [aged_credits['recent'].id]
+    archived = ArchivedCredit.objects.get(pk=aged_credits['old'].id)
+    assert archived.created_at == aged_credits['old'].created_at
+    assert archived.updated_at == aged_credits['old'].updated_at
+    assert not Tombstone.objects.exists()
+    # Counters cover hot credits only.
+    assert Client.objects.get().credits_count == 1
+    assert Bank.objects.get().credits_count == 1
+
+
+@pytest.mark.django_db
+def test_list_includes_archived_only_on_request(api, aged_credits, django_assert_max_num_queries):
+    call_command('archive_credits', '--older-than-days', '365', stdout=StringIO())
+
+    assert api.get('/v1/credits/').data['count'] == 1
+
+    with django_assert_max_num_queries(4):
+        response = api.get('/v1/credits/', {'include_archived': 'true', 'ordering': 'created_at'})
+    assert response.status_code == 200
+    assert [row['description'] for row in response.data['results']] == ['older loan', 'old loan', 'recent loan']
+    assert [row['is_archived'] for row in response.data['results']] == [True, True, False]
+    assert response.data['results'][0]['client_full_name'] == 'Ola Archive'
+
+    filtered = api.get('/v1/credits/', {'include_archived': '1', 'credit_type': 'MORTGAGE'})
+    assert [row['id'] for row in filtered.data['results']] == [aged_credits['older'].id]
+
+    assert api.get('/v1/credits/', {'include_archived': 'maybe'}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_retrieve_archived_credit(api, aged_credits):
+    call_command('archive_credits', '--older-than-days', '365', stdout=StringIO())
+    url = f"/v1/credits/{aged_credits['old'].id}/"
+
+    assert api.get(url).status_code == 404
+    response = api.get(url, {'include_archived': 'true'})
+    assert response.status_code == 200
+    assert response.data['is_archived'] is True
+
+
+@pytest.mark.django_db
+def test_restore_brings_credits_back_unchanged(aged_credits):
+    call_command('archive_credits', '--older-than-days', '365', stdout=StringIO())
+
+    with pytest.raises(CommandError):
+        call_command('restore_credits', stdout=StringIO())
+    call_command('restore_credits', '--ids', str(aged_credits['old'].id), stdout=StringIO())
+
+    restored = Credit.objects.get(pk=aged_credits['old'].id)
+    assert restored.created_at == aged_credits['old'].created_at
+    assert restored.updated_at == aged_credits['old'].updated_at
+    assert list(ArchivedCredit.objects.values_list('id', flat=True)) == [aged_credits['older'].id]
+    assert Client.objects.get().credits_count == 2
+    assert str(Bank.objects.get().total_max_payment) == '4.00'
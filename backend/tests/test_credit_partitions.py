@@ -0,0 +1,118 @@
+from datetime import date, datetime, timedelta, timezone
+from io import StringIO
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits import partitioning
+from apps.credits.models import Credit
+
+postgres_only = pytest.mark.skipif(connection.vendor != 'postgresql', reason='partitioning needs PostgreSQL')
+
+
+def test_month_arithmetic_crosses_years():
+    assert partitioning.add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert partitioning.add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partitioning.month_range(date(2025, 11, 20), date(2026, 1, 5)) == [
+        date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1),
+    ]
+    assert partitioning.partition_name(date(2026, 1, 1)) == 'credits_credit_p202601'
+
+
+def test_partition_bounds_cover_one_month():
+    sql = partitioning.create_partition_sql(date(2025, 12, 1))
+
+    assert 'credits_credit_p202512' in sql
+    assert "FROM ('2025-12-01T00:00:00+00:00') TO ('2026-01-01T00:00:00+00:00')" in sql
+
+
+def test_adding_partitions_moves_matching_rows_out_of_the_default():
+    statements = partitioning.add_partitions_sql([date(2026, 3, 1)])
+
+    assert statements[0] == 'ALTER TABLE "credits_credit" DETACH PARTITION "credits_credit_default"'
+    assert 'credits_credit_p202603' in statements[1]
+    assert statements[2].startswith('WITH moved AS (DELETE FROM "credits_credit_default"')
+    assert "created_at >= '2026-03-01T00:00:00+00:00' AND created_at < '2026-04-01T00:00:00+00:00'" in statements[2]
+    assert statements[2].endswith('INSERT INTO "credits_credit_p202603" SELECT * FROM moved')
+    assert statements[-1] == 'ALTER TABLE "credits_credit" ATTACH PARTITION "credits_credit_default" DEFAULT'
+
+
+@pytest.mark.django_db
+def test_command_requires_postgres():
+    if connection.vendor == 'postgresql':
+        pytest.skip('checks the non-PostgreSQL error path')
+    with pytest.raises(CommandError, match='PostgreSQL'):
+        call_command('credit_partitions', 'ensure', stdout=StringIO())
+
+
+@pytest.fixture
+def credits_by_month():
+    bank = Bank.objects.create(name='Partition Bank', bank_type=Bank.BankType.PRIVATE)
+    client = Client.objects.create(full_name='Pat Partition', date_of_birth=date(1990, 1, 1), email='pat@example.com')
+    now = datetime.now(timezone.utc)
+    for days_ago in (0, 40, 80):
+        credit = Credit.objects.create(
+            client=client, bank=bank, credit_type=Credit.CreditType.AUTO, description='Partitioned loan',
+            min_payment='1.00', max_payment='2.00', term_months=12,
+        )
+        Credit.objects.filter(pk=credit.pk).update(created_at=now - timedelta(days=days_ago))
+    return now
+
+
+@pytest.mark.django_db
+def test_created_at_range_filter(credits_by_month):
+    api = APIClient()
+    api.force_authenticate(user=User.objects.create_user(username='range-user', password='password123'))
+
+    response = api.get('/v1/credits/', {'created_at_after': (credits_by_month - timedelta(days=10)).isoformat()})
+
+    assert response.status_code == 200
+    assert response.data['count'] == 1
+
+
+@postgres_only
+@pytest.mark.django_db(transaction=True)
+def test_convert_keeps_rows_and_prunes_by_created_at(credits_by_month):
+    ids = set(Credit.objects.values_list('id', flat=True))
+
+    call_command('credit_partitions', 'convert', '--months-ahead', '1', stdout=StringIO())
+
+    assert partitioning.is_partitioned()
+    assert set(Credit.objects.values_list('id', flat=True)) == ids
+    new = Credit.objects.create(
+        client=Client.objects.get(), bank=Bank.objects.get(), credit_type=Credit.CreditType.AUTO,
+        description='After conversion', min_payment='1.00', max_payment='2.00', term_months=12,
+    )
+    assert new.id > max(ids)
+
+    month = partitioning.month_start(credits_by_month.date())
+    pruned = Credit.objects.filter(created_at__gte=month, created_at__lt=partitioning.add_months(month, 1))
+    assert partitioning.explain_partitions(pruned)['partitions'] == [partitioning.partition_name(month)]
+
+
+@postgres_only
+@pytest.mark.django_db(transaction=True)
+def test_ensure_moves_rows_the_default_partition_already_holds(credits_by_month):
+    call_command('credit_partitions', 'convert', '--months-ahead', '1', stdout=StringIO())
+    future = partitioning.add_months(partitioning.month_start(credits_by_month.date()), 4)
+    stray = Credit.objects.first()
+    # A future created_at lands in the default partition until its month exists.
+    Credit.objects.filter(pk=stray.pk).update(created_at=datetime(future.year, future.month, 15, tzinfo=timezone.utc))
+
+    created = partitioning.ensure_partitions(months_ahead=5, today=credits_by_month.date())
+
+    assert partitioning.partition_name(future) in created
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT id FROM {partitioning.partition_name(future)}')
+        assert cursor.fetchall() == [(stray.pk,)]
+        cursor.execute(f'SELECT COUNT(*) FROM {partitioning.DEFAULT_PARTITION}')
+        assert cursor.fetchone()[0] == 0
+    assert Credit.objects.count() == 3
+    assert partitioning.ensure_partitions(months_ahead=5, today=credits_by_month.date()) == []
@@ -0,0 +1,112 @@
+import csv
+import json
+from datetime import date
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import ArchivedCredit, Credit
+
+
+def _read(path):
+    with path.open() as report:
+        return {row[next(iter(row))]: row for row in csv.DictReader(report)}
+
+
+@pytest.fixture
+def portfolio():
+    north = Bank.objects.create(name='North Exposure', bank_type=Bank.BankType.PRIVATE)
+    south = Bank.objects.create(name='South Exposure', bank_type=Bank.BankType.PRIVATE)
+    clients = [
+        Client.objects.create(full_name=f'Client {n}', date_of_birth=date(1990, 1, 1), email=f'c{n}@example.com')
+        for n in range(5)
+    ]
+    for client, bank, credit_type, max_payment, term in [
+        (clients[0], north, Credit.CreditType.AUTO, '100.00', 12),
+        (clients[0], north, Credit.CreditType.MORTGAGE, '300.00', 24),
+        (clients[2], north, Credit.CreditType.AUTO, '50.00', 6),
+        (clients[4], south, Credit.CreditType.COMMERCIAL, '10.00', 36),
+    ]:
+        Credit.objects.create(
+            client=client, bank=bank, credit_type=credit_type, description='Exposure loan',
+            min_payment='1.00', max_payment=max_payment, term_months=term,
+        )
+    return clients, north, south
+
+
+@pytest.mark.django_db
+def test_report_totals_and_resume(portfolio, tmp_path):
+    clients, north, south = portfolio
+    out = StringIO()
+
+    call_command('exposure_report', str(tmp_path), '--workers', '1', '--partitions', '3', stdout=out)
+
+    assert '[3/3]' in out.getvalue()
+    client_rows = _read(tmp_path / 'clients.csv')
+    assert client_rows[str(clients[0].id)] == {
+        'client_id': str(clients[0].id), 'credits': '2', 'total_max_payment': '400.00',
+        'weighted_term_months': '21.00', 'count_auto': '1', 'count_mortgage': '1', 'count_commercial': '0',
+    }
+    bank_rows = _read(tmp_path / 'banks.csv')
+    assert bank_rows[str(north.id)]['clients'] == '2'
+    assert bank_rows[str(north.id)]['total_max_payment'] == '450.00'
+    assert bank_rows[str(south.id)]['count_commercial'] == '1'
+
+    # Rerunning only recomputes partitions without a finished part file.
+    (tmp_path / 'parts' / 'part-00001.json').unlink()
+    out = StringIO()
+    call_command('exposure_report', str(tmp_path), '--workers', '1', stdout=out)
+
+    assert 'Resuming: 2 of 3 partition(s) already done.' in out.getvalue()
+    assert _read(tmp_path / 'banks.csv') == bank_rows
+
+
+@pytest.mark.django_db
+def test_resume_rejects_a_different_partition_count(portfolio, tmp_path):
+    call_command('exposure_report', str(tmp_path), '--workers', '1', '--partitions', '3', stdout=StringIO())
+
+    with pytest.raises(CommandError, match='planned with 3 partition'):
+        call_command('exposure_report', str(tmp_path), '--workers', '1', '--partitions', '5', stdout=StringIO())
+
+    out = StringIO()
+    call_command('exposure_report', str(tmp_path), '--workers', '1', '--partitions', '5', '--restart', stdout=out)
+    assert '[3/3]' not in out.getvalue()
+    assert len(json.loads((tmp_path / 'manifest.json').read_text())['partitions']) == 5
+
+
+@pytest.mark.django_db
+def test_archived_credits_are_included_unless_excluded(portfolio, tmp_path):
+    clients, north, _south = portfolio
+    call_command('archive_credits', '--older-than-days', '0', stdout=StringIO())
+    assert not Credit.objects.exists() and ArchivedCredit.objects.count() == 4
+
+    out = StringIO()
+    call_command('exposure_report', str(tmp_path / 'all'), '--workers', '1', stdout=out)
+    assert 'Archived credits are included.' in out.getvalue()
+    assert json.loads((tmp_path / 'all' / 'manifest.json').read_text())['include_archived'] is True
+    assert _read(tmp_path / 'all' / 'banks.csv')[str(north.id)]['total_max_payment'] == '450.00'
+
+    call_command('exposure_report', str(tmp_path / 'hot'), '--workers', '1', '--no-include-archived', stdout=StringIO())
+    assert _read(tmp_path / 'hot' / 'clients.csv') == {}
+
+    with pytest.raises(CommandError, match='excludes archived credits'):
+        call_command('exposure_report', str(tmp_path / 'hot'), '--workers', '1', '--include-archived', stdout=StringIO())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_workers_match_inline_run(portfolio, tmp_path):
+    inline, parallel = tmp_path / 'inline', tmp_path / 'parallel'
+    call_command('exposure_report', str(inline), '--workers', '1', '--partitions', '4', stdout=StringIO())
+
+    out = StringIO()
+    call_command('exposure_report', str(parallel), '--workers', '2', '--partitions', '4', stdout=out)
+
+    planned = len(json.loads((parallel / 'manifest.json').read_text())['partitions'])
+    assert f'[{planned}/{planned}]' in out.getvalue()
+    for name in ('clients.csv', 'banks.csv'):
+        assert (parallel / name).read_text() == (inline / name).read_text()
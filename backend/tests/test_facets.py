@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit
+
+
+@pytest.fixture
+def api():
+    user = User.objects.create_user(username='facet-user', password='password123')
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def portfolio():
+    north = Bank.objects.create(name='North Bank', bank_type=Bank.BankType.PRIVATE)
+    south = Bank.objects.create(name='South Bank', bank_type=Bank.BankType.GOVERNMENT)
+    ana = Client.objects.create(
+        full_name='Ana Facet', date_of_birth=date(1990, 1, 1), email='ana@example.com', bank=north,
+    )
+    ben = Client.objects.create(
+        full_name='Ben Facet', date_of_birth=date(1980, 1, 1), email='ben@example.com', bank=south,
+        person_type=Client.PersonType.LEGAL_ENTITY,
+    )
+    Client.objects.create(full_name='Cy Facet', date_of_birth=date(1970, 1, 1), email='cy@example.com')
+    for client, bank, credit_type in [
+        (ana, north, Credit.CreditType.AUTO),
+        (ana, north, Credit.CreditType.MORTGAGE),
+        (ben, south, Credit.CreditType.AUTO),
+    ]:
+        Credit.objects.create(
+            client=client, bank=bank, credit_type=credit_type, description='Facet loan',
+            min_payment='1.00', max_payment='2.00', term_months=12,
+        )
+    return north, south
+
+
+def _counts(facet):
+    return {entry['value']: entry['count'] for entry in facet}
+
+
+@pytest.mark.django_db
+def test_credit_facets_are_disjunctive(api, portfolio, django_assert_max_num_queries):
+    north, south = portfolio
+
+    with django_assert_max_num_queries(1):
+        response = api.get('/v1/credits/facets/', {'bank': north.id})
+
+    assert response.status_code == 200
+    # credit_type counts honour the bank filter...
+    assert _counts(response.data['credit_type']) == {'AUTO': 1, 'MORTGAGE': 1, 'COMMERCIAL': 0}
+    # ...while bank counts ignore it, so other banks stay visible.
+    assert _counts(response.data['bank']) == {north.id: 2, south.id: 1}
+    assert {entry['label'] for entry in response.data['bank']} == {'North Bank', 'South Bank'}
+
+
+@pytest.mark.django_db
+def test_client_and_bank_facets_apply_other_filters(api, portfolio):
+    north, _south = portfolio
+
+    clients = api.get('/v1/clients/facets/', {'full_name': 'facet', 'person_type': 'NATURAL'}).data
+    assert _counts(clients['person_type']) == {'NATURAL': 2, 'LEGAL_ENTITY': 1}
+    assert _counts(clients['bank']) == {north.id: 1, None: 1}
+
+    banks = api.get('/v1/banks/facets/', {'name': 'north'}).data
+    assert _counts(banks['bank_type']) == {'PRIVATE': 1, 'GOVERNMENT': 0}
+
+
+@pytest.mark.django_db
+def test_facets_are_cached_per_filter_signature(api, portfolio, django_assert_num_queries):
+    north, _south = portfolio
+    api.get('/v1/credits/facets/', {'bank': north.id, 'page': 2})
+
+    with django_assert_num_queries(0):
+        cached = api.get('/v1/credits/facets/', {'bank': north.id})
+
+    assert _counts(cached.data['credit_type'])['AUTO'] == 1
+    assert api.get('/v1/credits/facets/', {'bank': 'x'}).status_code == 400
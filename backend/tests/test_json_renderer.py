@@ -0,0 +1,52 @@
+import io
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from config.parsers import ORJSONParser
+from config.renderers import ORJSONRenderer
+
+
+def test_orjson_renderer_matches_drf_output():
+    data = {
+        'amount': Decimal('1250.50'),
+        'created_at': datetime(2026, 1, 19, 13, 36, 12, 345678, tzinfo=timezone.utc),
+        'date_of_birth': date(1990, 6, 1),
+        'label': gettext_lazy('Mortgage'),
+        'name': 'José Núñez',
+        'nested': [{1: None, 'ok': True}],
+    }
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+    assert ORJSONRenderer().render(data, 'application/json; indent=2') == JSONRenderer().render(
+        data, 'application/json; indent=2'
+    )
+
+
+def test_orjson_parser_parses_and_rejects_invalid_json():
+    assert ORJSONParser().parse(io.BytesIO(b'{"a": [1, 2.5]}')) == {'a': [1, 2.5]}
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"a": NaN}'))
+
+
+@pytest.mark.django_db
+def test_orjson_selectable_by_accept_header():
+    user = User.objects.create_user(username='json-user', password='password123')
+    api = APIClient()
+    api.force_authenticate(user=user)
+    Bank.objects.create(name='Renderer Bank', bank_type=Bank.BankType.PRIVATE)
+
+    default = api.get('/v1/banks/')
+    fast = api.get('/v1/banks/', HTTP_ACCEPT='application/json; encoder=orjson')
+
+    assert default['Content-Type'] == 'application/json'
+    assert fast['Content-Type'] == 'application/json; encoder=orjson'
+    assert fast.content == default.content
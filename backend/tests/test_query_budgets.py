@@ -0,0 +1,137 @@
+"""Query counts of the main endpoints must not depend on how many rows they return."""
+from datetime import date
+
+import pytest
+
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit
+
+
+@pytest.fixture
+def api():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_user(username='budget-user', password='password123'))
+    return client
+
+
+def _seed_banks(n):
+    for index in range(Bank.objects.count(), n):
+        Bank.objects.create(name=f'Budget Bank {index}', bank_type=Bank.BankType.PRIVATE)
+
+
+def _seed_clients(n):
+    _seed_banks(2)
+    banks = list(Bank.objects.all())
+    for index in range(Client.objects.count(), n):
+        Client.objects.create(
+            full_name=f'Budget Client {index}', date_of_birth=date(1990, 1, 1), email=f'b{index}@example.com',
+            bank=banks[index % 2],
+        )
+
+
+def _seed_credits(n):
+    _seed_clients(3)
+    clients = list(Client.objects.select_related('bank'))
+    for index in range(Credit.objects.count(), n):
+        client = clients[index % len(clients)]
+        Credit.objects.create(
+            client=client, bank=client.bank, credit_type=Credit.CreditType.AUTO, description=f'Budget loan {index}',
+            min_payment='1.00', max_payment='2.00', term_months=12,
+        )
+
+
+SEEDS = {'banks': _seed_banks, 'clients': _seed_clients, 'credits': _seed_credits}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('resource', SEEDS)
+def test_list_query_count_is_constant(api, query_budget, resource):
+    count = query_budget.constant(lambda: api.get(f'/v1/{resource}/', {'page_size': 50}), SEEDS[resource])
+    # COUNT(*) for the paginator and one SELECT for the page.
+    assert count == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('resource', SEEDS)
+def test_detail_runs_one_query(api, query_budget, resource):
+    SEEDS[resource](1)
+    pk = {'banks': Bank, 'clients': Client, 'credits': Credit}[resource].objects.get().pk
+
+    with query_budget(1):
+        response = api.get(f'/v1/{resource}/{pk}/')
+    assert response.status_code == 200
+
+
+def _bank_payload(n):
+    return {'name': f'Created Bank {n}', 'bank_type': 'PRIVATE'}
+
+
+def _client_payload(n):
+    return {
+        'full_name': f'Created Client {n}', 'date_of_birth': '1990-01-01', 'email': f'created{n}@example.com',
+        'bank': Bank.objects.first().id,
+    }
+
+
+def _credit_payload(n):
+    client = Client.objects.first()
+    return {
+        'client': client.id, 'bank': client.bank_id, 'credit_type': 'AUTO', 'description': f'Budget create {n}',
+        'min_payment': '1.00', 'max_payment': '2.00', 'term_months': 12,
+    }
+
+
+# resource -> (payload factory, expected queries). Clients and credits save
+# inside a savepoint to move the counters; pg_notify is not counted (see conftest).
+CREATES = {
+    'banks': (_bank_payload, 2),
+    'clients': (_client_payload, 5),
+    'credits': (_credit_payload, 7),
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('resource', CREATES)
+def test_create_query_count_is_constant(api, query_budget, resource):
+    factory, expected = CREATES[resource]
+    payloads = []
+
+    def seed(n):
+        SEEDS[resource](n)
+        _seed_clients(max(1, Client.objects.count()))
+        # Built here so the factory's own lookups are not counted.
+        payloads.append(factory(n))
+
+    count = query_budget.constant(lambda: api.post(f'/v1/{resource}/', payloads[-1], format='json'), seed)
+    assert count == expected
+
+
+@pytest.mark.django_db
+def test_budget_failure_groups_duplicated_sql(query_budget):
+    with pytest.raises(AssertionError) as excinfo:
+        with query_budget(1):
+            for _ in range(3):
+                list(User.objects.filter(username='nobody'))
+
+    message = str(excinfo.value)
+    assert message.startswith('3 queries, budget was 1:')
+    assert 'DUPLICATED 3x SELECT' in message
+    assert 'tests/test_query_budgets.py' in message
+
+
+@pytest.mark.django_db
+def test_missing_select_related_is_reported(api, query_budget, monkeypatch):
+    from apps.credits.api.viewsets import CreditViewSet
+
+    monkeypatch.setattr(CreditViewSet, 'queryset', Credit.objects.order_by('-created_at'))
+
+    with pytest.raises(AssertionError) as excinfo:
+        query_budget.constant(lambda: api.get('/v1/credits/'), _seed_credits)
+
+    message = str(excinfo.value)
+    assert 'Query count grows with the number of rows (1 rows: 4, 5 rows: 12)' in message
+    assert 'DUPLICATED' in message and 'rest_framework/fields.py' in message
@@ -0,0 +1,97 @@
+from datetime import date
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.db import OperationalError
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from config import db_router, mixins
+from config.db_router import PrimaryReplicaRouter, read_from_replica
+
+
+@pytest.fixture
+def replica_settings(settings):
+    # A second local database entry stands in for the replica; the router
+    # only needs the alias to exist in settings.
+    settings.DATABASES = {**settings.DATABASES, 'replica': dict(settings.DATABASES['default'])}
+    settings.DATABASE_REPLICA_ALIAS = 'replica'
+    db_router.reset_replica_health()
+    yield settings
+    db_router.reset_replica_health()
+
+
+def test_router_uses_primary_without_replica():
+    router = PrimaryReplicaRouter()
+
+    with read_from_replica():
+        assert router.db_for_read(Client) == 'default'
+    assert router.db_for_write(Client) == 'default'
+
+
+def test_router_uses_healthy_replica_only_when_enabled(replica_settings, monkeypatch):
+    router = PrimaryReplicaRouter()
+    monkeypatch.setattr(db_router, 'replica_is_healthy', lambda: True)
+
+    assert router.db_for_read(Client) == 'default'
+    with read_from_replica():
+        assert router.db_for_read(Client) == 'replica'
+        assert router.db_for_write(Client) == 'default'
+    assert not router.allow_migrate('replica', 'clients')
+    assert router.allow_migrate('default', 'clients')
+
+
+def test_router_falls_back_when_replica_unavailable_or_lagging(replica_settings, monkeypatch):
+    router = PrimaryReplicaRouter()
+
+    def unavailable(alias):
+        raise OperationalError('connection refused')
+
+    monkeypatch.setattr(db_router, '_replica_lag_seconds', unavailable)
+    with read_from_replica():
+        assert router.db_for_read(Client) == 'default'
+
+    db_router.reset_replica_health()
+    monkeypatch.setattr(db_router, '_replica_lag_seconds', lambda alias: 60.0)
+    with read_from_replica():
+        assert router.db_for_read(Client) == 'default'
+
+
+@pytest.mark.django_db
+def test_viewset_reads_use_replica_until_user_writes(monkeypatch):
+    user = User.objects.create_user(username='replica-user', password='password123')
+    api = APIClient()
+    api.force_authenticate(user=user)
+    bank = Bank.objects.create(name='Replica Bank', bank_type=Bank.BankType.PRIVATE)
+
+    calls = []
+    original = mixins.set_replica_reads
+
+    def record(enabled):
+        calls.append(enabled)
+        return original(enabled)
+
+    monkeypatch.setattr(mixins, 'set_replica_reads', record)
+
+    assert api.get('/v1/clients/').status_code == 200
+    assert calls == [True]
+
+    dob = date(1991, 2, 3)
+    response = api.post(
+        '/v1/clients/',
+        {
+            'full_name': 'Sticky Client',
+            'date_of_birth': dob.isoformat(),
+            'email': 'sticky@example.com',
+            'bank': bank.id,
+        },
+        format='json',
+    )
+    assert response.status_code == 201
+    assert calls == [True, False]
+
+    # Read-your-writes: the next read stays on the primary.
+    assert api.get('/v1/clients/').status_code == 200
+    assert calls == [True, False, False]
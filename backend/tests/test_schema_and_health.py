@@ -0,0 +1,70 @@
+import pytest
+
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework.test import APIClient
+
+from config.schema import clear_schema_cache
+
+
+@pytest.fixture
+def fresh_schema_cache():
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
+@pytest.mark.django_db
+def test_schema_is_generated_once_and_supports_etag(fresh_schema_cache, monkeypatch):
+    calls = []
+    original = SchemaGenerator.get_schema
+
+    def counting_get_schema(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(SchemaGenerator, 'get_schema', counting_get_schema)
+    api = APIClient()
+
+    first = api.get('/v1/schema/')
+    assert first.status_code == 200
+    assert first['ETag']
+    assert b'Tu Credito API' in first.content
+
+    second = api.get('/v1/schema/')
+    assert second.content == first.content
+    assert len(calls) == 1
+
+    not_modified = api.get('/v1/schema/', HTTP_IF_NONE_MATCH=first['ETag'])
+    assert not_modified.status_code == 304
+
+    as_json = api.get('/v1/schema/', HTTP_ACCEPT='application/vnd.oai.openapi+json')
+    assert as_json['Content-Type'].startswith('application/vnd.oai.openapi+json')
+    assert as_json['ETag'] != first['ETag']
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db
+def test_schema_served_from_pregenerated_file(fresh_schema_cache, settings, tmp_path):
+    schema_file = tmp_path / 'schema.yml'
+    schema_file.write_text('openapi: 3.0.3\ninfo:\n  title: From Disk\n  version: 1.0.0\npaths: {}\n')
+    settings.OPENAPI_SCHEMA_FILE = str(schema_file)
+
+    response = APIClient().get('/v1/schema/')
+
+    assert response.status_code == 200
+    assert b'From Disk' in response.content
+
+
+def test_healthz_needs_no_auth_or_database():
+    response = APIClient().get('/healthz')
+
+    assert response.status_code == 200
+    assert response.json() == {'status': 'ok'}
+
+
+@pytest.mark.django_db
+def test_readyz_checks_database():
+    response = APIClient().get('/readyz')
+
+    assert response.status_code == 200
+    assert response.json()['database'] == 'ok'
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from apps.credits.models import Credit
+
+
+@pytest.fixture
+def api(settings):
+    settings.SYNC_SETTLE_SECONDS = 0
+    user = User.objects.create_user(username='sync-user', password='password123')
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _make_client(bank, name='Sync Client'):
+    return Client.objects.create(
+        full_name=name,
+        date_of_birth=date(1985, 7, 1),
+        email='sync@example.com',
+        person_type=Client.PersonType.NATURAL,
+        bank=bank,
+    )
+
+
+@pytest.mark.django_db
+def test_changes_feed_pages_in_stable_order(api):
+    bank = Bank.objects.create(name='Sync Bank', bank_type=Bank.BankType.PRIVATE)
+    client = _make_client(bank)
+    credit = Credit.objects.create(
+        client=client,
+        description='Sync loan',
+        min_payment='10.00',
+        max_payment='20.00',
+        term_months=6,
+        bank=bank,
+        credit_type=Credit.CreditType.AUTO,
+    )
+
+    # Adding the credit also moved its client's and bank's counters, so both
+    # come after it in the feed.
+    first = api.get('/v1/changes/', {'limit': 2})
+    assert first.status_code == 200
+    assert [(c['type'], c['id']) for c in first.data['results']] == [('credit', credit.id), ('bank', bank.id)]
+    assert first.data['results'][0]['data']['client_full_name'] == 'Sync Client'
+    assert first.data['has_more'] is True
+
+    second = api.get('/v1/changes/', {'cursor': first.data['next_cursor'], 'limit': 2})
+    assert [(c['type'], c['op'], c['id']) for c in second.data['results']] == [('client', 'upsert', client.id)]
+    assert second.data['results'][0]['data']['credits_count'] == 1
+    assert second.data['has_more'] is False
+
+    # Nothing new: the cursor is handed back unchanged.
+    idle = api.get('/v1/changes/', {'cursor': second.data['next_cursor']})
+    assert idle.data['results'] == []
+    assert idle.data['next_cursor'] == second.data['next_cursor']
+
+
+@pytest.mark.django_db
+def test_changes_feed_reports_updates_and_tombstones(api):
+    bank = Bank.objects.create(name='Tombstone Bank', bank_type=Bank.BankType.GOVERNMENT)
+    client = _make_client(bank, name='Orphan Client')
+    cursor = api.get('/v1/changes/').data['next_cursor']
+
+    bank_id = bank.id
+    bank.delete()
+
+    response = api.get('/v1/changes/', {'cursor': cursor})
+    changes = [(c['type'], c['op'], c['id']) for c in response.data['results']]
+    # The SET_NULL on the client counts as a change too.
+    assert ('client', 'upsert', client.id) in changes
+    assert ('bank', 'delete', bank_id) in changes
+    client_change = next(c for c in response.data['results'] if c['type'] == 'client')
+    assert client_change['data']['bank'] is None
+
+
+@pytest.mark.django_db
+def test_changes_feed_filters_by_type_and_timestamp(api):
+    bank = Bank.objects.create(name='Filter Bank', bank_type=Bank.BankType.PRIVATE)
+    _make_client(bank)
+
+    response = api.get('/v1/changes/', {'types': 'client'})
+    assert [c['type'] for c in response.data['results']] == ['client']
+
+    future = (timezone.now() + timedelta(minutes=5)).isoformat()
+    assert api.get('/v1/changes/', {'updated_since': future}).data['results'] == []
+    assert api.get('/v1/clients/', {'updated_since': future}).data['count'] == 0
+
+    assert api.get('/v1/changes/', {'types': 'loan'}).status_code == 400
+    assert api.get('/v1/changes/', {'cursor': 'not-a-cursor'}).status_code == 400
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.banks.models import Bank
+from apps.sync.changes import publish_upserts
+from apps.sync.events import RESYNC_EVENT, EventBroker, broker
+
+
+@pytest.mark.django_db
+def test_model_changes_reach_subscribers_on_commit(django_capture_on_commit_callbacks):
+    loop = asyncio.new_event_loop()
+
+    async def subscribe():
+        return broker.subscribe()
+
+    queue = loop.run_until_complete(subscribe())
+    try:
+        with django_capture_on_commit_callbacks(execute=True):
+            bank = Bank.objects.create(name='Event Bank', bank_type=Bank.BankType.PRIVATE)
+        event = loop.run_until_complete(asyncio.wait_for(queue.get(), timeout=1))
+    finally:
+        broker.unsubscribe(queue)
+        loop.close()
+
+    assert event['type'] == 'bank'
+    assert event['op'] == 'upsert'
+    assert event['id'] == bank.id
+
+
+def test_slow_subscriber_gets_resync_instead_of_backlog(settings):
+    settings.EVENTS_QUEUE_SIZE = 2
+    local_broker = EventBroker()
+
+    async def scenario():
+        queue = local_broker.subscribe()
+        for i in range(5):
+            local_broker.dispatch({'type': 'credit', 'op': 'upsert', 'id': i})
+        await asyncio.sleep(0)
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    events = asyncio.run(scenario())
+    assert RESYNC_EVENT in events
+    assert len(events) <= 2
+
+
+@pytest.mark.django_db
+def test_event_stream_requires_auth_and_streams_changes():
+    user = User.objects.create_user(username='sse-user', password='password123')
+    token = str(RefreshToken.for_user(user).access_token)
+
+    @async_to_sync
+    async def scenario():
+        client = AsyncClient()
+        denied = await client.get('/v1/events/')
+        response = await client.get('/v1/events/', {'access_token': token, 'types': 'credit'})
+        chunks = response.streaming_content
+        first = await anext(chunks)
+        broker.dispatch({'type': 'bank', 'op': 'upsert', 'id': 1})
+        broker.dispatch({'type': 'credit', 'op': 'delete', 'id': 7})
+        second = await asyncio.wait_for(anext(chunks), timeout=1)
+        await chunks.aclose()
+        return denied, response, first, second
+
+    denied, response, first, second = scenario()
+    assert denied.status_code == 401
+    assert response['Content-Type'] == 'text/event-stream'
+    assert first.startswith(b'retry:')
+    assert second.startswith(b'event: change\n')
+    assert b'"id": 7' in second
+
+
+@pytest.mark.django_db
+def test_event_stream_refuses_wsgi():
+    user = User.objects.create_user(username='sse-wsgi', password='password123')
+    api = APIClient()
+    api.force_authenticate(user=user)
+
+    assert api.get('/v1/events/').status_code == 503
+
+
+@pytest.mark.django_db
+def test_bulk_publish_sends_one_statement_or_callback(django_capture_on_commit_callbacks):
+    now = timezone.now()
+    with CaptureQueriesContext(connection) as queries, django_capture_on_commit_callbacks() as callbacks:
+        publish_upserts(Bank, range(1, 501), now)
+
+    notifies = [query for query in queries.captured_queries if 'pg_notify' in query['sql']]
+    if connection.vendor == 'postgresql':
+        assert len(notifies) == 1
+    else:
+        assert not notifies and len(callbacks) == 1
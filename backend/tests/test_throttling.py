@@ -0,0 +1,151 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.cache.backends.locmem import LocMemCache
+from rest_framework.test import APIClient
+
+from apps.banks.models import Bank
+from apps.clients.models import Client
+from config import throttling
+
+
+@pytest.fixture
+def rates(settings):
+    throttling._local_fallback.clear()
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {'read': '5/min', 'expensive': '10/min', 'write': '2/min', 'bulk': '3/min'},
+    }
+
+
+@pytest.fixture
+def api():
+    user = User.objects.create_user(username='throttle-user', password='password123')
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+def test_expensive_calls_are_weighted_by_page_size(rates, api):
+    bank = Bank.objects.create(name='Throttle Bank', bank_type=Bank.BankType.PRIVATE)
+
+    first = api.get('/v1/banks/', {'page_size': 100})
+    assert first.status_code == 200
+    assert first['RateLimit-Limit'] == '10'
+    assert first['RateLimit-Remaining'] == '5'
+    assert 'scope=expensive' in first['RateLimit-Policy']
+
+    assert api.get('/v1/banks/', {'page_size': 100}).status_code == 200
+    throttled = api.get('/v1/banks/', {'page_size': 100})
+    assert throttled.status_code == 429
+    assert int(throttled['Retry-After']) > 0
+
+    # Cheap reads have their own bucket.
+    detail = api.get(f'/v1/banks/{bank.id}/')
+    assert detail.status_code == 200
+    assert detail['RateLimit-Remaining'] == '4'
+
+
+@pytest.mark.django_db
+def test_writes_have_a_separate_budget(rates, api):
+    for name in ('One', 'Two'):
+        assert api.post('/v1/banks/', {'name': name, 'bank_type': 'PRIVATE'}, format='json').status_code == 201
+
+    assert api.post('/v1/banks/', {'name': 'Three', 'bank_type': 'PRIVATE'}, format='json').status_code == 429
+    assert api.get('/v1/banks/').status_code == 200
+
+
+@pytest.mark.django_db
+def test_falls_back_to_local_buckets_when_shared_cache_fails(rates, api, monkeypatch):
+    class BrokenCache:
+        def get(self, *args, **kwargs):
+            raise ConnectionError('redis down')
+
+        set = get
+
+    monkeypatch.setattr(throttling, 'caches', {'default': BrokenCache()})
+
+    statuses = [api.get('/v1/banks/', {'page_size': 100}).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+
+
+class SlowCache(LocMemCache):
+    """Widens the read-modify-write window so lost updates would show up."""
+
+    def get(self, *args, **kwargs):
+        value = super().get(*args, **kwargs)
+        time.sleep(0.002)
+        return value
+
+
+def _concurrent_debits(key, threads=20, capacity=5):
+    barrier = threading.Barrier(threads)
+
+    def debit():
+        barrier.wait()
+        return throttling.debit(key, capacity, 60, 1, time.time())[0]
+
+    with ThreadPoolExecutor(threads) as pool:
+        return sum(future.result() for future in [pool.submit(debit) for _ in range(threads)])
+
+
+def test_concurrent_debits_on_a_shared_key_never_overspend(monkeypatch):
+    monkeypatch.setattr(throttling, 'caches', {'default': SlowCache('throttle-test', {})})
+
+    assert _concurrent_debits('throttle:expensive:user:1') == 5
+
+
+@pytest.mark.skipif(not os.getenv('REDIS_URL'), reason='needs a Redis server (REDIS_URL)')
+def test_concurrent_debits_on_redis_never_overspend(settings):
+    settings.CACHES = {'throttle': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': os.environ['REDIS_URL']}}
+    settings.THROTTLE_CACHE_ALIAS = 'throttle'
+    key = f'throttle:expensive:user:{uuid.uuid4().hex}'
+
+    assert _concurrent_debits(key) == 5
+
+
+@pytest.mark.django_db
+def test_sync_calls_are_weighted_by_limit(rates, api):
+    first = api.get('/v1/changes/', {'limit': 100})
+    assert first.status_code == 200
+    assert first['RateLimit-Remaining'] == '5'
+
+    # limit=5000 costs more than the whole bucket; it is capped at capacity.
+    assert api.get('/v1/changes/', {'limit': 5000}).status_code == 429
+
+
+@pytest.mark.django_db
+def test_batch_calls_are_charged_per_distinct_id(rates, api):
+    repeated = api.get('/v1/banks/batch/', {'ids': ','.join(['1'] * 100) + ',,'})
+    assert repeated.status_code == 200
+    assert repeated['RateLimit-Remaining'] == '9'
+
+    distinct = api.get('/v1/banks/batch/', {'ids': ','.join(str(pk) for pk in range(1, 42))})
+    assert distinct['RateLimit-Remaining'] == '6'
+
+
+@pytest.mark.django_db
+def test_bulk_calls_are_charged_per_selected_chunk(rates, api, settings):
+    settings.BULK_CHUNK_SIZE = 2
+    clients = [
+        Client.objects.create(full_name=f'Bulk {n}', date_of_birth='1990-01-01', email=f'b{n}@example.com')
+        for n in range(5)
+    ]
+
+    selected = api.patch('/v1/clients/bulk/?full_name=Bulk', {'changes': {'nationality': 'X'}}, format='json')
+    assert selected.status_code == 200
+    assert 'scope=bulk' in selected['RateLimit-Policy']
+    assert selected['RateLimit-Remaining'] == '0'
+
+    throttled = api.patch('/v1/clients/bulk/', {'ids': [clients[0].id], 'changes': {'nationality': 'Y'}}, format='json')
+    assert throttled.status_code == 429
+    # Ordinary writes keep their own bucket.
+    assert api.post('/v1/banks/', {'name': 'After Bulk', 'bank_type': 'PRIVATE'}, format='json').status_code == 201